@@ -1,3 +1,9 @@
 from .master_classes import EasyGUI, Section
 from . import styles
 from . import widgets
+from . import layout
+from . import triggers
+from . import tasks
+from . import aio
+from . import capture
+from . import data
@@ -0,0 +1,121 @@
+'''
+Python module connecting an asyncio event loop to the tkinter mainloop of easy_gui project.
+Both loops share the Tk thread: Tk waits for events as usual and the asyncio loop is only
+stepped when one of its sockets/pipes is ready (through a Tcl file handler on its selector)
+or when its next timer is due, so neither loop busy-polls the other.
+'''
+import asyncio
+import math
+import tkinter as tk
+import traceback
+from typing import Optional
+
+
+
+class AsyncioBridge():
+    '''
+    Runs an asyncio event loop inside the Tk mainloop of "root" (EasyGUI or tkinter.Tcl()).
+    Loops without a selector (ex: the Windows proactor loop) or Tk builds without
+    file handlers fall back to stepping the loop every "poll_ms" milliseconds.
+    '''
+    def __init__(self, root, loop: Optional[asyncio.AbstractEventLoop]=None, poll_ms: int=10) -> None:
+        self.root = root
+        self.loop = loop or asyncio.new_event_loop()
+        self.poll_ms = poll_ms
+        self.steps = 0  # number of times the asyncio loop has been stepped (for checking it isn't polled needlessly)
+        self._after_id = None
+        self._fd = None
+        self._started = False
+        self._stepping = False
+
+    def start(self) -> None:
+        '''Hook the asyncio loop into the Tk event loop.'''
+        if self._started:
+            return
+        self._started = True
+        asyncio.set_event_loop(self.loop)
+        selector = getattr(self.loop, '_selector', None)
+        if selector is not None and hasattr(self.root.tk, 'createfilehandler'):
+            try:
+                self._fd = selector.fileno()
+                self.root.tk.createfilehandler(self._fd, tk.READABLE, self._on_readable)
+            except Exception:  # ex: selector without a file descriptor or Tk without file handler support
+                self._fd = None
+        self._schedule(0)
+
+    @property
+    def polling(self) -> bool:
+        '''True if the loop is stepped on a timer rather than woken by its selector.'''
+        return self._fd is None
+
+    def create_task(self, coro) -> asyncio.Task:
+        '''Schedule a coroutine on the asyncio loop (call from the Tk thread).'''
+        task = self.loop.create_task(coro)
+        task.add_done_callback(self._report_error)
+        self._schedule(0)
+        return task
+
+    def _report_error(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            print(f'\n--- Error in coroutine task: {task!r} ---')
+            traceback.print_exception(type(task.exception()), task.exception(), task.exception().__traceback__)
+
+    def _on_readable(self, *args) -> None:
+        self._step()
+
+    def _step(self) -> None:
+        '''Run one iteration of the asyncio loop (ready callbacks plus any ready I/O) and schedule the next.'''
+        if self._stepping or self.loop.is_closed():
+            return  # ex: a coroutine called root.update() which processed this file handler again
+        self._stepping = True
+        try:
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+        finally:
+            self._stepping = False
+        self.steps += 1
+        self._schedule(self._next_delay())
+
+    def _next_delay(self) -> Optional[int]:
+        '''Milliseconds until the asyncio loop next needs stepping (None to wait for its selector).'''
+        ready = getattr(self.loop, '_ready', None)
+        scheduled = getattr(self.loop, '_scheduled', None)
+        if ready is None or scheduled is None:
+            return self.poll_ms  # can't see into this loop so step it periodically
+        if ready:
+            return 0
+        delay = None
+        if scheduled:  # heap of timers so the first is the next due
+            delay = max(0, math.ceil((scheduled[0].when() - self.loop.time()) * 1000))
+        if self._fd is None:
+            delay = self.poll_ms if delay is None else min(delay, self.poll_ms)
+        return delay
+
+    def _schedule(self, delay: Optional[int]) -> None:
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if delay is not None and self._started and not self.loop.is_closed():
+            self._after_id = self.root.after(delay, self._step)
+
+    def stop(self) -> None:
+        '''Cancel outstanding tasks, unhook from Tk and close the asyncio loop.'''
+        if not self._started or self.loop.is_closed():
+            return
+        self._schedule(None)
+        if self._fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self._fd)
+            except Exception:
+                pass
+        self._started = False
+        tasks = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks and not self.loop.is_running():
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        if not self.loop.is_running():
+            self.loop.close()
+
+    def __repr__(self) -> str:
+        return f'AsyncioBridge: {"polling" if self.polling else "selector"} mode, {self.steps} steps'
@@ -0,0 +1,167 @@
+'''
+Python module containing the stdout/stderr capture layer of easy_gui project.
+One StreamRouter replaces each of sys.stdout/sys.stderr (only while something is capturing)
+and fans written text out to sinks (ex: StdOutBox widgets), per-thread sinks and tee files.
+Nothing in here touches tkinter; sinks must have a thread-safe write method.
+'''
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterable
+
+
+
+class StreamRouter():
+    '''
+    File-like replacement for sys.stdout or sys.stderr.
+    Text written by a thread with its own sinks (see route_thread) only goes to those sinks,
+    otherwise it goes to every default sink.  Tee files receive everything.
+    Sink collections are replaced (never mutated) so write() doesn't need a lock.
+    '''
+    def __init__(self, name: str) -> None:
+        self.name = name  # 'stdout' or 'stderr'
+        self.original = None  # stream replaced while installed
+        self.sinks = ()
+        self.thread_sinks = {}  # {thread ident: tuple of sinks}
+        self.tees = ()
+        self._lock = threading.Lock()  # only taken when changing sinks
+
+    def write(self, s: str) -> int:
+        sinks = self.thread_sinks.get(threading.get_ident()) or self.sinks
+        for sink in sinks:
+            sink.write(s)
+        for tee in self.tees:
+            tee.write(s)
+        if not sinks and self.original is not None:
+            self.original.write(s)  # ex: stderr only captured for one thread
+        return len(s)
+
+    def flush(self) -> None:
+        for tee in self.tees:
+            tee.flush()
+        if self.original is not None:
+            self.original.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def __getattr__(self, attr):
+        '''Anything else (encoding, errors, fileno, etc.) comes from the replaced stream.'''
+        original = self.__dict__.get('original') or getattr(sys, '__' + self.__dict__.get('name', 'stdout') + '__')
+        return getattr(original, attr)
+
+    @property
+    def active(self) -> bool:
+        return bool(self.sinks or self.thread_sinks or self.tees)
+
+    def _update(self) -> None:
+        '''Install on sys while anything is capturing and restore the original stream otherwise.'''
+        current = getattr(sys, self.name)
+        if self.active and current is not self:
+            self.original = current
+            setattr(sys, self.name, self)
+        elif not self.active and current is self:
+            setattr(sys, self.name, self.original)
+            self.original = None
+
+    def add_sink(self, sink) -> None:
+        with self._lock:
+            if sink not in self.sinks:
+                self.sinks = self.sinks + (sink,)
+            self._update()
+
+    def route_thread(self, sink, ident: int) -> None:
+        with self._lock:
+            thread_sinks = dict(self.thread_sinks)
+            thread_sinks[ident] = thread_sinks.get(ident, ()) + (sink,)
+            self.thread_sinks = thread_sinks
+            self._update()
+
+    def unroute_thread(self, sink, ident: int) -> None:
+        with self._lock:
+            thread_sinks = dict(self.thread_sinks)
+            remaining = tuple(s for s in thread_sinks.get(ident, ()) if s is not sink)
+            if remaining:
+                thread_sinks[ident] = remaining
+            else:
+                thread_sinks.pop(ident, None)
+            self.thread_sinks = thread_sinks
+            self._update()
+
+    def add_tee(self, file) -> None:
+        with self._lock:
+            self.tees = self.tees + (file,)
+            self._update()
+
+    def remove(self, target) -> None:
+        '''Stop sending anything to "target" (a sink or tee file).'''
+        with self._lock:
+            self.sinks = tuple(s for s in self.sinks if s is not target)
+            self.tees = tuple(t for t in self.tees if t is not target)
+            self.thread_sinks = {ident: tuple(s for s in sinks if s is not target)
+                                 for ident, sinks in self.thread_sinks.items() if any(s is not target for s in sinks)}
+            self._update()
+
+    def __repr__(self) -> str:
+        return f'StreamRouter: sys.{self.name} -> {len(self.sinks)} sinks, {len(self.thread_sinks)} routed threads, {len(self.tees)} tees'
+
+
+routers = {'stdout': StreamRouter('stdout'), 'stderr': StreamRouter('stderr')}
+
+
+def _streams(streams) -> Iterable[StreamRouter]:
+    if isinstance(streams, str):
+        streams = ('stdout', 'stderr') if streams == 'both' else (streams,)
+    return [routers[name] for name in streams]
+
+
+def add_sink(sink, streams='stdout') -> None:
+    '''Send all output of "streams" ('stdout', 'stderr', 'both' or a tuple) to sink (alongside any other sinks).'''
+    for router in _streams(streams):
+        router.add_sink(sink)
+
+
+def tee(file, streams='stdout') -> None:
+    '''Also write all output of "streams" to an open file.'''
+    for router in _streams(streams):
+        router.add_tee(file)
+
+
+def remove(target) -> None:
+    '''Stop sending output to a sink or tee file (sys.stdout/sys.stderr are restored once nothing is capturing).'''
+    for router in routers.values():
+        router.remove(target)
+
+
+@contextmanager
+def redirect(sink, streams='both', thread=None):
+    '''
+    Send output printed by one thread (the current thread by default) only to sink within the block.
+    Lets concurrent jobs print into their own StdOutBox:
+
+    with capture.redirect(job_box):
+        run_job()
+    '''
+    ident = (thread or threading.current_thread()).ident
+    for router in _streams(streams):
+        router.route_thread(sink, ident)
+    try:
+        yield sink
+    finally:
+        for router in _streams(streams):
+            router.unroute_thread(sink, ident)
+
+
+
+class SinkHandler(logging.Handler):
+    '''logging.Handler writing formatted records to a sink (ex: a StdOutBox) for per-logger routing.'''
+    def __init__(self, sink, level=logging.NOTSET) -> None:
+        super().__init__(level)
+        self.sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.sink.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,410 @@
+'''
+Python module containing data-side helpers of easy_gui project (models behind virtualized widgets).
+Nothing in here touches tkinter.
+'''
+import mmap
+import operator
+import os
+from array import array
+from itertools import compress
+from typing import Callable, List
+
+
+
+class LineIndex():
+    '''
+    Sparse index of line start offsets in a (possibly growing) file which is memory-mapped for reading.
+    Only the offset of every "stride"th line is stored (8 bytes per stride lines), so finding any line
+    means one lookup plus scanning at most stride - 1 line endings: constant time no matter the file size.
+    The file's contents stay in the OS page cache rather than in Python objects.
+    Indexing is incremental (see index_more) so huge files can be indexed a chunk at a time.
+    '''
+    def __init__(self, path: str, stride: int=64, encoding: str='utf-8') -> None:
+        self.path = path
+        self.stride = stride
+        self.encoding = encoding
+        self._file = open(path, 'rb')
+        self._file_id = self._identity(os.fstat(self._file.fileno()))
+        self._map = None
+        self.size = 0  # bytes currently mapped
+        self._reset()
+        self.refresh()
+
+    def _reset(self) -> None:
+        self._checkpoints = array('Q', [0])  # byte offset of line number i * stride
+        self._complete_lines = 0  # number of newline-terminated lines found so far
+        self.indexed_to = 0  # byte offset up to which line endings have been found
+
+    @staticmethod
+    def _identity(stat) -> tuple:
+        return stat.st_dev, stat.st_ino
+
+    def refresh(self) -> bool:
+        '''
+        Re-map the file if its size changed (ex: a log being written to).
+        Returns True if it changed.  A file that shrank (truncated/rotated) is re-indexed from the start,
+        as is a new file at the same path (rotated by renaming the old one away).
+        '''
+        try:
+            file_id = self._identity(os.stat(self.path))
+        except OSError:  # renamed away and not re-created yet, so keep showing the old file
+            file_id = self._file_id
+        rotated = file_id != self._file_id
+        if rotated:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+            self._file = open(self.path, 'rb')
+            self._file_id = self._identity(os.fstat(self._file.fileno()))
+            self._reset()
+            self.size = 0
+        size = os.fstat(self._file.fileno()).st_size
+        if size == self.size:
+            return rotated
+        if size < self.size:
+            self._reset()
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None  # can't map an empty file
+        self.size = size
+        return True
+
+    @property
+    def complete(self) -> bool:
+        '''True once every line ending currently in the file has been indexed.'''
+        return self.indexed_to >= self.size
+
+    def index_more(self, max_bytes: int=4 * 1024 * 1024) -> bool:
+        '''
+        Index up to max_bytes more of the file.  Returns True if there is still more to index.
+        '''
+        end = min(self.size, self.indexed_to + max_bytes)
+        if self._map is None or self.indexed_to >= end:
+            return not self.complete
+        find, checkpoints, stride = self._map.find, self._checkpoints, self.stride
+        lines, position = self._complete_lines, self.indexed_to
+        while True:
+            newline = find(b'\n', position, end)
+            if newline < 0:
+                break
+            position = newline + 1
+            lines += 1
+            if lines % stride == 0:
+                checkpoints.append(position)
+        self._complete_lines = lines
+        self.indexed_to = end  # no line endings after "position" so nothing needs rescanning
+        return not self.complete
+
+    def line_count(self) -> int:
+        '''Number of lines indexed so far (a final line without a newline counts).'''
+        count = self._complete_lines
+        if self.complete and self.size and (self._map[self.size - 1:self.size] != b'\n'):
+            count += 1
+        return count
+
+    def line_offset(self, line: int) -> int:
+        '''Byte offset of the start of a (0-based) line number that has been indexed.'''
+        offset = self._checkpoints[line // self.stride]
+        find = self._map.find
+        for _ in range(line % self.stride):
+            offset = find(b'\n', offset) + 1
+        return offset
+
+    def get_lines(self, start: int, count: int) -> List[str]:
+        '''Decoded text of up to "count" lines starting at (0-based) line "start".'''
+        stop = min(start + count, self.line_count())
+        if start >= stop:
+            return []
+        offset = self.line_offset(start)
+        lines = []
+        find = self._map.find
+        for _ in range(stop - start):
+            newline = find(b'\n', offset)
+            end = self.size if newline < 0 else newline
+            lines.append(self._map[offset:end].decode(self.encoding, errors='replace').rstrip('\r'))
+            offset = end + 1
+        return lines
+
+    @property
+    def index_bytes(self) -> int:
+        '''Memory used by the line index itself.'''
+        return self._checkpoints.itemsize * len(self._checkpoints)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __repr__(self) -> str:
+        return f'LineIndex: "{self.path}" {self.line_count():,} lines indexed ({self.indexed_to:,}/{self.size:,} bytes)'
+
+
+
+class ColumnStore():
+    '''
+    Column-major 2-D store of cell values (one Python list per column) used as the source of truth behind a Table.
+    Reading everything out (to_list/to_numpy) is a memory copy rather than a round-trip to Tk per cell,
+    and cells written with mark_dirty=True are remembered (see dirty_cells) until clear_dirty().
+    Row and column numbers here are 0-based.
+    '''
+    def __init__(self, rows: int=0, columns: int=0, fill='') -> None:
+        self.rows = rows
+        self.columns = [[fill] * rows for _ in range(columns)]
+        self.dirty = set()  # {(row, column)} written since the last clear_dirty()
+        self.revision = 0  # incremented on every change (ex: to know when a SortFilterIndex is stale)
+
+    @property
+    def shape(self) -> tuple:
+        return self.rows, len(self.columns)
+
+    def load(self, columns: List[list]) -> None:
+        '''Replace all values with a list of equal length columns (which become the new clean baseline).'''
+        self.columns = [list(column) for column in columns]
+        self.rows = len(self.columns[0]) if self.columns else 0
+        self.dirty = set()
+        self.revision += 1
+
+    def resize(self, rows: int, columns: int, fill='') -> None:
+        for column in self.columns[:columns]:
+            if len(column) > rows:
+                del column[rows:]
+            else:
+                column.extend([fill] * (rows - len(column)))
+        del self.columns[columns:]
+        self.columns.extend([fill] * rows for _ in range(columns - len(self.columns)))
+        self.rows = rows
+        self.dirty = {(row, col) for row, col in self.dirty if row < rows and col < columns}
+        self.revision += 1
+
+    def get(self, row: int, column: int):
+        return self.columns[column][row]
+
+    def set(self, row: int, column: int, value, mark_dirty: bool=True) -> None:
+        self.columns[column][row] = value
+        self.revision += 1
+        if mark_dirty:
+            self.dirty.add((row, column))
+
+    def set_block(self, row: int, column: int, columns: List[list], mark_dirty: bool=True) -> None:
+        '''Write a block of columns with its top-left value at (row, column).'''
+        for j, values in enumerate(columns):
+            self.columns[column + j][row:row + len(values)] = values
+            if mark_dirty:
+                self.dirty.update((row + i, column + j) for i in range(len(values)))
+        self.revision += 1
+
+    def to_list(self) -> List[list]:
+        '''Copy of the values as a list of row lists.'''
+        if not self.columns:
+            return [[] for _ in range(self.rows)]
+        return [list(row) for row in zip(*self.columns)]
+
+    def to_numpy(self, dtype=None):
+        '''Copy of the values as a 2-D NumPy array (pass dtype=object to keep mixed values as they are).'''
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('ColumnStore.to_numpy requires NumPy (pip install numpy).')
+        if not self.columns:
+            return numpy.empty((self.rows, 0), dtype=dtype)
+        return numpy.array(self.columns, dtype=dtype).T.copy()  # copy so rows are contiguous like a normal 2-D array
+
+    def dirty_cells(self) -> List[tuple]:
+        '''Sorted (row, column) positions written since the last clear_dirty().'''
+        return sorted(self.dirty)
+
+    def clear_dirty(self) -> None:
+        self.dirty = set()
+
+    def __repr__(self) -> str:
+        return f'ColumnStore: {self.rows} rows x {len(self.columns)} columns, {len(self.dirty)} dirty cells'
+
+
+def to_columns(values) -> tuple:
+    '''
+    Convert a 2-D block of values into (list of column lists, column names or None).
+    Accepts nested row sequences (ragged rows are padded with ''), 2-D NumPy arrays
+    and pandas DataFrames (duck-typed, so neither library is imported here).
+    Columns are converted in bulk (ex: ndarray.tolist) rather than element by element.
+    '''
+    if hasattr(values, 'iloc') and hasattr(values, 'columns'):  # pandas DataFrame
+        return [values.iloc[:, j].tolist() for j in range(values.shape[1])], [str(name) for name in values.columns]
+    if hasattr(values, 'ndim') and hasattr(values, 'tolist'):  # NumPy array
+        if values.ndim != 2:
+            raise ValueError(f'Expected a 2-D array of values but got {values.ndim} dimension(s).')
+        return values.T.tolist(), None
+    rows = [row if isinstance(row, (list, tuple)) else list(row) for row in values]
+    width = max((len(row) for row in rows), default=0)
+    if all(len(row) == width for row in rows):
+        return [list(column) for column in zip(*rows)], None
+    return [[row[j] if j < len(row) else '' for row in rows] for j in range(width)], None
+
+
+def column_formatter(fmt) -> Callable:
+    '''
+    Function formatting one value for display given a column format which can be
+    None (str), a format spec (ex: ',.2f'), a str.format pattern (ex: '{:.1%} done') or a callable.
+    '''
+    if fmt is None:
+        return str
+    if callable(fmt):
+        return fmt
+    if '{' in fmt:
+        return fmt.format
+    return lambda value: format(value, fmt)
+
+
+def format_columns(columns: List[list], formats=None, column_names=None) -> List[List[str]]:
+    '''
+    Format each column of values into strings with one formatter per column (see column_formatter).
+    "formats" is a list (one per column) or dict keyed by column position (0-based) or column name.
+    Values which don't fit their column's format (ex: None in a '.2f' column) fall back to str.
+    '''
+    formatted = []
+    for j, column in enumerate(columns):
+        if isinstance(formats, dict):
+            name = column_names[j] if column_names is not None else None
+            fmt = formats.get(j, formats.get(name)) if name is not None else formats.get(j)
+        elif formats is not None and j < len(formats):
+            fmt = formats[j]
+        else:
+            fmt = None
+        formatter = column_formatter(fmt)
+        if formatter is str:
+            formatted.append([str(value) for value in column])
+            continue
+        try:
+            formatted.append(list(map(formatter, column)))
+        except (TypeError, ValueError):  # ex: a None/NaN mixed into a numeric column
+            formatted.append([_format_or_str(formatter, value) for value in column])
+    return formatted
+
+
+def _format_or_str(formatter: Callable, value) -> str:
+    try:
+        return formatter(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+_NUMBER_START = frozenset('0123456789+-.')
+
+
+def sort_key(value) -> tuple:
+    '''
+    Key for sorting mixed table values: numbers (and text of numbers, ex: '1,200.5') first in numeric order,
+    then other text case-insensitively, then empty cells ('', None or NaN) last.
+    '''
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value, '') if value == value else (2, 0, '')  # NaN != NaN
+    if value is None or value == '':
+        return (2, 0, '')
+    text = str(value)
+    if text[0] in _NUMBER_START:  # skip the (slow) failed float() for most text
+        try:
+            number = float(text.replace(',', ''))
+        except ValueError:
+            pass
+        else:
+            return (0, number, '') if number == number else (2, 0, '')
+    return (1, 0, text.casefold())
+
+
+def sort_keys(column: list) -> list:
+    '''
+    sort_key of every value in a column, with fast paths (no per-value key tuples) for columns
+    that are all numbers or all text of plain numbers (ex: Tree values, which come back as strings).
+    Only the general path (tuple keys) can contain empty cells.
+    '''
+    if all(type(value) in (int, float) for value in column):
+        if all(value == value for value in column):  # no NaN
+            return column
+    elif all(type(value) is str for value in column):
+        try:
+            numbers = list(map(float, column))
+        except ValueError:  # some text isn't a plain number (or is empty)
+            pass
+        else:
+            if all(number == number for number in numbers):  # 'nan' parses but has to sort as empty
+                return numbers
+        if '' not in column and not any(value[0] in _NUMBER_START for value in column):
+            return [value.casefold() for value in column]  # plain text
+    return list(map(sort_key, column))
+
+
+
+class SortFilterIndex():
+    '''
+    Display order (sorted and/or filtered) over the rows of column-major data (ex: ColumnStore.columns).
+    Sort keys (once per column), sorted row orders (once per column and direction) and the casefolded
+    text of each column used by text filters are cached.  So sorting by a column again, flipping back
+    to a direction already used or changing the filter only costs a pass over cached lists.
+    Make a new index when the data changes.
+    '''
+    def __init__(self, columns: List[list]) -> None:
+        self.columns = columns
+        self.rows = len(columns[0]) if columns else 0
+        self.sort_column = None  # None for the original row order
+        self.descending = False
+        self.mask = None  # None (no filter) or a bool per row
+        self._keys = {}  # {column: sort_keys of that column}
+        self._orders = {}  # {(column, descending): row positions in that order}
+        self._text = {}  # {column: casefolded text of each value}
+
+    def sorted_rows(self, column: int, descending: bool=False) -> List[int]:
+        '''
+        Row positions sorted by a column.  Both directions keep equal values in row order
+        and empty cells last (so descending isn't just the ascending order reversed).
+        '''
+        order = self._orders.get((column, descending))
+        if order is None:
+            keys = self._keys.get(column)
+            if keys is None:
+                keys = self._keys[column] = sort_keys(self.columns[column])
+            order = sorted(range(self.rows), key=keys.__getitem__, reverse=descending)  # stable either way
+            if descending and keys and type(keys[0]) is tuple:
+                empty = sum(1 for key in keys if key[0] == 2)  # sorted to the front by reverse=True
+                order = order[empty:] + order[:empty]
+            self._orders[(column, descending)] = order
+        return order
+
+    def column_text(self, column: int) -> List[str]:
+        text = self._text.get(column)
+        if text is None:
+            text = self._text[column] = [str(value).casefold() for value in self.columns[column]]
+        return text
+
+    def sort(self, column, descending: bool=False) -> List[int]:
+        '''Sort by a column (None for the original order) and return the new display order.'''
+        self.sort_column, self.descending = column, descending
+        return self.order()
+
+    def set_filter(self, predicate: Callable=None, text: str=None, columns=None) -> List[int]:
+        '''
+        Only show rows for which predicate(row tuple) is true and, if "text" is given, rows containing
+        it (case-insensitive) in any of "columns" (all columns by default).  With neither, the filter is cleared.
+        Returns the new display order.
+        '''
+        mask = None
+        if text:
+            needle = text.casefold()
+            for column in (range(len(self.columns)) if columns is None else columns):
+                matches = [needle in value for value in self.column_text(column)]
+                mask = matches if mask is None else list(map(operator.or_, mask, matches))
+        if predicate is not None:
+            matches = [bool(predicate(row)) for row in zip(*self.columns)]
+            mask = matches if mask is None else list(map(operator.and_, mask, matches))
+        self.mask = mask
+        return self.order()
+
+    def order(self) -> List[int]:
+        '''Row positions in display order (sorted, then filtered).'''
+        rows = range(self.rows) if self.sort_column is None else self.sorted_rows(self.sort_column, self.descending)
+        if self.mask is None:
+            return list(rows)
+        return list(compress(rows, map(self.mask.__getitem__, rows))) if self.sort_column is not None else list(compress(rows, self.mask))
+
+    def __repr__(self) -> str:
+        return f'SortFilterIndex: {self.rows} rows, sorted by {self.sort_column}, {len(self._orders)} cached column orders'
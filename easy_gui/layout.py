@@ -0,0 +1,322 @@
+'''
+Python module containing the pure-Python layout logic of easy_gui project.
+Nothing in here touches tkinter, so layouts can be computed (and tested) without a display.
+'''
+from functools import lru_cache
+from typing import List, Tuple
+
+
+
+class GridTemplate():
+    '''
+    Compiled form of a CSS grid-template-area style list of strings.
+    Compiled templates are cached and shared between Sections/PopUps using
+    the same layout, so all attributes should be treated as read-only.
+    '''
+    __slots__ = ('rows', 'row_count', 'columns', 'areas', 'limits')
+
+    def __init__(self, rows: Tuple[str, ...], columns: int, areas: dict, limits) -> None:
+        self.rows = rows
+        self.row_count = len(rows)
+        self.columns = columns
+        self.areas = areas  # {name: {'first_row': int, 'last_row': int, 'first_column': int, 'last_column': int}}
+        self.limits = limits  # {'min_row', 'max_row', 'min_col', 'max_col'} of named areas or None if no named areas
+
+    def __repr__(self) -> str:
+        return f'GridTemplate: {self.row_count} rows x {self.columns} columns with {len(self.areas)} areas'
+
+
+def compile_grid(grid_configuration: List[str]) -> GridTemplate:
+    '''
+    Compile a grid configuration (see GridMaster.configure_grid) into a GridTemplate.
+    Identical configurations return the same cached GridTemplate object.
+    Raises ValueError if the configuration is malformed.
+    '''
+    return _compile_grid(tuple(grid_configuration))
+
+
+@lru_cache(maxsize=512)
+def _compile_grid(rows: Tuple[str, ...]) -> GridTemplate:
+    '''Single pass over all cells building the area table (cached on the tuple of row strings).'''
+    if not rows:
+        raise ValueError('Grid configuration must contain at least one row.')
+    split_rows = [row.split() for row in rows]
+    columns = len(split_rows[0])
+    if columns == 0:
+        raise ValueError(f'First row of grid configuration is empty:\n{list(rows)}')
+
+    areas, cell_counts = {}, {}
+    for row_num, row in enumerate(split_rows):
+        if len(row) != columns:
+            raise ValueError(f'Differing number of grid columns specified ({len(row)} in row {row_num} vs {columns} in row 0):\n{list(rows)}')
+        for col_num, name in enumerate(row):
+            if '.' in name:  # unnamed cell
+                continue
+            area = areas.get(name)
+            if area is None:
+                areas[name] = {'first_row': row_num, 'last_row': row_num, 'first_column': col_num, 'last_column': col_num}
+                cell_counts[name] = 1
+            else:
+                area['last_row'] = row_num  # rows are visited in order so this only ever increases
+                if col_num < area['first_column']:
+                    area['first_column'] = col_num
+                if col_num > area['last_column']:
+                    area['last_column'] = col_num
+                cell_counts[name] += 1
+
+    limits = None
+    for name, area in areas.items():
+        if cell_counts[name] != (area['last_row'] - area['first_row'] + 1) * (area['last_column'] - area['first_column'] + 1):
+            raise ValueError(f'Grid area "{name}" must be a single rectangle of contiguous cells:\n{list(rows)}')
+        if limits is None:
+            limits = {'min_row': area['first_row'], 'max_row': area['last_row'], 'min_col': area['first_column'], 'max_col': area['last_column']}
+        else:
+            limits['min_row'] = min(limits['min_row'], area['first_row'])
+            limits['max_row'] = max(limits['max_row'], area['last_row'])
+            limits['min_col'] = min(limits['min_col'], area['first_column'])
+            limits['max_col'] = max(limits['max_col'], area['last_column'])
+
+    return GridTemplate(rows, columns, areas, limits)
+
+
+
+class GridTable():
+    '''
+    Pure-Python grid bookkeeping (named areas, row/column counts and limits) of a container.
+    Subclassed by master_classes.GridMaster (which adds the tkinter row/column weights)
+    and by SectionNode for planning layouts without a display.
+    '''
+    def __init__(self):
+        self.grid_areas = {}
+        self.grid_configuration = []
+        self.grid_rows = 0
+        self.grid_columns = 0
+        self._grid_limits = None
+        self._grid_area_counts = {}  # next suffix to try for each auto-generated grid area base name
+
+    def set_grid_template(self, grid_configuration: List[str]) -> GridTemplate:
+        '''Replace the area table with the (cached) compiled form of grid_configuration.'''
+        template = compile_grid(grid_configuration)
+        self.grid_configuration = list(template.rows)
+        self.grid_rows = template.row_count
+        self.grid_columns = template.columns
+        # copy (down to each area's bounds) as the compiled template is shared through the cache
+        self.grid_areas = {name: dict(bounds) for name, bounds in template.areas.items()}
+        self._grid_limits = None if template.limits is None else dict(template.limits)
+        return template
+
+    def append_grid_row(self, row_name: str) -> Tuple[int, bool]:
+        '''
+        Append a full-width row named "row_name" by extending the area table in place.
+        Returns the new row number and whether the column range of the grid limits changed.
+        '''
+        row = len(self.grid_configuration)
+        if row == 0:
+            self.grid_columns = 1
+        self.grid_configuration.append(' '.join([row_name] * self.grid_columns))
+        self.grid_rows = row + 1
+
+        area = self.grid_areas.get(row_name)
+        if area is None:
+            self.grid_areas[row_name] = {'first_row': row, 'last_row': row, 'first_column': 0, 'last_column': self.grid_columns - 1}
+        else:  # name already used, so stretch existing area down to the new row (copy as areas may be shared with a compiled template)
+            self.grid_areas[row_name] = {'first_row': area['first_row'], 'last_row': row, 'first_column': 0, 'last_column': self.grid_columns - 1}
+
+        old_limits = self._grid_limits
+        self._grid_limits = {'min_row': row if old_limits is None else old_limits['min_row'], 'max_row': row,
+                             'min_col': 0, 'max_col': self.grid_columns - 1}
+        new_columns = old_limits is None or old_limits['min_col'] != 0 or old_limits['max_col'] != self.grid_columns - 1
+        return row, new_columns
+
+    def unique_grid_area(self, base: str, reserve: bool=True) -> str:
+        '''
+        Return an unused grid area name of the form "base", "base1", "base2", etc.
+        A counter per base name keeps this O(1) no matter how many areas already exist.
+        With reserve=False the name is only looked up (the next call returns it again).
+        '''
+        count = self._grid_area_counts.get(base, 0)
+        name = base if count == 0 else base + str(count)
+        while name in self.grid_areas:  # skip any names taken by user-specified areas
+            count += 1
+            name = base + str(count)
+        if reserve:
+            self._grid_area_counts[base] = count + 1
+        return name
+
+    def new_row_bounds(self, row_name: str) -> Tuple[int, dict, bool]:
+        '''
+        Return what append_grid_row(row_name) would produce without changing anything:
+        (new row number, bounds of the row_name area, whether the column range of the grid limits would change).
+        '''
+        row = len(self.grid_configuration)
+        columns = self.grid_columns if row else 1
+        area = self.grid_areas.get(row_name)
+        first_row = row if area is None else area['first_row']
+        old_limits = self._grid_limits
+        new_columns = old_limits is None or old_limits['min_col'] != 0 or old_limits['max_col'] != columns - 1
+        return row, {'first_row': first_row, 'last_row': row, 'first_column': 0, 'last_column': columns - 1}, new_columns
+
+    def grid_limits(self) -> dict:
+        if self._grid_limits is None:
+            return {'min_row': 500, 'max_row': -500, 'min_col': 500, 'max_col': -500}  # no named areas
+        return dict(self._grid_limits)
+
+
+
+class Placement():
+    '''
+    Where (and how) one Section or Widget is positioned within its container.
+    "kind" is one of:
+        'grid' - grid into "bounds" (a grid area dict)
+        'pack' - pack into a tabbed Section (which can't mix grid and pack)
+        'tab'  - Section is a tab of a ttk.Notebook, which positions it
+    "new_row" is the row number if a row is to be appended to the container for this element
+    (recorded in the container's area table by commit_placement).
+    "forced" is True if planned with force_row=True (so a failed placement isn't retried the same way).
+    '''
+    __slots__ = ('element', 'container', 'kind', 'grid_area', 'bounds', 'new_row', 'new_columns', 'area_base', 'forced', 'committed')
+
+    def __init__(self, element, container, kind: str, grid_area=None, bounds=None, new_row=None, new_columns: bool=False,
+                       area_base=None, forced: bool=False) -> None:
+        self.element = element
+        self.container = container
+        self.kind = kind
+        self.grid_area = grid_area
+        self.bounds = bounds
+        self.new_row = new_row
+        self.new_columns = new_columns
+        self.area_base = area_base  # base name passed to unique_grid_area for an auto-named Widget area
+        self.forced = forced
+        self.committed = new_row is None  # nothing to record unless a row is appended
+
+    @property
+    def grid_kwargs(self) -> dict:
+        '''row/column/rowspan/columnspan kwargs for a tkinter .grid() call.'''
+        bounds = self.bounds
+        return {'row': bounds['first_row'], 'column': bounds['first_column'],
+                'rowspan': bounds['last_row'] - bounds['first_row'] + 1,
+                'columnspan': bounds['last_column'] - bounds['first_column'] + 1}
+
+    def __repr__(self) -> str:
+        return f'Placement: {self.element} -> {self.kind} {self.grid_area or ""}'.rstrip()
+
+
+def _is_section(element) -> bool:
+    return hasattr(element, 'sections')
+
+
+def plan_child(container, child, force_row: bool=False) -> Placement:
+    '''
+    Resolve the Placement of a single child Section/Widget of "container" (EasyGUI, PopUp or Section).
+    Grid areas are looked up in the container's area table and missing or unspecified areas
+    fall back to a new full-width row.  Nothing is changed here (no tkinter calls and no changes
+    to the container or child): commit_placement records a new row in the container's area table.
+    '''
+    is_section = _is_section(child)
+    if is_section and child.parent is not container:
+        return Placement(child, container, 'tab', forced=force_row)  # Section is in the ttk.Notebook of a tabbed container
+    if getattr(container, 'tabbed', False):
+        return Placement(child, container, 'pack', forced=force_row)  # tabbed containers pack their Notebook so can't also grid
+
+    if container.grid_areas and child.grid_area and not force_row:
+        bounds = container.grid_areas.get(child.grid_area)
+        if bounds is not None:
+            return Placement(child, container, 'grid', child.grid_area, bounds, forced=force_row)
+        if not is_section or child.grid_area != child.name:  # Sections programatically get grid_area = name
+            print(f'"{child.grid_area}" not found in parent\'s grid areas.\nResorting to a new row.')
+
+    area_base = None if is_section else getattr(child, 'type_name', child.__class__.__name__)
+    grid_area = child.name if is_section else container.unique_grid_area(area_base, reserve=False)
+    row, bounds, new_columns = container.new_row_bounds(grid_area)
+    return Placement(child, container, 'grid', grid_area, bounds, new_row=row, new_columns=new_columns,
+                     area_base=area_base, forced=force_row)
+
+
+def commit_placement(placement: Placement) -> None:
+    '''
+    Record a planned new row in the container's (pure-Python) area table and give the child its grid area.
+    Called when a Placement is applied (and by plan_layout, as later siblings' rows depend on earlier ones).
+    Committing the same Placement again does nothing.
+    '''
+    if placement.committed:
+        return
+    container = placement.container
+    if placement.area_base is not None:
+        container.unique_grid_area(placement.area_base)  # reserve the name
+    container.append_grid_row(placement.grid_area)
+    placement.bounds = container.grid_areas[placement.grid_area]
+    placement.element.grid_area = placement.grid_area
+    placement.committed = True
+
+
+def plan_layout(container, force_row: bool=False) -> List[Placement]:
+    '''
+    Walk the Section/Widget tree below "container" and return the Placement of every element
+    (in the same order as they are positioned: Widgets, then Sections followed by their children).
+    Each Placement is committed (see commit_placement) as it is planned so that new rows appended
+    for later siblings come after those of earlier ones; this updates the area tables but makes no tkinter calls.
+    '''
+    placements = []
+    for child in list(container.widgets.values()) + list(container.sections.values()):
+        placement = plan_child(container, child, force_row)
+        commit_placement(placement)
+        placements.append(placement)
+        if _is_section(child):
+            placements.extend(plan_layout(child, force_row))
+    return placements
+
+
+
+class SectionNode(GridTable):
+    '''
+    Headless stand-in for a Section (or the root window) used to plan and benchmark
+    layouts without a display.  Mirrors the add_section/add_widget/configure_grid API.
+    '''
+    def __init__(self, name: str='', grid_area=None, parent=None) -> None:
+        super().__init__()
+        self.name = name
+        self.grid_area = grid_area
+        self.parent = parent
+        self.tabbed = False
+        self.sections = {}
+        self.widgets = {}
+        self._widget_count = 0  # never decreases, so default names aren't reused after deletions (like SectionMaster)
+
+    def configure_grid(self, grid_configuration: List[str]) -> None:
+        self.set_grid_template(grid_configuration)
+
+    def add_section(self, name: str='', grid_area=None) -> 'SectionNode':
+        if name == '':
+            name = f'section{len(self.sections) + 1}'
+        if grid_area is None and name not in [s.grid_area for s in self.sections.values()]:
+            grid_area = name
+        section = SectionNode(name=name, grid_area=grid_area, parent=self)
+        self.sections[name] = section
+        return section
+
+    def add_widget(self, type_name: str='Label', grid_area=None) -> 'WidgetNode':
+        widget = WidgetNode(type_name=type_name, grid_area=grid_area, parent=self)
+        self._widget_count += 1
+        name = f'{self._widget_count}_{type_name.lower()}'
+        while name in self.widgets:
+            self._widget_count += 1
+            name = f'{self._widget_count}_{type_name.lower()}'
+        self.widgets[name] = widget
+        return widget
+
+    def delete_widget(self, widget_name: str) -> None:
+        self.widgets.pop(widget_name, None)
+
+    def __repr__(self) -> str:
+        return f'SectionNode: "{self.name}"'
+
+
+class WidgetNode():
+    '''Headless stand-in for a Widget.  "type_name" is the Widget class name (used for auto grid area names).'''
+    def __init__(self, type_name: str='Label', grid_area=None, parent=None) -> None:
+        self.type_name = type_name
+        self.grid_area = grid_area
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        return f'WidgetNode: {self.type_name}'
@@ -5,12 +5,22 @@ The classes in here are designed to be subclassed in user applications.
 import tkinter as tk
 from tkinter import ttk
 from tkinter import _tkinter
-from .styles import BaseStyle
+from .styles import BaseStyle, StyleRegistry
 from . import widgets
+from . import aio
+from . import layout
+from . import styles
+from . import tasks
+from . import triggers
+import asyncio
+import inspect
+import math
 import os
 import sys
-import threading
 import traceback
+import weakref
+from collections import deque
+from contextlib import contextmanager
 from typing import List, Dict
 
 
@@ -20,22 +30,30 @@ def recreate_if_needed(func):
     '''
     Decorator used to enable addition of Sections or Widgets after GUI has been created.
     (that is, can add elements outside of EasyGUI subclass' __init__ method)
+    Only the newly added element (and its direct parent) is positioned rather than re-creating the whole GUI.
+    Nested calls (ex: PopUp.add_widget adding a "_default" Section) are laid out once by the outermost call.
     '''
     def inner(*args, **kwargs):
         self = args[0]
-        value = func(*args, **kwargs)
-        if self.root.created:
-            self.root.create()  # need to re-create GUI so that the new elements show up!
+        root = self.root
+        root._layout_depth += 1
+        try:
+            value = func(*args, **kwargs)
+        finally:
+            root._layout_depth -= 1
+        if root.created and value is not None:
+            root.mark_dirty(value)
+        if root._layout_depth == 0:
+            root.layout_dirty()  # need to position new elements so that they show up!
         return value
     return inner
 
 
 
-class GridMaster():
-    def __init__(self):
-        self.grid_areas = {}
-        self.grid_configuration = []
-
+class GridMaster(layout.GridTable):
+    '''
+    Adds the tkinter side (row/column weights) to the pure-Python grid bookkeeping of layout.GridTable.
+    '''
     def configure_grid(self, grid_configuration: List[str]) -> Dict[str, int]:
         '''
         Specify full-window layout with CSS grid-template-area style list of strings.
@@ -43,31 +61,9 @@ class GridMaster():
         delimit each cell.
         - Individual cells or rectangular groups of contiguous cells may be indicated by name
         while unnamed cells are specified by one or more periods.
+        Raises ValueError if rows have differing numbers of cells or a named area is not a rectangle.
         '''
-        self.grid_configuration = grid_configuration
-        self.grid_rows = len(grid_configuration)
-        self.grid_columns = len(grid_configuration[0].split())
-        for row in grid_configuration:
-            if len(grid_configuration[0].split()) != self.grid_columns:
-                print('ERROR!  Differing number of grid columns specified below:')
-                print(grid_configuration)
-                return
-
-        names = set(cell for row in grid_configuration for cell in row.split() if '.' not in cell)
-        for name in names:
-            first_row, last_row, first_column, last_column = None, None, None, None
-            for i, row in enumerate(grid_configuration):
-                if name in row.split():
-                    if first_row is None:
-                        first_row = i  # will stay fixed at the first row containing name
-                    last_row = i  # will continue to increase for multiple rows
-                    if first_column is None:
-                        row_list = row.split()
-                        first_column = row_list.index(name)  # get far left column of name
-                        last_column = len(row_list) - row_list[::-1].index(name) - 1  # reverse to get far right column
-
-            self.grid_areas[name] = {'first_row': first_row, 'last_row': last_row,
-                                'first_column': first_column, 'last_column': last_column}
+        self.set_grid_template(grid_configuration)
 
         # Now make elements expand evenly with window resize by default
         if self.grid_areas != {}:
@@ -78,25 +74,22 @@ class GridMaster():
                 self.grid_columnconfigure(col, weight=1, minsize=10)
 
     def add_grid_row(self, row_name: str):
-        if self.grid_configuration == []:
-            self.grid_configuration = [row_name]
-        else:
-            num_columns = len(self.grid_configuration[0].split(' '))
-            self.grid_configuration.append(' '.join([row_name] * num_columns))
-        self.configure_grid(self.grid_configuration)
+        '''
+        Append a full-width row named "row_name" to the bottom of the grid.
+        The area table is extended in place rather than re-parsing the whole grid_configuration.
+        '''
+        row, new_columns = self.append_grid_row(row_name)
+        self.configure_grid_row(row, new_columns)
 
-    def grid_limits(self) -> dict:
-        min_row, max_row, min_col, max_col = 500, -500, 500, -500  # arbitrarily large starting points so no risk of surprising row/col not being captured
-        for area in self.grid_areas.values():
-            if area['first_row'] < min_row:
-                min_row = area['first_row']
-            if area['last_row'] > max_row:
-                max_row = area['last_row']
-            if area['first_column'] < min_col:
-                min_col = area['first_column']
-            if area['last_column'] > max_col:
-                max_col = area['last_column']
-        return {'min_row': min_row, 'max_row': max_row, 'min_col': min_col, 'max_col': max_col}
+    def configure_grid_row(self, row: int, new_columns: bool=False) -> None:
+        '''
+        Make a row appended by append_grid_row (and any newly covered columns)
+        expand evenly with window resize like configure_grid does.
+        '''
+        self.grid_rowconfigure(row, weight=1, minsize=10)
+        if new_columns:
+            for col in range(self.grid_columns):
+                self.grid_columnconfigure(col, weight=1, minsize=10)
 
 
 
@@ -104,6 +97,9 @@ class SectionMaster():
     def __init__(self):
         self.sections: dict = {}
         self.widgets: dict = {}
+        self._section_count = 0  # number of sections ever added (used for unique default names)
+        self._widget_count = 0  # number of widgets ever added (used for unique default names)
+        self._size_cache = None  # (style, width, height) of child Widgets; reset when children change
 
     @recreate_if_needed
     def add_section(self, name='', title=False, grid_area=None,
@@ -117,8 +113,12 @@ class SectionMaster():
             section = external_section(parent=self, name=name, title=title, grid_area=grid_area,
                                         borderwidth=borderwidth, relief=relief, tabbed=tabbed, equal_button_width=equal_button_width)
         else:
+            self._section_count += 1
             if name == '':
-                name = f'section{len(self.sections) + 1}'
+                name = f'section{self._section_count}'
+                while name in self.sections:
+                    self._section_count += 1
+                    name = f'section{self._section_count}'
             if name in self.sections:
                 raise ValueError('Unable to add section as a section with the given name already exists!')
 
@@ -142,14 +142,36 @@ class SectionMaster():
         Add a Widget object to this Section by calling the add_widget function in widgets.py
         (Easier to keep the function there as it needs access to all the individual Widget classes.)
         '''
+        self._size_cache = None
         return widgets.add_widget(self, type=type, text=text, widget_name=widget_name, grid_area=grid_area, **kwargs)
 
+    @contextmanager
+    def batch(self):
+        '''
+        Returns a context manager that defers positioning of added elements until the block exits,
+        at which point one layout pass positions everything that was added.  Example usage:
+
+        with self.batch():
+            for i in range(200):
+                section.add_widget('lbl', f'Label {i}')
+        '''
+        root = self.root
+        root._layout_depth += 1
+        try:
+            yield self
+        finally:
+            root._layout_depth -= 1
+            if root._layout_depth == 0:
+                root.layout_dirty()
+
     def delete_widget(self, widget_name) -> None:
         '''
         Fully delete a widget.
         Pass without issue if the widget doesn't exist.
         '''
         try:
+            self._size_cache = None
+            self.root.discard_dirty(self.widgets[widget_name])
             self.widgets[widget_name].destroy()
             del self.widgets[widget_name]
         except:
@@ -190,6 +212,7 @@ class SectionMaster():
         Pass without issue if the section doesn't exist.
         '''
         try:
+            self.root.discard_dirty(self.sections[section_name])
             for key, widget in self.sections[section_name].widgets.items():
                 widget._widget.destroy()
             self.sections[section_name].destroy()
@@ -200,20 +223,130 @@ class SectionMaster():
 
 
 
-class EasyGUI(tk.Tk, GridMaster, SectionMaster):
+class RootMaster():
+    '''
+    Layout bookkeeping shared by top-level windows (EasyGUI and PopUp).
+    Elements added after the window is created are flagged as "dirty" and
+    only those elements (and their direct parents) are positioned.
+    '''
+    def __init__(self):
+        self.created = False
+        self._dirty = {}  # dict used as an insertion-ordered set of Sections/Widgets needing positioning
+        self._layout_depth = 0  # > 0 while inside a recreate_if_needed call (positioning is deferred)
+        self.style_registry = StyleRegistry()  # records which widget options use which style attributes
+        self._child_roots = weakref.WeakSet()  # PopUps which follow this window's apply_style
+
+    def mark_dirty(self, element) -> None:
+        '''Flag a Section or Widget so that it is positioned on the next layout_dirty call.'''
+        self._dirty[element] = None
+
+    def discard_dirty(self, element) -> None:
+        '''Forget a deleted Section or Widget (and any dirty elements within it) so it is not positioned.'''
+        self._dirty.pop(element, None)
+        if not isinstance(element, Section) or not self._dirty:
+            return  # only Sections can contain other dirty elements
+        for dirty_element in list(self._dirty):
+            ancestor = dirty_element
+            while ancestor is not None and ancestor is not element:
+                ancestor = getattr(ancestor, 'parent', None)
+            if ancestor is element:
+                del self._dirty[dirty_element]
+
+    def apply_style(self, new_style) -> List[str]:
+        '''
+        Switch this window to a new style (ex: styles.DarkStyle()) without rebuilding it.
+        Only widget options consuming style attributes that changed are updated, all in one
+        pass before Tk gets a chance to repaint.  Returns the names of the changed attributes.
+        Open PopUps created with this window's popup() method are switched too.
+        '''
+        new_style.create_font(root=self)
+        old_style, self.style = self.style, new_style
+        changed = self.style_registry.apply(old_style, new_style)
+        for child_root in list(self._child_roots):
+            try:
+                if child_root.winfo_exists():
+                    child_root.apply_style(new_style)
+            except _tkinter.TclError:  # already destroyed
+                pass
+        return changed
+
+    def make_callback(self, func, separate_thread: bool=False, thread_policy: str='queue',
+                            separate_process: bool=False, on_result=None,
+                            debounce_ms=None, throttle_ms=None, latest_only: bool=False):
+        '''
+        Return the function actually bound for a command_func:
+        coroutine functions are run as tasks on this window's asyncio loop (see run_coroutine),
+        separate_process functions are submitted to the process pool (with their result passed to on_result),
+        separate_thread functions are submitted to the worker pool and others are bound as is.
+        With debounce_ms, throttle_ms or latest_only, the result is wrapped in a tasks.RateLimiter.
+        '''
+        if inspect.iscoroutinefunction(func):
+            callback = lambda *args: self.run_coroutine(func(*args))
+        elif separate_process:
+            callback = self.processes.wrap(func, on_result)
+        elif separate_thread:
+            callback = self.workers.wrap(func, thread_policy)
+        else:
+            callback = func
+        if debounce_ms or throttle_ms or latest_only:
+            return tasks.RateLimiter(callback, self, debounce_ms=debounce_ms, throttle_ms=throttle_ms, latest_only=latest_only)
+        return callback
+
+    def layout_dirty(self) -> None:
+        '''
+        Position all elements flagged by mark_dirty along with their direct parent Sections.
+        Elements whose ancestor Section is also dirty are skipped as creating that Section covers them.
+        '''
+        dirty, self._dirty = self._dirty, {}
+        if not self.created or not dirty:
+            return  # .create() positions everything once the window is first built
+
+        elements, parents = [], {}
+        for element in dirty:
+            ancestor = getattr(element, 'parent', None)
+            while ancestor is not None and ancestor not in dirty:
+                ancestor = getattr(ancestor, 'parent', None)
+            if ancestor is None:  # no dirty ancestor
+                elements.append(element)
+                if isinstance(element.parent, Section):
+                    parents[element.parent] = None
+
+        for parent in parents:
+            parent.position()
+        for element in elements:
+            if isinstance(element, Section):
+                element.create()
+            else:
+                element.position()
+
+
+
+class EasyGUI(tk.Tk, GridMaster, SectionMaster, RootMaster):
     '''
     Main class to be subclassed for full GUI window.
     '''
     style = BaseStyle()
 
-    def __init__(self, alpha: float=1.0, topmost: bool=False, disable_interaction: bool=False, toolwindow: bool=False, fullscreen: bool=False, overrideredirect: bool=False, **kwargs) -> None:
+    def __init__(self, alpha: float=1.0, topmost: bool=False, disable_interaction: bool=False, toolwindow: bool=False, fullscreen: bool=False, overrideredirect: bool=False,
+                       worker_threads: int=4, worker_queue: int=64, worker_processes=None, use_asyncio: bool=False, **kwargs) -> None:
         super().__init__()
         GridMaster.__init__(self)
         SectionMaster.__init__(self)
-        EasyGUI.style.create_font()  # have to generate font.Font object after initial tk root window is created
-
-        self.key_log = []  # record keys/buttons triggered
-        self.key_triggers = [('closegui', lambda: self.close())]
+        RootMaster.__init__(self)
+        EasyGUI.style.create_font(root=self)  # have to generate font.Font object after initial tk root window is created
+
+        self.key_log = deque(maxlen=100)  # history of the last keys typed (matching is done by key_triggers)
+        self.key_triggers = triggers.KeyTriggerMatcher()
+        self.key_triggers.add('closegui', lambda: self.close())
+        self.bind_all('<Key>', self.log_keys)  # one automaton step per key, so cheap even with no user triggers
+        self.workers = tasks.WorkerPool(max_workers=worker_threads, max_queue=worker_queue)  # runs separate_thread callbacks
+        self.ui_queue = tasks.UIQueue()  # calls posted from other threads to run on the Tk thread
+        self.processes = tasks.ProcessRunner(self.post, max_workers=worker_processes)  # runs separate_process callbacks
+        # runs ui_queue on this (Tk) thread about once per frame, for at most 8 ms per drain so events still get handled
+        self.ui_drainer = tasks.UIDrainer(self, self.ui_queue, interval=16, budget=0.008)
+        self._aio = None  # aio.AsyncioBridge created on first use (or now if use_asyncio=True)
+        if use_asyncio:
+            self.aio.start()
 
         self.icon(bitmap=os.path.join(os.path.dirname(__file__), 'resources', 'transparent.ico'), default=True)
         self.title('EasyGUI')
@@ -224,6 +357,7 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
 
         self.transparent = False
         self.configure(background=self.style.window_color)
+        self.style_registry.register(self, background='window_color')
 
         if self.style.transparent:
             self.wm_attributes('-transparentcolor', 'white')  # turn off window shadow
@@ -243,8 +377,9 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
         s.configure('.', background=self.style.widget_bg_color)
         s.configure('.', font=self.style.font)
         s.configure('.', foreground=self.style.text_color)
-
-        self.created = False
+        self.style_registry.register_callback(lambda color: s.configure('.', background=color), 'widget_bg_color')
+        self.style_registry.register_callback(lambda font: s.configure('.', font=font), 'font')
+        self.style_registry.register_callback(lambda color: s.configure('.', foreground=color), 'text_color')
 
     def __init_subclass__(cls, **kwargs):
         '''
@@ -286,7 +421,6 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
             elif hasattr(self, 'width') or hasattr(self, 'height'):
                 self.geometry(f'{window_width}x{window_height}')
 
-            self.bind_all('<Key>', self.log_keys)
             self.mainloop()  # runs tkinter mainloop
         cls.__init__ = new_init  # overwrite subclass __init__ method
 
@@ -295,39 +429,72 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
         '''Used by downstream elements to reference EasyGUI as root'''
         return self
 
+    def post(self, func, *args, coalesce: bool=False, key=None) -> None:
+        '''
+        Run func(*args) on the Tk thread.  Use this from separate_thread callbacks
+        to update widgets (tkinter is not thread-safe).  Example usage:
+
+        self.root.post(self.status_label.set, f'{percent}% done', coalesce=True)
+
+        With coalesce=True, repeated posts of the same func (or "key") that arrive before the next
+        drain replace each other so only the latest value is applied.
+        '''
+        self.ui_queue.post(func, *args, coalesce=coalesce, key=key)
+
+    @property
+    def aio(self) -> aio.AsyncioBridge:
+        '''
+        asyncio event loop sharing the Tk thread with this window (created and started on first use).
+        Coroutines run here can update widgets directly as they are on the Tk thread.
+        '''
+        if self._aio is None:
+            self._aio = aio.AsyncioBridge(self)
+            self._aio.start()
+        return self._aio
+
+    def run_coroutine(self, coro) -> asyncio.Task:
+        '''
+        Run a coroutine on this window's asyncio loop without blocking the GUI.  Example usage:
+
+        async def refresh(self, *args):
+            data = await fetch_data()  # GUI stays responsive while waiting
+            self.status.set(data)
+
+        self.root.run_coroutine(self.refresh())
+        (coroutine functions can also be passed directly as command_func)
+        '''
+        return self.aio.create_task(coro)
+
     def log_keys(self, event):
         '''
         Record key presses up to a maximum of 100 characters.
         Also check to see if any triggers are met and execute as needed.
         '''
         self.key_log.append(event.char)
-        self.key_log = self.key_log[-100:]
         self.check_key_triggers()
 
-    def check_key_triggers(self):
+    def check_key_triggers(self, chars: str=None):
         '''
-        Check if a key trigger has been met,
-        run function if so, and clear out key log.
+        Advance the key trigger matcher by the typed character(s) (by default the last key in key_log),
+        run function if a trigger has been met, and clear out key log.
         (so next key doesn't trigger same result)
         '''
-        key_str = ''.join(self.key_log)
-        for trigger, action in self.key_triggers:
-            if trigger in key_str:
-                self.key_log = []
-                action()
-                break
+        if chars is None:
+            chars = self.key_log[-1] if self.key_log else ''
+        action = self.key_triggers.feed(chars)
+        if action is not None:
+            self.key_log.clear()
+            action()
 
-    def add_key_trigger(self, trigger, func, separate_thread: bool=False):
+    def add_key_trigger(self, trigger, func, separate_thread: bool=False, **options):
         '''
         Bind a function to a sequence of key presses.
         Can specify as separate_thread=True for long-running functions.
+        Other options (thread_policy, separate_process, debounce_ms, etc.) are as for Widget.bind_event.
         '''
-        if separate_thread:
-            def threaded_func(*args):
-                threading.Thread(target=func).start()
-            self.key_triggers.append((trigger, threaded_func))
-        else:
-            self.key_triggers.append((trigger, func))
+        callback = self.make_callback(func, separate_thread, **options)
+        self.key_triggers.add(trigger, callback)
+        return callback if isinstance(callback, tasks.RateLimiter) else None
 
     def close(self):
         '''
@@ -337,6 +504,19 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
         '''
         self.destroy()
 
+    def destroy(self):
+        '''
+        Stop the worker threads, worker processes, UI queue and asyncio loop before destroying the window.
+        Runs for close(), the window manager's close button and any direct .destroy() call alike.
+        '''
+        self.ui_drainer.close()
+        self.workers.shutdown()
+        self.processes.shutdown()
+        if self._aio is not None:
+            self._aio.stop()
+        tk.Tk.destroy(self)
+        styles.release_fonts(self)  # shared fonts keep the Tcl interpreter alive otherwise
+
     def icon(self, bitmap, default: bool=False) -> None:
         '''
         Alternate method to call tk.Tk iconbitmap method using altered path handling
@@ -354,13 +534,11 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
     def create(self, force_row=False) -> None:
         '''
         Positions GUI elements in window.
-        May be called recursively by child Sections as elements are positioned.
+        Placements for the whole tree are planned up front (see layout.plan_layout)
+        so each Section and Widget is positioned exactly once.
         '''
-        for child in {**self.widgets, **self.sections}.values():
-            try:
-                child.create(force_row)  # if child is another Section object
-            except AttributeError:
-                child.position(force_row)  # if child is a Widget object
+        for placement in layout.plan_layout(self, force_row):
+            placement.element.apply_placement(placement)
         self.created = True
 
     def add_menu(self,
@@ -393,34 +571,43 @@ class EasyGUI(tk.Tk, GridMaster, SectionMaster):
             popup.add_widget('lbl', 'Test1')
             popup.add_widget('btn', 'Test Button', command_func=lambda *args: print('Test Button clicked'))
         '''
-        return PopUp(*args, **kwargs)
+        kwargs.setdefault('style', self.style)  # so popups match this window after any apply_style
+        popup = PopUp(*args, **kwargs)
+        self._child_roots.add(popup)  # and keep following it (see apply_style)
+        return popup
 
 
-class PopUp(tk.Toplevel, GridMaster, SectionMaster):
+class PopUp(tk.Toplevel, GridMaster, SectionMaster, RootMaster):
     '''
     Basically a mini EasyGUI class that inherits from tk.Toplevel instead of tk.Tk.
     Re-implements basic methods of EasyGUI class so widgets can be added.
     '''
-    def __init__(self, *args, width: int=300, height: int=180, x: int=120, y: int=80, **kwargs):
+    def __init__(self, *args, width: int=300, height: int=180, x: int=120, y: int=80, style=None, **kwargs):
         if kwargs.get('tooltip', False):
             super().__init__()
             GridMaster.__init__(self)
             SectionMaster.__init__(self)
-            self.wm_attributes('-disabled', True)  # disables window interaction for click pass through
+            RootMaster.__init__(self)
+            try:
+                self.wm_attributes('-disabled', True)  # disables window interaction for click pass through
+            except Exception:  # option only for Windows system
+                pass
             self.wm_overrideredirect(True)  # removes window
             self.wm_attributes('-alpha', 0.8)
             self.geometry(f'{width}x{height}+{x}+{y}')  # format of "WIDTHxHEIGHT+(-)XPOSITION+(-)YPOSITION"
-            self.style = EasyGUI.style
-            self.style.create_font()
+            self.style = style or EasyGUI.style
+            self.style.create_font(root=self)
             self.configure(bg=self.style.tooltip_color)
+            self.style_registry.register(self, bg='tooltip_color')
         else:
             super().__init__()
             GridMaster.__init__(self)
             SectionMaster.__init__(self)
+            RootMaster.__init__(self)
             self.icon(bitmap=os.path.join(os.path.dirname(__file__), 'resources', 'transparent.ico'), default=True)
             self.geometry(f'{width}x{height}+{x}+{y}')  # format of "WIDTHxHEIGHT+(-)XPOSITION+(-)YPOSITION"
-            self.style = EasyGUI.style
-            self.style.create_font()
+            self.style = style or EasyGUI.style
+            self.style.create_font(root=self)
 
     def __enter__(self):
         self.created = False
@@ -434,6 +621,24 @@ class PopUp(tk.Toplevel, GridMaster, SectionMaster):
         '''Used by downstream elements to reference EasyGUI as root'''
         return self
 
+    @property
+    def workers(self):
+        '''PopUps share the worker pool of the main window'''
+        return self.master.workers
+
+    @property
+    def processes(self):
+        '''PopUps share the process pool of the main window'''
+        return self.master.processes
+
+    def post(self, *args, **kwargs) -> None:
+        '''PopUps share the UI queue of the main window (see EasyGUI.post)'''
+        self.master.post(*args, **kwargs)
+
+    def run_coroutine(self, coro):
+        '''PopUps share the asyncio loop of the main window (see EasyGUI.run_coroutine)'''
+        return self.master.run_coroutine(coro)
+
     def icon(self, bitmap, default: bool=False) -> None:
         '''
         Alternate method to call tk.Tk iconbitmap method using altered path handling
@@ -450,8 +655,8 @@ class PopUp(tk.Toplevel, GridMaster, SectionMaster):
 
     def create(self, force_row=False) -> None:
         '''Copied from EasyGUI.create'''
-        for name, section in self.sections.items():
-            section.create(force_row=force_row)
+        for placement in layout.plan_layout(self, force_row):
+            placement.element.apply_placement(placement)
         self.created = True
 
     @recreate_if_needed
@@ -478,21 +683,22 @@ class Section(tk.Frame, GridMaster, SectionMaster):
         if relief != 'ridge' and not borderwidth:
             borderwidth = 1
         self.tabbed = tabbed
+        style = parent.root.style if parent is not None else EasyGUI.style
         super().__init__(master=parent,
-                         bg=EasyGUI.style.section_color,
-                         padx=EasyGUI.style.frame_padx,
-                         pady=EasyGUI.style.frame_pady,
+                         bg=style.section_color,
+                         padx=style.frame_padx,
+                         pady=style.frame_pady,
                          borderwidth=borderwidth,
                          relief=relief)
         GridMaster.__init__(self)
         SectionMaster.__init__(self)
         self.parent = parent
+        self.root.style_registry.register(self, bg='section_color', padx='frame_padx', pady='frame_pady')
         self.name = name
         self.grid_area = grid_area
         if tabbed:
             self.tabs = ttk.Notebook(self)
-            self.tabs.style = self.style
-            self.tabs.root = self.root
+            self.tabs.root = self.root  # tab Sections resolve their root (and style) through the Notebook
         self.equal_button_width = equal_button_width
         if title:  # title kwargs can be provided as True or a string
             if isinstance(title, str):  # if string, use title for label text
@@ -516,15 +722,33 @@ class Section(tk.Frame, GridMaster, SectionMaster):
                 old_init(self)
         cls.__init__ = new_init  # overwrite subclass __init__ method
 
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent) -> None:
+        '''
+        Resolve (and cache) the root window once when this Section is attached to a parent
+        rather than walking up the parent chain on every .root/.style access.
+        If re-parented under a different root, child Sections and Widgets are updated too.
+        '''
+        old_root = getattr(self, '_gui_root', None)
+        self._parent = parent
+        self._gui_root = parent.root if parent is not None else None
+        if old_root is not None and self._gui_root is not old_root:
+            for child in {**self.widgets, **self.sections}.values():
+                child.parent = child.parent  # re-resolves the child's cached root
+
     @property
     def style(self):
-        '''Goes upsteam to evenually reference EasyGUI.style'''
-        return self.parent.style
+        '''Style of the root window (EasyGUI.style unless changed), read through the cached root'''
+        return self._gui_root.style
 
     @property
     def root(self):
-        '''Goes upsteam to evenually reference EasyGUI as root'''
-        return self.parent.root
+        '''Cached reference to the EasyGUI (or PopUp) root window'''
+        return self._gui_root
 
     def create(self, force_row: bool=False):
         '''
@@ -532,61 +756,77 @@ class Section(tk.Frame, GridMaster, SectionMaster):
         positioning all children (Sections and/or Widgets).
         '''
         self.position(force_row)
-        if self.equal_button_width:
-            self.match_child_button_widths()
-        for child in {**self.widgets, **self.sections}.values():
-            try:
-                child.create(force_row)  # if child is another Section object
-            except AttributeError:
-                child.position(force_row)  # if child is a Widget object
+        for placement in layout.plan_layout(self, force_row):
+            placement.element.apply_placement(placement)
 
     def match_child_button_widths(self):
-        child_buttons = [child for child in self.widgets.values() if isinstance(child, widgets.Button)]
+        '''
+        Set all text Buttons in this Section to the width of the widest one.
+        Button "width" is in units of the font's "0" character, so the measured pixel width is converted.
+        '''
+        child_buttons = [child for child in self.widgets.values() if isinstance(child, widgets.Button) and not child.image]
         if len(child_buttons) > 1:
-            max_width = int(round(max(child.width / 7.0 for child in child_buttons if not child.image)))
+            font_obj = self.style.font or styles.default_font(self.root)
+            max_width = max(child.measure_text(child.text)[0] for child in child_buttons)
+            char_width = int(math.ceil(max_width / max(styles.text_width(font_obj, '0'), 1)))
             for child in child_buttons:
-                if not child.image:
-                    child.config(width=max_width)
+                child.config(width=char_width)
 
     def position(self, force_row: bool=False) -> None:
         '''
         Physically position this Section within its parent container.
         '''
+        if hasattr(self.parent, 'grid_areas'):
+            self.apply_placement(layout.plan_child(self.parent, self, force_row))
+        else:  # parent is the ttk.Notebook of a tabbed Section
+            self.apply_placement(layout.Placement(self, self.parent, 'tab'))
+
+    def apply_placement(self, placement: layout.Placement) -> None:
+        '''
+        Issue the geometry call(s) for a Placement planned by layout.plan_child/plan_layout.
+        If gridding fails, the parent is laid out again with every child in its own new row.
+        '''
+        layout.commit_placement(placement)
         try:
-            if hasattr(self.parent, 'grid_areas'):
-                if self.parent.grid_areas != {} and self.grid_area and not force_row:
-                    try:
-                        if not hasattr(self.parent, 'tabbed') or not self.parent.tabbed:
-                            bounds = self.parent.grid_areas[self.grid_area]
-                            self.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1, sticky='NSEW')
-                        else:
-                            self.pack()
-                        if self.tabbed:
-                            self.tabs.pack()
-                        return  # early return if everything works fine with initial attempt (no other actions needed)
-                    except KeyError:
-                        if self.grid_area != self.name:  # basically, if user-specified grid_area (are same if programatically set grid_area)
-                            print(f'"{self.grid_area}" not found in parent\'s grid areas.\nResorting to a new row.')
-                self.parent.add_grid_row(self.name)
-                self.grid_area = self.name
-                self.parent.create()
+            if placement.new_row is not None:
+                placement.container.configure_grid_row(placement.new_row, placement.new_columns)
+            if placement.kind == 'grid':
+                self.grid(**placement.grid_kwargs, sticky='NSEW')
+            elif placement.kind == 'pack':
+                self.pack()
+            if self.tabbed:
+                self.tabs.pack()
         except _tkinter.TclError:
             print(f'\n--- GRID FAILED for Section: "{self.name}" ---\nTry ensuring "grid_area" arg is given for all Sections in a given parent.\nAdding to a new row instead.')
-            self.parent.create(force_row=True)  # go back and fully recreate section forcing all children to be packed/in new rows
+            if not placement.forced and hasattr(self.parent, 'create'):
+                self.parent.create(force_row=True)  # go back and fully recreate parent forcing all children into new rows
+        if self.equal_button_width:
+            self.match_child_button_widths()
+
+    def _child_sizes(self) -> tuple:
+        '''
+        Return (max width, total height) of the child Widgets.
+        Cached until a Widget is added/deleted or the style is changed.
+        '''
+        style = self.style
+        if self._size_cache is None or self._size_cache[0] is not style:
+            sizes = [(widget.width, widget.height) for widget in self.widgets.values()]
+            self._size_cache = (style, float(max((w for w, _ in sizes), default=0)), float(sum(h for _, h in sizes)))
+        return self._size_cache[1:]
 
     @property
     def width(self) -> float:
         '''
         Estimate and return width desired by this Section.
         '''
-        return float(max(widget.width for widget in self.widgets.values()))
+        return self._child_sizes()[0]
 
     @property
     def height(self) -> float:
         '''
         Estimate and return height desired by this Section.
         '''
-        return float(sum(widget.height for widget in self.widgets.values()))
+        return self._child_sizes()[1]
 
     def __repr__(self) -> str:
         return f'Section: "{self.name}"'
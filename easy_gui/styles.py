@@ -1,7 +1,93 @@
 '''
 Python module that supplies styling used by easy_gui widgets.
 '''
+import tkinter as tk
 from tkinter import font
+from collections import OrderedDict
+import inspect
+import weakref
+
+
+_font_registry = {}  # {(id of Tcl interpreter, font spec): (Tcl interpreter, font.Font)} until release_fonts
+_measure_cache = OrderedDict()  # LRU cache of {(id(font.Font), text): (font.Font, pixel width)}
+_MEASURE_CACHE_SIZE = 4096
+_linespace_cache = OrderedDict()  # LRU cache of {id(font.Font): (font.Font, pixel height of a line)}
+_LINESPACE_CACHE_SIZE = 256
+
+
+def get_font(root=None, **spec) -> font.Font:
+    '''
+    Return a shared font.Font for the given spec (ex: size=10, weight='bold', underline=True).
+    Each distinct spec is only created once per Tcl interpreter (root window) and is then
+    reused by every window, popup and tooltip instead of creating new named Tcl fonts each time.
+    As the Font is shared, .configure() on it changes every style and widget using the same spec
+    (use .copy() for a font of your own to change).  Fonts are released with release_fonts(root).
+    '''
+    if root is None:
+        root = tk._default_root
+    key = (id(root.tk), tuple(sorted(spec.items())))
+    if key not in _font_registry:
+        _font_registry[key] = (root.tk, font.Font(root=root, **spec))  # keep interpreter referenced so its id can't be reused
+    return _font_registry[key][1]
+
+
+def default_font(root=None) -> font.Font:
+    '''Shared font.Font for the Tk default font (used when a style has no "_font" specified).'''
+    if root is None:
+        root = tk._default_root
+    key = (id(root.tk), 'TkDefaultFont')
+    if key not in _font_registry:
+        _font_registry[key] = (root.tk, font.Font(root=root, name='TkDefaultFont', exists=True))
+    return _font_registry[key][1]
+
+
+def text_width(font_obj: font.Font, text: str) -> int:
+    '''
+    Pixel width of a single line of text in font_obj using font.measure.
+    Results are kept in an LRU cache keyed by (font, text) as measuring requires a Tcl call.
+    '''
+    key = (id(font_obj), text)
+    entry = _measure_cache.get(key)
+    if entry is None:
+        entry = _measure_cache[key] = (font_obj, font_obj.measure(text))  # font kept referenced so its id can't be reused
+        if len(_measure_cache) > _MEASURE_CACHE_SIZE:
+            _measure_cache.popitem(last=False)
+    else:
+        _measure_cache.move_to_end(key)
+    return entry[1]
+
+
+def line_height(font_obj: font.Font) -> int:
+    '''Pixel height of one line of text in font_obj (cached font "linespace" metric).'''
+    key = id(font_obj)
+    entry = _linespace_cache.get(key)
+    if entry is None:
+        entry = _linespace_cache[key] = (font_obj, font_obj.metrics('linespace'))
+        if len(_linespace_cache) > _LINESPACE_CACHE_SIZE:
+            _linespace_cache.popitem(last=False)
+    else:
+        _linespace_cache.move_to_end(key)
+    return entry[1]
+
+
+def release_fonts(root) -> None:
+    '''
+    Forget the shared fonts (and their cached measurements) of root's Tcl interpreter
+    so it can be freed once the window is destroyed (called by EasyGUI.destroy).
+    '''
+    interp_id = id(root.tk)
+    fonts = set()
+    for key in [key for key in _font_registry if key[0] == interp_id]:
+        fonts.add(id(_font_registry.pop(key)[1]))
+    for key in [key for key in _measure_cache if key[0] in fonts]:
+        del _measure_cache[key]
+    for key in [key for key in _linespace_cache if key in fonts]:
+        del _linespace_cache[key]
+
+
+def font_count() -> int:
+    '''Number of font.Font objects created through get_font.'''
+    return len(_font_registry)
 
 
 class BaseStyle():
@@ -42,22 +128,21 @@ class BaseStyle():
         self.tooltip_color = '#FFFEDD'
 
 
-    def create_font(self):
+    def create_font(self, root=None):
         '''
         Create self.font attribute as a tkinter font.Font object.
         A font.Font object CAN ONLY BE CREATED AFTER CREATING A ROOT WINDOW...
         ...hence, this method is called in the EasyGUI class to transform the specified
         "_font" dict attribute into a font.Font "font" attribute.
+        Fonts come from the shared registry (see get_font) so repeated calls don't create new fonts,
+        which also means styles with the same "_font" share (and .configure() changes) the same Font objects.
         '''
         if hasattr(self, '_font'):
-            self.font = font.Font(**self._font)
-            bold = {k: v for k, v in self._font.items()}
-            bold['weight'] = 'bold'
-            self.font_bold = font.Font(**bold)
-            self.font_underline = font.Font(**self._font)
-            self.font_underline.configure(underline=True)
-            self.font_bold_underline = font.Font(**bold)
-            self.font_bold_underline.configure(underline=True)
+            bold = {**self._font, 'weight': 'bold'}
+            self.font = get_font(root, **self._font)
+            self.font_bold = get_font(root, **bold)
+            self.font_underline = get_font(root, **{**self._font, 'underline': True})
+            self.font_bold_underline = get_font(root, **{**bold, 'underline': True})
         else:
             self.font = None  # passing None to widget creation will use default Tkinter Fonts
 
@@ -87,3 +172,71 @@ class TransparentStyle(BaseStyle):
         self.transparent = True
         self.window_color = 'white'
         self.section_color = 'white'
+
+
+
+class StyleRegistry():
+    '''
+    Records which tkinter widget options consume which style attributes so that
+    a new style can be applied by only touching the widgets affected by a change.
+    Each root window (EasyGUI or PopUp) has one as its "style_registry" attribute.
+    Widgets (and the objects of bound-method callbacks) are only weakly referenced,
+    so deleted widgets drop out of the registry rather than being kept alive by it.
+    '''
+    def __init__(self) -> None:
+        self.consumers = {}  # {style attribute name: WeakKeyDictionary {tkinter widget: [option names]}}
+        self.callbacks = {}  # {style attribute name: [callable or weakref.WeakMethod, ...]}
+
+    def register(self, widget, **options) -> None:
+        '''
+        Record that widget options consume style attributes.
+        Ex: registry.register(label, bg='widget_bg_color', fg='text_color', font='font_bold')
+        '''
+        for option, key in options.items():
+            self.consumers.setdefault(key, weakref.WeakKeyDictionary()).setdefault(widget, []).append(option)
+
+    def register_callback(self, func, *keys) -> None:
+        '''
+        Record a function to be called with the new value when any of the given style attributes change.
+        Bound methods are held weakly (dropped once their object is gone); other callables are kept.
+        '''
+        ref = weakref.WeakMethod(func) if inspect.ismethod(func) else func
+        for key in keys:
+            self.callbacks.setdefault(key, []).append(ref)
+
+    def unregister(self, widget) -> None:
+        '''Forget every option registered for widget.'''
+        for widgets in self.consumers.values():
+            widgets.pop(widget, None)
+
+    def __len__(self) -> int:
+        '''Number of (widget, style attribute) registrations still alive.'''
+        return sum(len(widgets) for widgets in self.consumers.values())
+
+    def apply(self, old_style, new_style) -> list:
+        '''
+        Push the attributes that differ between old_style and new_style to their consumers
+        (destroyed widgets are dropped along the way).  Returns the changed attribute names.
+        '''
+        changed = [key for key, value in vars(new_style).items() if key not in vars(old_style) or vars(old_style)[key] != value]
+        for key in changed:
+            value = getattr(new_style, key)
+            widgets = self.consumers.get(key, {})
+            for widget, options in list(widgets.items()):
+                try:
+                    widget.configure({option: value for option in options})
+                except tk.TclError:  # widget has been destroyed
+                    del widgets[widget]
+            live_callbacks = []
+            for ref in self.callbacks.get(key, []):
+                func = ref() if isinstance(ref, weakref.WeakMethod) else ref
+                if func is None:
+                    continue
+                try:
+                    func(value)
+                    live_callbacks.append(ref)
+                except tk.TclError:  # callback's widget has been destroyed
+                    pass
+            if key in self.callbacks:
+                self.callbacks[key] = live_callbacks
+        return changed
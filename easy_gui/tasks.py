@@ -0,0 +1,551 @@
+'''
+Python module containing the background worker pool of easy_gui project.
+Callbacks bound with "separate_thread=True" run here instead of each starting a new thread.
+Also contains the UIQueue used to hand widget updates from those threads back to the Tk thread
+and the ProcessRunner for CPU-bound callbacks ("separate_process=True").
+Nothing in here imports tkinter (RateLimiter just uses the after() methods of the window it is given).
+'''
+import math
+import os
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+
+POLICIES = ('queue', 'drop', 'coalesce')
+READABLE = 2  # tkinter.READABLE file handler mask (this module doesn't import tkinter)
+
+
+
+class _Task():
+    __slots__ = ('func', 'args', 'key', 'submitted')
+
+    def __init__(self, func: Callable, args: tuple, key) -> None:
+        self.func = func
+        self.args = args
+        self.key = key
+        self.submitted = time.perf_counter()
+
+
+
+class WorkerPool():
+    '''
+    Fixed number of worker threads (started as needed) fed from a bounded queue.
+    Each submit names a policy for when work with the same key (normally one binding) is already waiting:
+        'queue'    - add to the end of the queue (dropped only if the queue is full)
+        'drop'     - ignore the new call while one for the same key is queued or running
+        'coalesce' - replace the queued call for the same key with the new one (latest arguments win)
+    Exceptions raised by tasks are printed and kept in "errors" rather than killing the worker.
+    '''
+    def __init__(self, max_workers: int=4, max_queue: int=64) -> None:
+        if max_workers < 1:
+            raise ValueError('WorkerPool needs at least one worker thread.')
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.errors = deque(maxlen=50)  # (func, exception, formatted traceback) of recent failed tasks
+        self.on_error: Optional[Callable] = None  # optionally called as on_error(func, exception) from the worker thread
+
+        self._queue = deque()
+        self._queued = {}  # {key: _Task} of tasks waiting in the queue
+        self._running = {}  # {key: number of tasks currently running}
+        self._condition = threading.Condition()
+        self._threads = []
+        self._idle = 0
+        self._shutdown = False
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_queue_depth = 0
+        self._total_latency = 0.0  # seconds tasks spent waiting in the queue
+        self._max_latency = 0.0
+        self._total_run_time = 0.0
+
+    def submit(self, func: Callable, *args, policy: str='queue', key=None) -> bool:
+        '''
+        Run func(*args) on a worker thread.  "key" identifies the binding for the
+        "drop" and "coalesce" policies (defaults to func itself).
+        Returns False if the call was dropped.
+        '''
+        if policy not in POLICIES:
+            raise ValueError(f'Unknown worker policy "{policy}".  Use one of: {", ".join(POLICIES)}')
+        if key is None:
+            key = func
+        with self._condition:
+            if self._shutdown:
+                return False
+            self.submitted += 1
+            queued = self._queued.get(key)
+            if policy == 'drop' and (queued is not None or self._running.get(key)):
+                self.dropped += 1
+                return False
+            if policy == 'coalesce' and queued is not None:
+                queued.func, queued.args = func, args  # keeps its place (and wait time) in the queue
+                self.coalesced += 1
+                return True
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+
+            task = _Task(func, args, key)
+            self._queue.append(task)
+            if queued is None:
+                self._queued[key] = task
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            if self._idle == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work, name=f'easy_gui-worker-{len(self._threads) + 1}', daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+        return True
+
+    def wrap(self, func: Callable, policy: str='queue') -> Callable:
+        '''
+        Return a callback (ex: for a tkinter binding) that submits func to this pool.
+        Like the threads started previously, func is called without the event argument.
+        '''
+        def submit_to_pool(*args):
+            self.submit(func, policy=policy, key=submit_to_pool)
+        return submit_to_pool
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                self._idle += 1
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                self._idle -= 1
+                if self._shutdown:
+                    return
+                task = self._queue.popleft()
+                if self._queued.get(task.key) is task:
+                    del self._queued[task.key]
+                self._running[task.key] = self._running.get(task.key, 0) + 1
+                started = time.perf_counter()
+                latency = started - task.submitted
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+
+            error = None
+            try:
+                task.func(*task.args)
+            except Exception as e:
+                error = e
+                self.errors.append((task.func, e, traceback.format_exc()))
+                print(f'\n--- Error in background task "{getattr(task.func, "__name__", task.func)}" ---')
+                traceback.print_exc()
+
+            with self._condition:
+                self._total_run_time += time.perf_counter() - started
+                self._running[task.key] -= 1
+                if not self._running[task.key]:
+                    del self._running[task.key]
+                if error is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            if error is not None and self.on_error is not None:
+                self.on_error(task.func, error)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        '''Counters and timings (in seconds) for tuning worker count and binding policies.'''
+        with self._condition:
+            finished = self.completed + self.failed
+            started = finished + sum(self._running.values())
+            return {'workers': len(self._threads), 'queue_depth': len(self._queue), 'max_queue_depth': self.max_queue_depth,
+                    'running': sum(self._running.values()), 'submitted': self.submitted, 'completed': self.completed,
+                    'failed': self.failed, 'dropped': self.dropped, 'coalesced': self.coalesced,
+                    'avg_latency': self._total_latency / started if started else 0.0, 'max_latency': self._max_latency,
+                    'avg_run_time': self._total_run_time / finished if finished else 0.0}
+
+    def join(self, timeout: Optional[float]=None) -> bool:
+        '''Wait until the queue is empty and no task is running.  Returns False on timeout.'''
+        end = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while self._queue or self._running:
+                remaining = None if end is None else end - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(0.01 if remaining is None else min(0.01, remaining))
+        return True
+
+    def shutdown(self) -> None:
+        '''Stop accepting tasks, discard queued ones and let idle workers exit (running tasks finish on their own).'''
+        with self._condition:
+            self._shutdown = True
+            self._queue.clear()
+            self._queued.clear()
+            self._condition.notify_all()
+
+    def __repr__(self) -> str:
+        return f'WorkerPool: {len(self._threads)}/{self.max_workers} workers, {len(self._queue)} queued'
+
+
+
+class UIQueue():
+    '''
+    Thread-safe queue of calls to be run on the Tk thread (tkinter widgets must only be used from that thread).
+    Any thread can post; the Tk thread runs them in batches via drain().
+    Coalesced posts with the same key (by default the function, ex: one Label's .set) only keep the latest
+    arguments while waiting, so a fast worker can't build up a backlog of stale updates.
+    "wakeup" (if given) is called by post, on the posting thread, when there is new work and no drain
+    is already armed (see UIDrainer, which makes sure only the Tk thread schedules the drains).
+    '''
+    def __init__(self, wakeup: Optional[Callable]=None) -> None:
+        self._queue = deque()  # (func, args) or (None, key) for coalesced posts
+        self._latest = {}  # {key: (func, args)} of coalesced posts waiting in the queue
+        self._lock = threading.Lock()
+        self.wakeup = wakeup
+        self.armed = False  # True from the post that called wakeup until a drain empties the queue
+        self.run = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.max_drain_time = 0.0
+
+    def post(self, func: Callable, *args, coalesce: bool=False, key=None) -> None:
+        '''Queue func(*args) to be called on the Tk thread.  Safe to call from any thread.'''
+        if key is None:
+            key = func
+        with self._lock:
+            if not coalesce:
+                self._queue.append((func, args))
+            else:
+                if key in self._latest:
+                    self.coalesced += 1
+                else:
+                    self._queue.append((None, key))
+                self._latest[key] = (func, args)
+            wake = not self.armed
+            self.armed = True
+        if wake and self.wakeup is not None:
+            self.wakeup()
+
+    def drain(self, budget: float=0.008) -> int:
+        '''
+        Run queued calls (on the Tk thread) until the queue is empty or "budget" seconds have passed.
+        Returns the number of calls run; anything left over waits for the next drain.
+        '''
+        queue = self._queue
+        start = time.perf_counter()
+        end = start + budget
+        count = 0
+        while queue:
+            func, args = queue.popleft()
+            if func is None:
+                with self._lock:
+                    func, args = self._latest.pop(args)
+            try:
+                func(*args)
+            except Exception:
+                self.failed += 1
+                print(f'\n--- Error in posted UI call "{getattr(func, "__name__", func)}" ---')
+                traceback.print_exc()
+            count += 1
+            if time.perf_counter() >= end:
+                break
+        self.run += count
+        self.max_drain_time = max(self.max_drain_time, time.perf_counter() - start)
+        with self._lock:  # checked under the lock so a concurrent post either sees armed=False or is drained
+            if not queue:
+                self.armed = False
+        return count
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __repr__(self) -> str:
+        return f'UIQueue: {len(self._queue)} queued'
+
+
+
+class UIDrainer():
+    '''
+    Runs the calls posted to a UIQueue on the Tk thread of "root" (EasyGUI or tkinter.Tcl()).
+    Only the Tk thread ever calls into Tk: a post made there schedules a drain directly, while a post
+    from another thread writes a byte to a pipe watched by a Tcl file handler, which schedules the drain
+    on the Tk thread (so posting works before mainloop starts and with non-threaded Tcl builds).
+    Tk builds without file handlers (ex: Windows) instead check the queue every "interval" milliseconds.
+    Drains only run while something is queued: each runs calls for up to "budget" seconds
+    and comes back after 1 ms if any are left.
+    '''
+    def __init__(self, root, queue: UIQueue, interval: int=16, budget: float=0.008) -> None:
+        self.root = root
+        self.queue = queue
+        self.interval = interval  # milliseconds to wait before a drain so repeated posts coalesce
+        self.budget = budget
+        self.drains = 0
+        self._thread = threading.get_ident()  # the Tk thread (the one creating the window)
+        self._after_id = None  # pending drain
+        self._poll_id = None  # pending queue check when there is no pipe
+        self._pipe = None  # (read fd, write fd) of the wakeup pipe
+        self._lock = threading.Lock()  # so another thread never writes to the pipe while it is closed
+        self._closed = False
+        if hasattr(root.tk, 'createfilehandler'):
+            read_fd, write_fd = os.pipe()
+            try:
+                os.set_blocking(read_fd, False)
+                os.set_blocking(write_fd, False)
+                root.tk.createfilehandler(read_fd, READABLE, self._on_pipe)
+                self._pipe = (read_fd, write_fd)
+            except Exception:  # Tk without file handler support
+                os.close(read_fd)
+                os.close(write_fd)
+        queue.wakeup = self.wakeup
+        if self._pipe is None:
+            self._poll()
+        elif queue.armed:  # posted to before this drainer existed
+            self._schedule(self.interval)
+
+    @property
+    def polling(self) -> bool:
+        '''True if the queue is checked on a timer rather than woken through the pipe.'''
+        return self._pipe is None
+
+    def wakeup(self) -> None:
+        '''Called by UIQueue.post (from any thread) when it has new work and no drain is armed.'''
+        if threading.get_ident() == self._thread:
+            self._schedule(self.interval)
+            return
+        with self._lock:
+            if self._pipe is not None:
+                try:
+                    os.write(self._pipe[1], b'x')
+                except OSError:  # pipe full, so the Tk thread is already due to wake up
+                    pass
+        # without a pipe the next _poll on the Tk thread sees the armed queue
+
+    def _on_pipe(self, *args) -> None:
+        if self._pipe is None:
+            return
+        try:
+            while os.read(self._pipe[0], 4096):
+                pass
+        except OSError:  # emptied (non-blocking read)
+            pass
+        self._schedule(self.interval)
+
+    def _poll(self) -> None:
+        if self.queue.armed:
+            self._schedule(self.interval)
+        self._poll_id = self.root.after(self.interval, self._poll)
+
+    def _schedule(self, delay: int) -> None:
+        if self._after_id is None and not self._closed:
+            self._after_id = self.root.after(delay, self._drain)
+
+    def _drain(self) -> None:
+        self._after_id = None
+        self.queue.drain(self.budget)
+        self.drains += 1
+        if self.queue.armed:  # still over budget so come back soon; otherwise wait for the next post
+            self._schedule(1)
+
+    def close(self) -> None:
+        '''Stop draining (call on the Tk thread before the window is destroyed).'''
+        self._closed = True
+        for after_id in (self._after_id, self._poll_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self._after_id = self._poll_id = None
+        with self._lock:
+            pipe, self._pipe = self._pipe, None
+        if pipe is not None:
+            self.root.tk.deletefilehandler(pipe[0])
+            os.close(pipe[0])
+            os.close(pipe[1])
+
+    def __repr__(self) -> str:
+        return f'UIDrainer: {"polling" if self.polling else "pipe"} mode, {self.drains} drains'
+
+
+
+class ProcessRunner():
+    '''
+    Runs CPU-bound functions in a process pool (started on first use) so they can't starve the
+    Tk thread of the GIL.  Functions and their arguments/results must be picklable (ex: module-level functions).
+    Results are passed to "deliver" (EasyGUI.post) so that on_result runs on the Tk thread.
+    Only the latest call for each key (normally one binding) matters: a new call cancels the previous
+    one if it hasn't started yet and otherwise the previous result is discarded as stale when it arrives.
+    '''
+    def __init__(self, deliver: Callable, max_workers: Optional[int]=None) -> None:
+        self.deliver = deliver
+        self.max_workers = max_workers  # None uses the number of CPUs
+        self._executor = None
+        self._shutdown = False
+        self._lock = threading.Lock()
+        self._generations = {}  # {key: number of the latest call}
+        self._futures = {}  # {key: Future of the latest call}
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0  # replaced before they started
+        self.stale = 0  # finished after a newer call for the same key was submitted
+        self.dropped = 0  # submitted after shutdown
+
+    def submit(self, func: Callable, *args, on_result: Optional[Callable]=None, key=None) -> Optional[Future]:
+        '''
+        Run func(*args) in a separate process and (if still the latest call for "key", which defaults to func)
+        call on_result(result) on the Tk thread once it finishes.
+        Returns None (and runs nothing) once shutdown has been called, ex: a debounced click firing after the window closed.
+        '''
+        if key is None:
+            key = func
+        with self._lock:
+            if self._shutdown:
+                self.dropped += 1
+                return None
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            previous = self._futures.get(key)
+            if previous is not None and previous.cancel():
+                self.cancelled += 1
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            try:
+                future = self._executor.submit(func, *args)
+            except BrokenProcessPool:  # ex: a worker process was killed, so start a fresh pool
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                future = self._executor.submit(func, *args)
+            self._futures[key] = future
+            self.submitted += 1
+        future.add_done_callback(lambda future: self._finished(future, func, key, generation, on_result))
+        return future
+
+    def wrap(self, func: Callable, on_result: Optional[Callable]=None) -> Callable:
+        '''
+        Return a callback (ex: for a tkinter binding) that submits func to the process pool.
+        Like separate_thread callbacks, func is called without the (unpicklable) event argument.
+        '''
+        def submit_to_processes(*args):
+            self.submit(func, on_result=on_result, key=submit_to_processes)
+        return submit_to_processes
+
+    def _finished(self, future: Future, func: Callable, key, generation: int, on_result: Optional[Callable]) -> None:
+        '''Done callback (runs on a background thread) routing the result to the Tk thread.'''
+        if future.cancelled():
+            return
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+            if self._generations.get(key) != generation:
+                self.stale += 1
+                return
+        error = future.exception()
+        if error is not None:
+            self.failed += 1
+            self.deliver(self._report_error, func, error)
+        else:
+            self.completed += 1
+            if on_result is not None:
+                self.deliver(on_result, future.result())
+
+    @staticmethod
+    def _report_error(func: Callable, error: BaseException) -> None:
+        print(f'\n--- Error in separate process running "{getattr(func, "__name__", func)}" ---')
+        traceback.print_exception(type(error), error, error.__traceback__)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'submitted': self.submitted, 'completed': self.completed, 'failed': self.failed,
+                    'cancelled': self.cancelled, 'stale': self.stale, 'dropped': self.dropped, 'in_flight': len(self._futures)}
+
+    def shutdown(self) -> None:
+        '''Cancel calls that haven't started, let the worker processes exit and refuse any more calls.'''
+        with self._lock:
+            self._shutdown = True
+            executor, self._executor = self._executor, None
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        return f'ProcessRunner: {len(self._futures)} in flight'
+
+
+
+class RateLimiter():
+    '''
+    Wraps a binding's callback to limit how often it runs for high-frequency events
+    (ex: <Motion>, <Configure>, <<TreeviewSelect>> or a Slider being dragged).
+        debounce_ms - run once the events have stopped for this many milliseconds
+        throttle_ms - run at most once per this many milliseconds
+        latest_only - only run for the last of a burst of events handled in the same pass of the event loop
+    Delivery is on the trailing edge: the most recent event's arguments are always eventually passed on.
+    "scheduler" is the tkinter window whose after()/after_idle() calls are used for timing.
+    '''
+    def __init__(self, func: Callable, scheduler, debounce_ms: Optional[int]=None, throttle_ms: Optional[int]=None, latest_only: bool=False) -> None:
+        if debounce_ms and throttle_ms:
+            raise ValueError('Use either debounce_ms or throttle_ms for a binding, not both.')
+        if not (debounce_ms or throttle_ms or latest_only):
+            raise ValueError('RateLimiter needs debounce_ms, throttle_ms or latest_only.')
+        self.func = func
+        self.scheduler = scheduler
+        self.debounce_ms = debounce_ms
+        self.throttle_ms = throttle_ms
+        self.latest_only = latest_only
+        self.events = 0  # events received
+        self.calls = 0  # times func was actually run
+        self.dropped = 0  # events replaced by a newer one before func ran
+        self._pending = None  # args of the event waiting to be delivered
+        self._after_id = None
+        self._last_call = None  # time.perf_counter() of the last call (for throttling)
+
+    def __call__(self, *args) -> None:
+        self.events += 1
+        if self._pending is not None:
+            self.dropped += 1
+        self._pending = args
+        if self.debounce_ms:
+            self._cancel_timer()
+            self._after_id = self.scheduler.after(self.debounce_ms, self.flush)
+        elif self._after_id is None:
+            wait = 0
+            if self.throttle_ms and self._last_call is not None:
+                wait = math.ceil(self.throttle_ms - (time.perf_counter() - self._last_call) * 1000)
+            if wait > 0:
+                self._after_id = self.scheduler.after(wait, self.flush)
+            elif self.latest_only:
+                self._after_id = self.scheduler.after_idle(self.flush)
+            else:
+                self.flush()  # leading edge of a throttle interval
+
+    def flush(self) -> None:
+        '''Deliver the pending event (if any) right away.'''
+        self._cancel_timer()
+        if self._pending is None:
+            return
+        args, self._pending = self._pending, None
+        self._last_call = time.perf_counter()
+        self.calls += 1
+        self.func(*args)
+
+    def cancel(self) -> None:
+        '''Forget the pending event without delivering it.'''
+        self._cancel_timer()
+        if self._pending is not None:
+            self._pending = None
+            self.dropped += 1
+
+    def _cancel_timer(self) -> None:
+        if self._after_id is not None:
+            self.scheduler.after_cancel(self._after_id)
+            self._after_id = None
+
+    def stats(self) -> dict:
+        return {'events': self.events, 'calls': self.calls, 'dropped': self.dropped, 'pending': self._pending is not None}
+
+    def __repr__(self) -> str:
+        return f'RateLimiter: {self.calls} calls for {self.events} events ({self.dropped} dropped)'
@@ -0,0 +1,89 @@
+'''
+Python module containing the key-trigger matcher of easy_gui project.
+Nothing in here touches tkinter, so triggers can be matched (and benchmarked) without a display.
+'''
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+
+
+class KeyTriggerMatcher():
+    '''
+    Streaming multi-pattern matcher (Aho-Corasick automaton) for key triggers.
+    Each typed character advances a single state, so the cost per key press does not
+    depend on the number of triggers or on how many keys have been typed.
+    If several triggers end on the same key, the first one added wins.
+    '''
+    def __init__(self) -> None:
+        self.triggers: List[Tuple[str, Callable]] = []
+        self._goto = [{}]  # {char: next state} for each state
+        self._fail = [0]  # longest proper suffix state for each state
+        self._match = [None]  # index of first-added trigger ending at each state (including via fail links)
+        self._built = True
+        self.state = 0
+
+    def add(self, trigger: str, action: Callable) -> None:
+        '''Add a trigger string and the action returned by feed() when it is typed.'''
+        if not trigger:
+            raise ValueError('Key trigger must be a non-empty string.')
+        self.triggers.append((trigger, action))
+        self._built = False  # automaton is rebuilt on the next key press
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def _build(self) -> None:
+        goto, match = [{}], [None]
+        for index, (trigger, _) in enumerate(self.triggers):
+            state = 0
+            for char in trigger:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    match.append(None)
+                state = next_state
+            if match[state] is None:
+                match[state] = index
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:  # breadth-first so fail links always point at already finished states
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                inherited = match[fail[next_state]]
+                if inherited is not None and (match[next_state] is None or inherited < match[next_state]):
+                    match[next_state] = inherited
+
+        self._goto, self._fail, self._match = goto, fail, match
+        self._built = True
+        self.state = 0
+
+    def feed(self, chars: str) -> Optional[Callable]:
+        '''
+        Advance the automaton by the typed character(s) and return the action
+        of a trigger that was just completed (resetting to the start state) or None.
+        '''
+        if not self._built:
+            self._build()
+        goto, fail = self._goto, self._fail
+        state = self.state
+        for char in chars:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            index = self._match[state]
+            if index is not None:
+                self.state = 0  # like clearing the key log so the next key doesn't re-trigger
+                return self.triggers[index][1]
+        self.state = state
+        return None
+
+    def reset(self) -> None:
+        '''Forget any partially typed trigger.'''
+        self.state = 0
@@ -7,7 +7,7 @@ from tkinter import ttk
 from tkinter import _tkinter
 from tkinter import scrolledtext
 import sys
-import threading
+import logging
 from typing import List
 try:
     import matplotlib
@@ -16,8 +16,14 @@ try:
 except ImportError:  # don't force user to have matplotlib installed to use most (non-matplotlib) functionality
     pass
 from contextlib import nullcontext
+from collections import deque
 import datetime
 import calendar
+from . import data
+from . import layout
+from . import styles
+from . import tasks
+from . import capture as capture_module  # aliased as StdOutBox has a "capture" argument
 
 
 def clean_kwargs(kwargs: dict, keys_to_remove: list) -> dict:
@@ -35,121 +41,129 @@ class Widget(tk.Frame):
         self.parent = master  # master attr used in tkinter; parent attr used in this code
         self.grid_area = grid_area
         self.configure(background=self.style.widget_bg_color)
+        self.root.style_registry.register(self, background='widget_bg_color')
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent) -> None:
+        '''
+        Resolve (and cache) the root window once when this Widget is attached to a parent
+        rather than walking up the parent chain on every .root/.style access.
+        '''
+        self._parent = parent
+        self._gui_root = parent.root if parent is not None else None
 
     @property
     def style(self):
-        '''Goes upsteam to evenually reference EasyGUI.style'''
-        return self.parent.style
+        '''Style of the root window (EasyGUI.style unless changed), read through the cached root'''
+        return self._gui_root.style
 
     @property
     def root(self):
-        '''Goes upsteam to evenually reference EasyGUI as root'''
-        return self.parent.root
+        '''Cached reference to the EasyGUI (or PopUp) root window'''
+        return self._gui_root
 
     def position(self, force_row: bool=False) -> None:
         '''
         Physically position this Widget within its parent Section.
         '''
+        self.apply_placement(layout.plan_child(self.parent, self, force_row))
+
+    def apply_placement(self, placement: layout.Placement) -> None:
+        '''
+        Issue the geometry call(s) for a Placement planned by layout.plan_child/plan_layout.
+        If gridding fails, the parent is laid out again with every child in its own new row.
+        '''
+        layout.commit_placement(placement)
+        grid_kwargs = placement.grid_kwargs if placement.kind == 'grid' else None
+        def place(widget, **kwargs):
+            if grid_kwargs is None:
+                widget.pack()  # parent is a tabbed Section which already packs its Notebook
+            else:
+                widget.grid(**grid_kwargs, **kwargs)
+
         try:
-            if self.parent.grid_areas != {} and self.grid_area and not force_row:
-                try:
-                    bounds = self.parent.grid_areas[self.grid_area]
-                    if isinstance(self, Tree):
-                        self.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1, sticky='NSEW')
-                        self._widget.pack(side='left', fill=tk.BOTH, expand=True)
-                        self.scrollbar.pack(side='left', fill='y')
-                    elif isinstance(self, CanvasButton):
-                        self._widget._widget.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1)
-                    elif isinstance(self, LabelEntry):
-                        self.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1)
-                        self._lbl_widget._widget.pack(side='left', expand=True)
-                        self._widget.pack(side='left')
-                        self._widget._widget.pack(side='left')
-                    elif isinstance(self, Table):
-                        self.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1) #, sticky='NSEW')
-                        self.grid_cells()
-                    elif isinstance(self, DatePicker):
-                        self.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1)
-                        self.grid_interior()
-                    elif isinstance(self, Label):
-                        self._widget.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1, sticky='NSEW')
-                    else:
-                        self._widget.grid(row=bounds['first_row'], column=bounds['first_column'], rowspan=bounds['last_row']-bounds['first_row']+1, columnspan=bounds['last_column']-bounds['first_column']+1)
-                    return  # early return if everything works fine with initial attempt (no other actions needed)
-                except KeyError:
-                    print(f'"{self.grid_area}" not found in parent\'s grid areas.\nResorting to a new row.')
-            name = self.__class__.__name__
-            existing_grid_areas = [n for n in self.parent.grid_areas if name in n]
-            self.grid_area = name if name not in existing_grid_areas else next((name + str(i) for i in range(1, 100) if name + str(i) not in existing_grid_areas))
-            self.parent.add_grid_row(self.grid_area)
-            self.parent.create()
+            if placement.new_row is not None:
+                placement.container.configure_grid_row(placement.new_row, placement.new_columns)
+            if isinstance(self, (Tree, LogViewer, VirtualTable)):
+                place(self, sticky='NSEW')
+                self._widget.pack(side='left', fill=tk.BOTH, expand=True)
+                self.scrollbar.pack(side='left', fill='y')
+            elif isinstance(self, CanvasButton):
+                place(self._widget._widget)
+            elif isinstance(self, LabelEntry):
+                place(self)
+                self._lbl_widget._widget.pack(side='left', expand=True)
+                self._widget.pack(side='left')
+                self._widget._widget.pack(side='left')
+            elif isinstance(self, Table):
+                place(self) #, sticky='NSEW')
+                self.grid_cells()
+            elif isinstance(self, DatePicker):
+                place(self)
+                self.grid_interior()
+            elif isinstance(self, Label):
+                place(self._widget, sticky='NSEW')
+            else:
+                place(self._widget)
         except _tkinter.TclError:
             print(f'\n--- GRID FAILED for Widget: "{ self.__class__.__name__}" ---\nTry ensuring "grid_area" arg is given for all Widgets in a given parent.\nAdding to a new row instead.')
-            self.parent.create(force_row=True)  # go back and fully recreate section forcing all children to be packed/in new rows
+            if not placement.forced:
+                self.parent.create(force_row=True)  # go back and fully recreate parent forcing all children into new rows
 
-    def bind_click(self, command_func, separate_thread: bool=False) -> None:
+    def bind_click(self, command_func, separate_thread: bool=False, **options):
         '''
         Bind a left-mouse click to the widget to trigger a target "command_func" function.
+        See bind_event for the other options.
         '''
-        self.bind_event('<Button-1>', command_func, separate_thread=separate_thread)
+        return self.bind_event('<Button-1>', command_func, separate_thread=separate_thread, **options)
 
-    def bind_select(self, command_func, separate_thread: bool=False) -> None:
+    def bind_select(self, command_func, separate_thread: bool=False, **options):
         '''
         Bind a left-mouse click to the widget to trigger a target "command_func" function.
+        See bind_event for the other options.
         '''
-        self.bind_event('<Button-1>', command_func, separate_thread=separate_thread)
+        return self.bind_event('<Button-1>', command_func, separate_thread=separate_thread, **options)
 
-    def bind_event(self, event: str, command_func, separate_thread: bool=False) -> None:
+    def bind_event(self, event: str, command_func, separate_thread: bool=False, thread_policy: str='queue',
+                         separate_process: bool=False, on_result=None,
+                         debounce_ms=None, throttle_ms=None, latest_only: bool=False):
         '''
         Bind an event (specified by "event" string such as '<<ComboboxSelected>>' to trigger a target "command_func" function.
         Note that the "_widget" attribute of subclasses is assumed to be the tkinter widget itself!!!
+        With separate_thread=True, command_func runs on the root window's worker pool (see tasks.WorkerPool)
+        and "thread_policy" ('queue', 'drop' or 'coalesce') decides what happens to events arriving while it is busy.
+        With separate_process=True, command_func (which must be picklable, ex: a module-level function) runs in a
+        process pool and its return value is passed to on_result on the GUI thread.  A new event cancels (or discards
+        the result of) the previous call still in flight.
+        command_func can also be a coroutine function ("async def"), which is run on the window's asyncio loop.
+
+        For high-frequency events (ex: '<Motion>' or '<<TreeviewSelect>>' driving a plot) use debounce_ms
+        (run once events stop for that long), throttle_ms (run at most once per interval) or latest_only
+        (skip all but the last of a burst of events).  The latest event is always delivered and the returned
+        tasks.RateLimiter counts dropped events for tuning.  Returns None if none of these are used.
         '''
-        if separate_thread:
-            def threaded_command_func(*args):
-                threading.Thread(target=command_func).start()
-            self._widget.bind(event, threaded_command_func, add='+')
-        else:
-            self._widget.bind(event, command_func, add='+')
+        callback = self.root.make_callback(command_func, separate_thread, thread_policy, separate_process, on_result,
+                                           debounce_ms, throttle_ms, latest_only)
+        self._widget.bind(event, callback, add='+')
+        return callback if isinstance(callback, tasks.RateLimiter) else None
 
     def add_tooltip(self, text: str, delay: float=1.0):
         '''
         Add a tooltip that shows up when mouse is over Widget.
         "delay" arg is number of seconds to delay showing the tooltip after mouse enters the Widget.
-
-        Code here is messy from using/saving state between functions... but it works for now.
+        All Widgets in a window share one reusable Tooltip window (see Tooltip class).
         '''
-        self.tooltip = None
-
-        def leave(*args):
-            if self.tooltip:
-                self.tooltip.destroy()
-            self.tooltip = None
-
-        def show_tooltip(*args):
-            leave()  # close previous tooltip if somehow exists
-            if self.last_event != '<Leave>':  # this checks to ensure that mouse hasn't left widget in time between <Enter> and the specified delay
-                abs_coord_x = self.root.winfo_pointerx()
-                abs_coord_y = self.root.winfo_pointery()
-
-                max_line_length = max(len(sub_text) for sub_text in text.split('\n'))
-                with self.root.popup(tooltip=True, width=int(6.2*max_line_length)+15, height=18 * (text.count('\n')+1) + 12, x=abs_coord_x+20, y=abs_coord_y+10) as tooltip:
-                    sec = tooltip.add_section()
-                    sec.configure(bg=self.style.tooltip_color)
-                    sec.configure(relief='raised')
-                    label = sec.add_widget('label', text)
-                    label._widget.configure(bg=self.style.tooltip_color)
-                    self.tooltip = tooltip
-
-        def save_last_event(event):
-            self.last_event = event
-
-        self.bind_event('<Enter>', lambda _: self._widget.after(int(delay * 1000), show_tooltip))
-        self.bind_event('<Enter>', lambda _: save_last_event('<Enter>'))
-        self.bind_event('<Leave>', leave)
-        self.bind_event('<Leave>', lambda _: save_last_event('<Leave>'))
+        self.tooltip_text = text  # can be changed later to update the tooltip
+        self.bind_event('<Enter>', lambda _: Tooltip.of(self.root).schedule(self, self.tooltip_text, int(delay * 1000)))
+        self.bind_event('<Leave>', lambda _: Tooltip.of(self.root).hide(self))
 
     def destroy(self):
         self._widget.destroy()
+        tk.Frame.destroy(self)  # this Widget's own Frame (otherwise its parent keeps it, and so this Widget, alive)
 
     @property
     def width(self) -> float:
@@ -165,22 +179,129 @@ class Widget(tk.Frame):
         '''
         return float(self._widget['height'])
 
+    def measure_text(self, text, font_key: str='font') -> tuple:
+        '''
+        Return (width, height) in pixels of text displayed in the style's "font_key" font.
+        Width is that of the widest line and lookups go through the styles.text_width LRU cache.
+        '''
+        font_obj = getattr(self.style, font_key, None) or styles.default_font(self.root)
+        lines = str(text).split('\n')
+        return max(styles.text_width(font_obj, line) for line in lines), styles.line_height(font_obj) * len(lines)
+
+    def _text_changed(self, text) -> None:
+        '''
+        Record new displayed text (what width/height are measured from)
+        and make the parent Section re-measure its children.
+        '''
+        self.text = text
+        self._invalidate_parent_size()
+
+    def _invalidate_parent_size(self) -> None:
+        if getattr(self.parent, '_size_cache', None) is not None:
+            self.parent._size_cache = None
+
     def config(self, *args, **kwargs):
         '''Just pass a config call through to the tkinter widget itself.'''
+        if 'text' in kwargs:
+            self._text_changed(kwargs['text'])
         return self._widget.config(*args, **kwargs)
 
 
+class Tooltip():
+    '''
+    Single reusable tooltip window shared by every Widget in a root window (EasyGUI or PopUp).
+    Rather than building and destroying a new window on each hover, the same (withdrawn)
+    tk.Toplevel is re-labelled, sized from cached font metrics, moved and shown.
+    Use Tooltip.of(root) to get the tooltip of a root window.
+    '''
+    def __init__(self, root) -> None:
+        self.root = root
+        style = root.style
+        self.font = style.font if style.font is not None else styles.default_font(root)
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        self.window.wm_overrideredirect(True)  # removes window
+        try:
+            self.window.wm_attributes('-disabled', True)  # disables window interaction for click pass through
+        except Exception:  # option only for Windows system
+            pass
+        self.window.wm_attributes('-alpha', 0.8)
+        self.window.configure(bg=style.tooltip_color)
+        self.frame = tk.Frame(self.window, bg=style.tooltip_color, relief='raised', borderwidth=1)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.label = tk.Label(self.frame, bg=style.tooltip_color, fg=style.text_color, font=self.font, justify=tk.LEFT)
+        self.label.pack(fill=tk.BOTH, expand=True)
+        root.style_registry.register(self.window, bg='tooltip_color')
+        root.style_registry.register(self.frame, bg='tooltip_color')
+        root.style_registry.register(self.label, bg='tooltip_color', fg='text_color')
+        root.style_registry.register_callback(self._set_font, 'font')
+        self.owner = None  # Widget the tooltip is currently shown (or scheduled to show) for
+        self._pending = None  # after() id of a scheduled show
+
+    @classmethod
+    def of(cls, root) -> 'Tooltip':
+        '''Return the Tooltip of a root window, creating it on first use.'''
+        tooltip = getattr(root, '_tooltip', None)
+        if tooltip is None:
+            tooltip = root._tooltip = cls(root)
+        return tooltip
+
+    def _set_font(self, new_font) -> None:
+        self.font = new_font if new_font is not None else styles.default_font(self.root)
+        self.label.configure(font=self.font)
+
+    def schedule(self, owner, text: str, delay_ms: int) -> None:
+        '''Show the tooltip for "owner" Widget after delay_ms (replacing any pending or shown tooltip).'''
+        self.cancel()
+        if self.owner is not owner:
+            self.window.withdraw()
+        self.owner = owner
+        self._pending = self.root.after(delay_ms, lambda: self.show(owner, text))
+
+    def cancel(self) -> None:
+        '''Cancel a scheduled show (if any).'''
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+
+    def show(self, owner, text: str) -> None:
+        '''Re-label, size, position and show the tooltip next to the mouse pointer.'''
+        self._pending = None
+        if owner is not self.owner:  # mouse already moved on to another Widget
+            return
+        lines = text.split('\n')
+        width = max(styles.text_width(self.font, line) for line in lines) + 16
+        height = styles.line_height(self.font) * len(lines) + 12
+        x, y = self.root.winfo_pointerx() + 20, self.root.winfo_pointery() + 10
+        self.label.configure(text=text)
+        self.window.geometry(f'{width}x{height}+{x}+{y}')  # format of "WIDTHxHEIGHT+(-)XPOSITION+(-)YPOSITION"
+        self.window.deiconify()
+        self.window.lift()
+
+    def hide(self, owner=None) -> None:
+        '''Hide the tooltip (only if it belongs to "owner" when given) and cancel any scheduled show.'''
+        if owner is not None and owner is not self.owner:
+            return
+        self.cancel()
+        self.owner = None
+        self.window.withdraw()
+
+
 def add_widget(self, type='label', text='', widget_name=None, grid_area=None, **kwargs):
         '''
         Add a Widget subclass object to the 'self' Section.
         This is used as a Section method in master_classes.Section.
         ('self' is passed in as a reference to the parent Section)
         '''
+        self._widget_count += 1  # never decreases, so default names aren't reused after deletions
         def new_widget_name(w_type):
             if widget_name:
                 return widget_name
-            else:
-                return f'{len(self.widgets) + 1}' + '_' + w_type
+            name = f'{self._widget_count}_{w_type}'
+            while name in self.widgets:  # skip past any user-specified names in the same format
+                self._widget_count += 1
+                name = f'{self._widget_count}_{w_type}'
+            return name
 
         type_lower = type.lower()
         if type_lower in ['label', 'lbl']:
@@ -213,12 +334,16 @@ def add_widget(self, type='label', text='', widget_name=None, grid_area=None, **
         elif type_lower == 'table':
             new_widget = Table(master=self, grid_area=grid_area, **kwargs)
             self.widgets[new_widget_name('table')] = new_widget
+        elif type_lower in ['virtualtable', 'vtable']:
+            new_widget = VirtualTable(master=self, grid_area=grid_area, **kwargs)
+            self.widgets[new_widget_name('virtualtable')] = new_widget
         elif type_lower == 'tree':
             new_widget = Tree(master=self, grid_area=grid_area, **kwargs)
             self.widgets[new_widget_name('tree')] = new_widget
         elif type_lower in ['matplotlib', 'matplotlibplot']:
-            new_widget = MatplotlibPlot(master=self, section=self, widget_name=new_widget_name('matplotlibplot'), grid_area=grid_area, **kwargs)
-            self.widgets[new_widget_name('matplotlibplot')] = new_widget
+            name = new_widget_name('matplotlibplot')
+            new_widget = MatplotlibPlot(master=self, section=self, widget_name=name, grid_area=grid_area, **kwargs)
+            self.widgets[name] = new_widget
         elif type_lower == 'stdout':
             new_widget = StdOutBox(master=self, grid_area=grid_area, **kwargs)
             self.widgets[new_widget_name('stdout')] = new_widget
@@ -231,13 +356,16 @@ def add_widget(self, type='label', text='', widget_name=None, grid_area=None, **
         elif type_lower in ['progress', 'progressbar']:
             new_widget = ProgressBar(master=self, grid_area=grid_area, **kwargs)
             self.widgets[new_widget_name('progressbar')] = new_widget
+        elif type_lower in ['log', 'logviewer']:
+            new_widget = LogViewer(master=self, grid_area=grid_area, **kwargs)
+            self.widgets[new_widget_name('logviewer')] = new_widget
         elif type_lower in ['date', 'datepicker']:
             new_widget = DatePicker(master=self, grid_area=grid_area, **kwargs)
             self.widgets[new_widget_name('datepicker')] = new_widget
         else:
             exception_text = f'Error!  Widget type "{type}" not supported. (check spelling?)\n'
             exception_text += 'Try one of:\n    ' + '    \n'.join(['label', 'button', 'canvas', 'canvasbutton', 'entry', 'labelentry', 'checkbox']) + '\n    '
-            exception_text += '    \n'.join(['dropdown', 'listbox', 'table', 'tree', 'matplotlib', 'stdout', 'scrolledtext', 'slider', 'progressbar', 'datepicker'])
+            exception_text += '    \n'.join(['dropdown', 'listbox', 'table', 'virtualtable', 'tree', 'matplotlib', 'stdout', 'scrolledtext', 'logviewer', 'slider', 'progressbar', 'datepicker'])
             raise Exception(exception_text)
 
         return new_widget
@@ -245,7 +373,9 @@ def add_widget(self, type='label', text='', widget_name=None, grid_area=None, **
 
 
 class Button(Widget):
-    def __init__(self, master=None, text='button', image=None, command_func=lambda x: None, separate_thread=False, use_ttk: bool=False, **kwargs) -> None:
+    def __init__(self, master=None, text='button', image=None, command_func=lambda x: None, separate_thread=False, thread_policy: str='queue',
+                       separate_process: bool=False, on_result=None, debounce_ms=None, throttle_ms=None, latest_only: bool=False,
+                       use_ttk: bool=False, **kwargs) -> None:
         super().__init__(master=master, **kwargs)
         self.text = text
         self.image = None
@@ -257,9 +387,18 @@ class Button(Widget):
         kwargs = clean_kwargs(kwargs, ['grid_area'])
         if not use_ttk:
             self._widget = tk.Button(master=master, text=text, image=self.image, highlightbackground=self.style.button_color, font=self.style.font, **kwargs)
+            self.root.style_registry.register(self._widget, highlightbackground='button_color', font='font')
         else:
             self._widget = ttk.Button(master=master, text=text, image=self.image, **kwargs)
-        self.bind_click(command_func, separate_thread)
+        # tasks.RateLimiter of command_func if debounce_ms, throttle_ms or latest_only are used
+        self.limiter = self.bind_click(command_func, separate_thread, thread_policy=thread_policy, separate_process=separate_process,
+                                       on_result=on_result, debounce_ms=debounce_ms, throttle_ms=throttle_ms, latest_only=latest_only)
+
+    def get(self):
+        return self.text
+
+    def set(self, text):
+        self.config(text=text)
 
     def place(self) -> None:
         '''
@@ -274,7 +413,7 @@ class Button(Widget):
         Return width used by this Button.
         Overwrites Widget method.
         '''
-        return 6.6 * len(self.text)
+        return float(self.measure_text(self.text)[0] + 2 * self.style.button_padx)
 
     @property
     def height(self) -> float:
@@ -282,12 +421,13 @@ class Button(Widget):
         Return height used by this Button.
         Overwrites Widget method.
         '''
-        return 39
+        return float(self.measure_text(self.text)[1] + 2 * self.style.button_pady)
 
 
 class CanvasButton(Widget):
     def __init__(self, master=None, text: str='button', width: int=120, height: int=35, form: str='rounded', fontsize: int=12,
-                         command_func=lambda x: None, separate_thread=False, **kwargs) -> None:
+                         command_func=lambda x: None, separate_thread=False, thread_policy: str='queue',
+                         separate_process: bool=False, on_result=None, debounce_ms=None, throttle_ms=None, latest_only: bool=False, **kwargs) -> None:
         super().__init__(master=master, **kwargs)
         self.text = text
         self._widget = Canvas(master=master, width=width, height=height, background=self.style.section_color, highlightthickness=0)
@@ -311,9 +451,14 @@ class CanvasButton(Widget):
             self._widget.create_polygon(self.polygon(8, width=width, height=height, border=False), fill=self.style.button_color, outline='', tags='button')
 
         self._widget.create_text(width/2, height/2, text=text, fontsize=fontsize, anchor='center', fill='black', tags='button_text')
-
-        self._widget.bind_click('button', command_func, separate_thread)
-        self._widget.bind_click('button_text', command_func, separate_thread)
+        self.root.style_registry.register(self._widget._widget, background='section_color')
+        self.root.style_registry.register_callback(self.on_leave, 'button_color', 'button_border_color')
+
+        callback = self.root.make_callback(command_func, separate_thread, thread_policy, separate_process, on_result,
+                                           debounce_ms, throttle_ms, latest_only)  # shared so both tags are one binding
+        self.limiter = callback if isinstance(callback, tasks.RateLimiter) else None
+        self._widget.bind_click('button', callback)
+        self._widget.bind_click('button_text', callback)
         self._widget.bind_click('button', self.on_click)
         self._widget.bind_click('button_text', self.on_click)
         self._widget.bind_event('<Enter>', self.on_enter)
@@ -373,13 +518,11 @@ class Canvas(Widget):
         '''See tkinter.Canvas.itemconfigure... Used to change tagged items.'''
         self._widget.itemconfigure(self._clean_tag(tag), *args, **kwargs)
 
-    def bind_click(self, tag, command_func, separate_thread: bool=False) -> None:
-        if separate_thread:
-            def threaded_command_func(*args):
-                threading.Thread(target=command_func).start()
-            self._widget.tag_bind(self._clean_tag(tag), '<Button-1>', threaded_command_func, add='+')
-        else:
-            self._widget.tag_bind(self._clean_tag(tag), '<Button-1>', command_func, add='+')
+    def bind_click(self, tag, command_func, separate_thread: bool=False, **options):
+        '''Bind a left-mouse click on items with "tag".  See Widget.bind_event for the other options.'''
+        callback = self.root.make_callback(command_func, separate_thread, **options)
+        self._widget.tag_bind(self._clean_tag(tag), '<Button-1>', callback, add='+')
+        return callback if isinstance(callback, tasks.RateLimiter) else None
 
     def create_text(self, x, y, text='Text', anchor='nw', fill='black', tags=None,
                                fontsize: int=12, bold: bool=False, **kwargs):
@@ -431,15 +574,15 @@ class Label(Widget):
         self.strvar = tk.StringVar()
         self.set(text)
         kwargs = clean_kwargs(kwargs, ['grid_area'])
-        font = self.style.font
+        font_key = 'font'  # name of style attribute used for the font
         if bold:
-            font = self.style.font_bold
+            font_key = 'font_bold'
         if underline:
-            font = self.style.font_underline
+            font_key = 'font_underline'
         if bold and underline:
-            font = self.style.font_bold_underline
-
-
+            font_key = 'font_bold_underline'
+        self.font_key = font_key
+        font = getattr(self.style, font_key)
 
         if copyable: # hack using a tk.Entry but making it look like a Label
             if align.lower() == 'center':
@@ -453,6 +596,7 @@ class Label(Widget):
             self._widget = tk.Entry(master=master, textvariable=self.strvar, bg=self.style.widget_bg_color, fg=self.style.text_color,
                                 font=font, borderwidth=border_width, state='readonly', readonlybackground=self.style.widget_bg_color, relief=relief,
                                 justify=justify, width=0, **kwargs) #self.width, **kwargs)
+            self.root.style_registry.register(self._widget, bg='widget_bg_color', fg='text_color', font=font_key, readonlybackground='widget_bg_color')
         else:
             if align.lower() == 'center':
                 anchor = None
@@ -462,12 +606,14 @@ class Label(Widget):
                 anchor = 'e'
             self._widget = tk.Label(master=master, textvariable=self.strvar, bg=self.style.widget_bg_color, fg=self.style.text_color,
                                 padx=self.style.label_padx, pady=self.style.label_pady, font=font, anchor=anchor, **kwargs)
+            self.root.style_registry.register(self._widget, bg='widget_bg_color', fg='text_color', font=font_key, padx='label_padx', pady='label_pady')
 
     def get(self):
         return self.strvar.get()
 
     def set(self, value):
         self.strvar.set(value)
+        self._text_changed(value)
 
     @property
     def width(self) -> float:
@@ -475,7 +621,7 @@ class Label(Widget):
         Return width used by this Label.
         Overwrites Widget method.
         '''
-        return int(6.6 * len(self.text))
+        return float(self.measure_text(self.text, self.font_key)[0] + 2 * self.style.label_padx)
 
     @property
     def height(self) -> float:
@@ -483,7 +629,7 @@ class Label(Widget):
         Return height used by this Label.
         Overwrites Widget method.
         '''
-        return 39
+        return float(self.measure_text(self.text, self.font_key)[1] + 2 * self.style.label_pady)
 
 
 class Entry(Widget):
@@ -529,6 +675,7 @@ class LabelEntry(Widget):
         '''Need custom destroy method as also have a _lbl_widget.'''
         self._lbl_widget.destroy()
         self._widget.destroy()
+        tk.Frame.destroy(self)
 
     def get(self):
         '''Get the value in the Entry box.'''
@@ -589,11 +736,11 @@ class DropDown(Widget):
         self._widget['values'] = dropdown_options
         self.strvar.set('')
 
-    def bind_select(self, command_func, separate_thread: bool=False):
+    def bind_select(self, command_func, separate_thread: bool=False, **options):
         '''
         Shortcut/convenience binding method
         '''
-        self.bind_event('<<ComboboxSelected>>', command_func, separate_thread=separate_thread)
+        return self.bind_event('<<ComboboxSelected>>', command_func, separate_thread=separate_thread, **options)
 
 
 class ListBox(Widget):
@@ -616,50 +763,405 @@ class Table(Widget):
                        border: bool=False, copyable: bool=False, **kwargs) -> None:
         '''
         type can be 'label' or 'entry'
+        Cell values live in a data.ColumnStore ("store" attribute) which is kept in sync with the cells:
+        table[row, col] reads from it (no Tk call) and edits typed into entry cells are captured into it
+        through variable traces.  See to_list, to_numpy and dirty_cells.
         '''
         super().__init__(master=master, **kwargs)
         self.widget_name = widget_name
         self.type = type
-        self.rows = rows
-        self.column = columns
+        self.border = border
+        self.copyable = copyable
         self.grid_area = kwargs.get('grid_area')
         # self.kwargs = kwargs
         # kwargs = clean_kwargs(kwargs, ['grid_area'])
-
+        self._gridded = False  # True once grid_cells has been called (new cells then need gridding themselves)
+        self.header_rows = 0  # rows at the top kept in place by sort_by/filter (1 after set_data with a header)
+        self._display_rows = None  # {table row: grid row or None if filtered out} while sorted/filtered
+        self._index = (None, None)  # (store revision, data.SortFilterIndex)
+
+        # One Tcl flag and one Python command serve the variable traces of every cell
+        self._writing_flag = f'easy_gui_table_writing_{id(self)}'  # set while the Table itself writes cells so traces skip them
+        self.tk.globalsetvar(self._writing_flag, 0)
+        self._trace_command = self.register(self._on_cell_write)
+        self._cell_by_var = {}  # {Tcl variable name: cell}
+
+        self.rows, self.column = rows, columns
         self.cells = {row: {col: None for col in range(1, columns+1)} for row in range(1, rows+1)}
         self.cell_list = []  # another reference to the same cell objects in list form for easier access in some cases
         for row in range(1, rows+1):
             for col in range(1, columns+1):
-                if self.type == 'label':
-                    new_cell = Label(master=self, borderwidth=(1 if border else 0), relief='solid', copyable=copyable)  # self is a tk.Frame
-                    new_cell.set(f'Cell [{row}, {col}]')
-                elif self.type == 'entry':
-                    new_cell = Entry(master=self)  # self is a tk.Frame
-                new_cell.row = row
-                new_cell.column = col
+                new_cell = self._new_cell(row, col, text=f'Cell [{row}, {col}]')
                 self.cells[row][col] = new_cell
                 self.cell_list.append(new_cell)
-
+        self.store = data.ColumnStore()
+        self.store.load([[f'Cell [{row}, {col}]' if self.type == 'label' else '' for row in range(1, rows+1)] for col in range(1, columns+1)])
+        self._trace_cells(self.cell_list)
+
+    def _new_cell(self, row: int, col: int, text: str=''):
+        if self.type == 'label':
+            new_cell = Label(master=self, text=text, borderwidth=(1 if self.border else 0), relief='solid', copyable=self.copyable)  # self is a tk.Frame
+        elif self.type == 'entry':
+            new_cell = Entry(master=self)  # self is a tk.Frame
+        new_cell.row = row
+        new_cell.column = col
+        return new_cell
+
+    def _trace_cells(self, cells) -> None:
+        '''Add write traces to the variables of cells (with one Tcl call for all of them).'''
+        names = []
+        for cell in cells:
+            self._cell_by_var[str(cell.strvar)] = cell
+            names.append(str(cell.strvar))
+        if names:
+            self.tk.call('apply', ('names flag command', 'foreach name $names {trace add variable ::$name write '
+                                   '[list apply {{flag command n1 n2 op} {if {![set ::$flag]} {$command $n1}}} $flag $command]}'),
+                         tuple(names), self._writing_flag, self._trace_command)
+
+    def _on_cell_write(self, name: str) -> None:
+        '''Variable trace callback: copy a cell edited outside the Table's own writes (ex: typed into an entry) into the store.'''
+        cell = self._cell_by_var.get(name[2:] if name.startswith('::') else name)
+        if cell is not None:
+            self.store.set(cell.row-1, cell.column-1, self.tk.globalgetvar(str(cell.strvar)))
 
     def grid_cells(self):
+        self._gridded = True
+        display_rows = self._display_rows or {}
         for cell in self.cell_list:
-            cell._widget.grid(row=cell.row-1, column=cell.column-1, sticky='NSEW')
+            grid_row = display_rows.get(cell.row, cell.row-1)
+            if grid_row is None:
+                cell._widget.grid_remove()
+            else:
+                cell._widget.grid(row=grid_row, column=cell.column-1, sticky='NSEW')
+
+    def resize(self, rows: int, columns: int) -> None:
+        '''
+        Add (blank) or remove cells so the Table has "rows" rows and "columns" columns.
+        Inside a "with section.batch():" block, positioning of new cells waits until the block exits.
+        '''
+        if self._display_rows is not None:  # sorting/filtering doesn't survive a change of shape
+            self._display_rows = None
+            self._index = (None, None)
+            if self._gridded:
+                self.grid_cells()
+        new_cells = []
+        for row in range(1, rows+1):
+            row_cells = self.cells.setdefault(row, {})
+            for col in range(1, columns+1):
+                if col not in row_cells:
+                    row_cells[col] = self._new_cell(row, col)
+                    new_cells.append(row_cells[col])
+            for col in [col for col in row_cells if col > columns]:
+                self._remove_cell(row_cells.pop(col))
+        for row in [row for row in self.cells if row > rows]:
+            for cell in self.cells.pop(row).values():
+                self._remove_cell(cell)
+        self.rows, self.column = rows, columns
+        self.cell_list = [cell for row in sorted(self.cells) for _, cell in sorted(self.cells[row].items())]
+        self.store.resize(rows, columns)
+        self._trace_cells(new_cells)
+
+        if new_cells and self._gridded:
+            if self.root._layout_depth:
+                self.root.mark_dirty(self)  # positioning this Table again grids every cell
+            else:
+                for cell in new_cells:
+                    cell._widget.grid(row=cell.row-1, column=cell.column-1, sticky='NSEW')
+
+    def _remove_cell(self, cell) -> None:
+        self._cell_by_var.pop(str(cell.strvar), None)
+        cell.destroy()
+
+    def set_data(self, values, formats=None, header=False) -> None:
+        '''
+        Replace the contents of the Table with a 2-D block of values (resizing it to fit).
+        "values" can be nested row sequences, a 2-D NumPy array or a pandas DataFrame.
+        "formats" gives one format per column (see data.format_columns) as a list or a dict keyed
+        by 0-based column position or DataFrame column name.  Ex: formats={'Price': ',.2f', 2: '{:.1%}'}
+        With header=True a DataFrame's column names are shown in the first row (or pass a list of names).
+        Values are formatted a column at a time and written to the cells in one Tcl call.
+        The store keeps the unformatted values and they become the clean baseline for dirty_cells.
+        '''
+        columns, names = data.to_columns(values)
+        text = data.format_columns(columns, formats, names)
+        self.header_rows = 0
+        if header:
+            header_names = names if header is True else [str(name) for name in header]
+            if header_names is None:
+                print('\n--- Table.set_data header=True needs a DataFrame (or pass a list of column names) ---')
+            else:
+                text = [[name] + column for name, column in zip(header_names, text)]
+                columns = [[name] + column for name, column in zip(header_names, columns)]
+                self.header_rows = 1
+        self.resize(len(text[0]) if text else 0, len(text))
+        self.store.load(columns)
+        self._write_block(1, 1, text)
+        if self.header_rows and self.type == 'label':  # click a header to sort by its column
+            for col, cell in self.cells[1].items():
+                cell._widget.bind('<Button-1>', lambda event, col=col: self.sort_by(col))
+
+    def update_range(self, row: int, column: int, values, formats=None) -> None:
+        '''
+        Write a 2-D block of values (nested rows, NumPy array or DataFrame) with its top-left at table[row, column],
+        growing the Table if the block goes past its edge.  See set_data for "formats".
+        '''
+        columns, names = data.to_columns(values)
+        text = data.format_columns(columns, formats, names)
+        if not text:
+            return
+        self.resize(max(self.rows, row + len(text[0]) - 1), max(self.column, column + len(text) - 1))
+        self.store.set_block(row-1, column-1, columns)
+        self._write_block(row, column, text)
+
+    def _write_block(self, row: int, column: int, text_columns: List[List[str]]) -> None:
+        '''
+        Set the variables of a block of cells with a single Tcl call rather than one StringVar.set per cell
+        (with the writing flag set so the cell traces don't copy the text back into the store).
+        Label cells' text is recorded as Label.set does, so their measured sizes stay current.
+        '''
+        pairs = []
+        labels = self.type == 'label'
+        for j, texts in enumerate(text_columns):
+            col_cells = column + j
+            for i, text in enumerate(texts):
+                cell = self.cells[row + i][col_cells]
+                pairs.append(str(cell.strvar))
+                pairs.append(text)
+                if labels:
+                    cell._text_changed(text)
+        if pairs:
+            self.tk.call('apply', ('flag pairs', 'set ::$flag 1; foreach {name value} $pairs {set ::$name $value}; set ::$flag 0'),
+                         self._writing_flag, tuple(pairs))
+            self._invalidate_parent_size()
+
+    @property
+    def sort_index(self) -> data.SortFilterIndex:
+        '''Sort keys and filter of the rows below the header rows (rebuilt once the values change).'''
+        revision, index = self._index
+        if revision != self.store.revision:
+            previous = index
+            index = data.SortFilterIndex([column[self.header_rows:] for column in self.store.columns])
+            if previous is not None:  # keep the sort/filter settings when re-applying to edited values
+                index.sort_column, index.descending, index.mask = previous.sort_column, previous.descending, previous.mask
+                if index.mask is not None and len(index.mask) != index.rows:
+                    index.mask = None
+            self._index = (self.store.revision, index)
+        return index
+
+    def sort_by(self, column, descending=None) -> None:
+        '''
+        Sort the rows (below any header row) by a column given by number (1-based like table[row, col]) or header text.
+        descending=None sorts ascending unless already sorted ascending by this column (like clicking a header).
+        Cells are moved to their new grid rows (one Tcl call) rather than rewritten, so table[row, col] still
+        refers to the same values.  Values edited after sorting are re-sorted on the next sort_by call.
+        '''
+        if isinstance(column, str):
+            if not self.header_rows:
+                raise ValueError(f'Table has no header row, so sort by column number rather than "{column}"')
+            headers = [self.store.get(0, col) for col in range(self.column)]
+            if column not in headers:
+                raise ValueError(f'"{column}" is not a header of this Table (headers: {headers})')
+            column = headers.index(column) + 1
+        index = self.sort_index
+        if descending is None:
+            descending = index.sort_column == column - 1 and not index.descending
+        index.sort(column - 1, descending)
+        self._apply_order()
+
+    def filter(self, predicate=None, text: str=None, columns=None) -> None:
+        '''
+        Only show rows for which predicate(row) is true (row is a tuple of the row's values) and/or which contain
+        "text" (case-insensitive) in any of "columns" (1-based numbers; all by default).  Header rows always show.
+        '''
+        positions = None if columns is None else [column - 1 for column in columns]
+        self.sort_index.set_filter(predicate, text, positions)
+        self._apply_order()
+
+    def clear_filter(self) -> None:
+        self.filter()
+
+    def _apply_order(self) -> None:
+        '''Move the rows of cells to their display positions, only re-gridding rows which moved.'''
+        header_rows = self.header_rows
+        display_rows = {row: row - 1 for row in range(1, header_rows + 1)}
+        for position, row in enumerate(self.sort_index.order()):
+            display_rows[header_rows + row + 1] = header_rows + position
+        for row in range(1, self.rows + 1):
+            display_rows.setdefault(row, None)  # filtered out
+        previous, self._display_rows = self._display_rows or {row: row - 1 for row in range(1, self.rows + 1)}, display_rows
+        if not self._gridded:
+            return  # grid_cells uses the display rows once the Table is positioned
+
+        moves, hidden = [], []
+        for row, grid_row in display_rows.items():
+            if grid_row == previous.get(row):
+                continue
+            widgets = [str(cell._widget) for _, cell in sorted(self.cells[row].items())]
+            if grid_row is None:
+                hidden.extend(widgets)
+            else:
+                moves.append(grid_row)
+                moves.append(tuple(widgets))
+        self.tk.call('apply', ('moves hidden', 'foreach {row widgets} $moves {set column 0\n'
+                                               '    foreach widget $widgets {grid configure $widget -row $row -column $column -sticky nsew; incr column}}\n'
+                                               'if {[llength $hidden]} {grid remove {*}$hidden}'), tuple(moves), tuple(hidden))
+
+    def to_list(self) -> List[list]:
+        '''Copy of all cell values as a list of row lists (read from the store, not from Tk).'''
+        return self.store.to_list()
+
+    def to_numpy(self, dtype=None):
+        '''Copy of all cell values as a 2-D NumPy array (requires NumPy).'''
+        return self.store.to_numpy(dtype)
+
+    def dirty_cells(self) -> List[tuple]:
+        '''
+        (row, column) Table indices (1-based like table[row, col]) of cells changed since set_data
+        or the last clear_dirty call, whether typed by the user or set in code.
+        '''
+        return [(row + 1, col + 1) for row, col in self.store.dirty_cells()]
+
+    def clear_dirty(self) -> None:
+        self.store.clear_dirty()
 
     def __getitem__(self, indices):
+        '''
+        Text of a cell (a str, as set with table[row, col] = value or typed into an entry cell),
+        or the unformatted value given to set_data/update_range.
+        '''
         row, column = indices
-        return self.cells[row][column].get()
+        if not (1 <= row <= self.rows and 1 <= column <= self.column):
+            raise KeyError(indices)
+        return self.store.get(row-1, column-1)
 
     def __setitem__(self, indices, value):
         row, column = indices
-        self.cells[row][column].set(value)
+        self.cells[row][column]  # KeyError for a cell outside the Table
+        text = str(value)  # same as setting the cell's StringVar
+        self.store.set(row-1, column-1, text)
+        self._write_block(row, column, [[text]])
 
     def destroy(self):
         for cell in self.cell_list:
             cell.destroy()
+        tk.Frame.destroy(self)
+
+
+class VirtualTable(Widget):
+    '''
+    Table of rows from a Python-side data model: any sequence of row sequences (ex: a list of a million tuples).
+    Only "height" rows of cell widgets are ever created and scrolling re-fills those same cells
+    with the rows that came into view, so the number of Tk objects doesn't depend on the number of rows.
+    Cells are plain tk.Labels (no StringVar) and a cell is only reconfigured if its text changed.
+    '''
+    def __init__(self, master=None, data=None, headers=None, height: int=20, column_width=12, border: bool=False, **kwargs) -> None:
+        super().__init__(master=master, **kwargs)
+        kwargs = clean_kwargs(kwargs, ['grid_area'])
+        self.data = data if data is not None else []
+        self.headers = list(headers) if headers is not None else None
+        self.rows = height
+        if self.headers is not None:
+            self.columns = len(self.headers)
+        else:
+            self.columns = len(self.data[0]) if len(self.data) else 1
+        self.top_row = 0  # index in data of the row shown in the first line of cells
+        self._widget = tk.Frame(self, bg=self.style.widget_bg_color)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.root.style_registry.register(self._widget, bg='widget_bg_color')
+
+        # Every cell shares one bind tag so scrolling is bound once for the whole table
+        self._bind_tag = f'easy_gui_virtualtable_{id(self)}'
+        self._widget.bind_class(self._bind_tag, '<MouseWheel>', lambda event: self.scroll(-3 if event.delta > 0 else 3))
+        self._widget.bind_class(self._bind_tag, '<Button-4>', lambda event: self.scroll(-3))  # mouse wheel on Linux
+        self._widget.bind_class(self._bind_tag, '<Button-5>', lambda event: self.scroll(3))
+
+        widths = column_width if isinstance(column_width, (list, tuple)) else [column_width] * self.columns
+        def new_cell(grid_row, col, font_key):
+            cell = tk.Label(self._widget, bg=self.style.widget_bg_color, fg=self.style.text_color, font=getattr(self.style, font_key),
+                            width=widths[col], anchor='w', borderwidth=(1 if border else 0), relief='solid', **kwargs)
+            self.root.style_registry.register(cell, bg='widget_bg_color', fg='text_color', font=font_key)
+            cell.bindtags((self._bind_tag,) + cell.bindtags())
+            cell.grid(row=grid_row, column=col, sticky='NSEW')
+            return cell
+
+        first_row = 0
+        if self.headers is not None:
+            for col, header in enumerate(self.headers):
+                new_cell(0, col, 'font_bold').configure(text=header)
+            first_row = 1
+        self.cells = [[new_cell(first_row + row, col, 'font') for col in range(self.columns)] for row in range(self.rows)]
+        self._cell_text = [[''] * self.columns for _ in range(self.rows)]  # text currently shown in each cell
+        self.render()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def set_data(self, data) -> None:
+        '''Show a new data model (the cells are kept and re-filled).'''
+        self.data = data
+        self.scroll_to(self.top_row)
+
+    def visible_rows(self) -> list:
+        '''Rows of the data model currently in view.'''
+        stop = min(self.top_row + self.rows, len(self.data))
+        try:
+            return list(self.data[self.top_row:stop])
+        except TypeError:  # model without slicing support
+            return [self.data[i] for i in range(self.top_row, stop)]
+
+    def render(self) -> None:
+        '''Fill the cells with the visible rows, only touching cells whose text changed.'''
+        rows = self.visible_rows()
+        empty = ('',) * self.columns
+        for cells, shown, row in zip(self.cells, self._cell_text, rows + [empty] * (self.rows - len(rows))):
+            for col in range(self.columns):
+                text = str(row[col]) if col < len(row) else ''
+                if shown[col] != text:
+                    cells[col].configure(text=text)
+                    shown[col] = text
+        total = max(len(self.data), 1)
+        self.scrollbar.set(self.top_row / total, min(1.0, (self.top_row + self.rows) / total))
+
+    def scroll_to(self, row: int) -> None:
+        '''Show the view starting at (0-based) row number "row" of the data model.'''
+        self.top_row = max(0, min(int(row), len(self.data) - self.rows))
+        self.render()
+
+    def scroll(self, rows: int) -> None:
+        self.scroll_to(self.top_row + rows)
+
+    def _on_scrollbar(self, action, amount, unit=None) -> None:
+        '''Translate ttk.Scrollbar commands ("moveto fraction" or "scroll n units/pages") into row numbers.'''
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.data))
+        elif action == 'scroll':
+            self.scroll(int(amount) * (self.rows if unit == 'pages' else 1))
+
+    def cell_position(self, cell: tk.Label) -> tuple:
+        '''(data row index, column) shown by a cell widget (ex: event.widget in a click callback), or None.'''
+        for row, cells in enumerate(self.cells):
+            if cell in cells and self.top_row + row < len(self.data):
+                return self.top_row + row, cells.index(cell)
+        return None
+
+    def bind_click(self, command_func, separate_thread: bool=False, **options):
+        '''
+        Bind a left-mouse click on any cell to trigger "command_func" (use cell_position(event.widget) to see which).
+        See bind_event for the other options.
+        '''
+        callback = self.root.make_callback(command_func, separate_thread, **options)
+        self._widget.bind_class(self._bind_tag, '<Button-1>', callback, add='+')
+        return callback if isinstance(callback, tasks.RateLimiter) else None
+
+    bind_select = bind_click
 
 
 class Tree(Widget):
-    def __init__(self, master=None, tree_col_header: str='Name', height: int=30, tree_col_width: int=120, **kwargs) -> None:
+    def __init__(self, master=None, tree_col_header: str='Name', height: int=30, tree_col_width: int=120, sortable: bool=True, **kwargs) -> None:
+        '''
+        With sortable=True, clicking a column heading sorts by that column (clicking again reverses it).
+        Sorting and filtering (see sort_by and filter) work on the rows added with insert_row.
+        '''
         super().__init__(master=master, **kwargs)
 
         kwargs = clean_kwargs(kwargs, ['grid_area'])
@@ -670,6 +1172,17 @@ class Tree(Widget):
         self.scrollbar.configure(command=self._widget.yview)
         self._widget.configure(yscrollcommand=self.scrollbar.set)
 
+        # Python-side model of the rows (in insertion order) used for sorting and filtering
+        self.sortable = sortable
+        self._row_ids = []
+        self._row_values = []  # (text, *values) of each row
+        self._row_parent = {}  # {row id: parent row id ('' for top level)}
+        self._revision = 0  # incremented when rows or columns change
+        self._index = (None, None)  # (revision, data.SortFilterIndex over the rows)
+        self._filter = None  # (predicate, text, column positions) of the active filter, re-run on new rows
+        self._reorder_id = None  # after_idle id of re-applying the sort/filter to newly inserted rows
+        self._rebuild_columns()  # heading of the tree column
+
 
     @property
     def current_row(self) -> dict:
@@ -705,6 +1218,11 @@ class Tree(Widget):
         self._widget.heading('#0', text=self.tree_col_header, anchor=tk.W)
         for col in self.column_definitions[1:]:
             self._widget.heading(col['column_name'], text=col['column_name'], anchor=tk.W)
+        if self.sortable:
+            for col in self.column_definitions:
+                self._widget.heading(col['column_name'], command=lambda name=col['column_name']: self.sort_by(name))
+        self._revision += 1
+        self._update_sort_headings()
 
     def insert_row(self, text, values=('',), parent_row=None, open=False):
         '''
@@ -714,18 +1232,128 @@ class Tree(Widget):
             new_row = self._widget.insert('', 'end', text=text, values=values, open=open)
         else:
             new_row = self._widget.insert(parent_row, 'end', text=text, values=values, open=open)
+        self._row_ids.append(new_row)
+        self._row_values.append((text,) + tuple(values))
+        self._row_parent[new_row] = parent_row or ''
+        self._revision += 1
+        index = self._index[1]
+        if self._reorder_id is None and (self._filter is not None or (index is not None and index.sort_column is not None)):
+            self._reorder_id = self.after_idle(self._reorder)  # once for a whole batch of inserted rows
         return new_row
 
+    def _reorder(self) -> None:
+        '''Put rows inserted since the last sort/filter in their sorted place (or hide them) too.'''
+        self._reorder_id = None
+        self._apply_order()
+
+    def destroy(self):
+        if self._reorder_id is not None:
+            self.after_cancel(self._reorder_id)
+        super().destroy()
+
     def clear(self) -> None:
         '''
-        Clear all items from the tree.
+        Clear all items from the tree.  The sort column and direction are kept for rows added later.
         '''
+        if self._filter is not None:
+            self.clear_filter()  # re-attach filtered out (detached) rows so they are deleted too
         self._widget.delete(*self._widget.get_children())
+        self._row_ids, self._row_values, self._row_parent = [], [], {}
+        self._revision += 1
 
-    def bind_select(self, command_func, separate_thread=False):
+    def _column_position(self, column) -> int:
+        '''Position (0 for the tree column) of a column given by name, heading text or position.'''
+        if isinstance(column, int):
+            return column
+        if column == self.tree_col_header:
+            return 0
+        return [col['column_name'] for col in self.column_definitions].index(column)
+
+    @property
+    def sort_index(self) -> data.SortFilterIndex:
+        '''Sort keys and filter of the rows (rebuilt once rows or columns change, keeping the sort and filter).'''
+        revision, index = self._index
+        if revision != self._revision:
+            previous = index
+            columns, _ = data.to_columns(self._row_values)
+            columns += [[''] * len(self._row_values) for _ in range(len(self.column_definitions) - len(columns))]
+            index = data.SortFilterIndex(columns)
+            if previous is not None:
+                index.sort_column, index.descending = previous.sort_column, previous.descending
+            if self._filter is not None:
+                index.set_filter(*self._filter)
+            self._index = (self._revision, index)
+        return index
+
+    def sort_by(self, column, descending=None) -> None:
+        '''
+        Sort rows (among their siblings) by a column given by name or position (0 is the tree column).
+        descending=None sorts ascending unless already sorted ascending by this column (like clicking a heading).
+        Items are moved into place rather than re-inserted.
+        '''
+        index = self.sort_index
+        position = self._column_position(column)
+        if descending is None:
+            descending = index.sort_column == position and not index.descending
+        index.sort(position, descending)
+        self._apply_order()
+        self._update_sort_headings()
+
+    def filter(self, predicate=None, text: str=None, columns=None) -> None:
+        '''
+        Only show rows for which predicate(row) is true (row is a tuple of the text followed by the values)
+        and/or which contain "text" (case-insensitive) in any of "columns" (names or positions; all by default).
+        Parents of shown rows stay visible.  Hidden rows are detached, not deleted, so clear_filter brings them back.
+        '''
+        positions = None if columns is None else [self._column_position(column) for column in columns]
+        self.sort_index.set_filter(predicate, text, positions)
+        self._filter = None if self.sort_index.mask is None else (predicate, text, positions)
+        self._apply_order()
+
+    def clear_filter(self) -> None:
+        self.filter()
+
+    def _apply_order(self) -> None:
+        '''Re-link every parent's children in display order with one Tcl call (ttk "children" moves/detaches items).'''
+        index = self.sort_index
+        row_ids, parents = self._row_ids, self._row_parent
+        if index.mask is None:
+            visible = None
+        else:
+            visible = {row_ids[row] for row in index.order()}
+            for row_id in list(visible):  # keep the parents of shown rows
+                parent = parents[row_id]
+                while parent and parent not in visible:
+                    visible.add(parent)
+                    parent = parents[parent]
+        rows = range(index.rows) if index.sort_column is None else index.sorted_rows(index.sort_column, index.descending)
+        children = {'': []}
+        children.update((row_id, []) for row_id in set(parents.values()))
+        for row in rows:
+            row_id = row_ids[row]
+            if visible is None or row_id in visible:
+                children[parents[row_id]].append(row_id)
+        pairs = []
+        for parent, kids in children.items():
+            pairs.append(parent)
+            pairs.append(tuple(kids))
+        self._widget.tk.call('apply', ('tree pairs', 'foreach {parent kids} $pairs {$tree children $parent $kids}'), self._widget, tuple(pairs))
+
+    def _update_sort_headings(self) -> None:
+        '''Show an arrow on the heading of the sorted column.'''
+        index = self._index[1]
+        for position, col in enumerate(self.column_definitions):
+            text = self.tree_col_header if position == 0 else col['column_name']
+            if index is not None and index.sort_column == position:
+                text += ' \u25BC' if index.descending else ' \u25B2'
+            self._widget.heading(col['column_name'], text=text)
+
+    def bind_select(self, command_func, separate_thread=False, separate_process: bool=False, on_result=None, **options):
         '''
         Shortcut/convenience binding method
         '''
+        # only changes coroutine or separate_process functions (which can't be wrapped in the closure below)
+        command_func = self.root.make_callback(command_func, separate_process=separate_process, on_result=on_result)
         def command_func_with_tree_reselect(*args):
             command_func()
             # NEXT LINE NECESSARY to allow refocusing on tree due to odd Matplotlib behavior/bug?
@@ -733,15 +1361,20 @@ class Tree(Widget):
             self.root.update()
             self._widget.focus_set()  # want to refocus/keep focus on tree if lost it during command_func
 
-        self.bind_event('<<TreeviewSelect>>', command_func_with_tree_reselect, separate_thread=separate_thread)
+        return self.bind_event('<<TreeviewSelect>>', command_func_with_tree_reselect, separate_thread=separate_thread, **options)
 
 
 class Slider(Widget):
     def __init__(self, master=None, min=0, max=100, start=None, resolution=5, tickinterval=25, length=10, hz_or_vt='vt',
-                      command_func=None, **kwargs) -> None:
+                      command_func=None, debounce_ms=None, throttle_ms=None, latest_only: bool=False, **kwargs) -> None:
         super().__init__(master=master, **kwargs)
         kwargs = clean_kwargs(kwargs, ['grid_area'])
         orient = 'horizontal' if hz_or_vt.lower() == 'hz' else 'vertical'
+        self.limiter = None  # tasks.RateLimiter of command_func if debounce_ms, throttle_ms or latest_only are used
+        if command_func is not None:
+            command_func = self.root.make_callback(command_func, debounce_ms=debounce_ms, throttle_ms=throttle_ms, latest_only=latest_only)
+            if isinstance(command_func, tasks.RateLimiter):
+                self.limiter = command_func
         self._widget = tk.Scale(master, from_=min, to=max, resolution=resolution, tickinterval=tickinterval, orient=orient,
                                         length=length, command=command_func, **kwargs)
         if start:
@@ -797,20 +1430,18 @@ class MatplotlibPlot(Widget):
                 print('\nCaution!  Plot Matplotlib Figure with width >=4 to prevent unstable chart width.')
                 self.small_figure_warning_given = True  # used to only print warning once
 
-    def bind_event(self, event: str, command_func, separate_thread: bool=False) -> None:
+    def bind_event(self, event: str, command_func, separate_thread: bool=False, **options):
         '''
         Custom bind_event method as need to intercept/store these and bind them AFTER every call to draw_plot.
         '''
-        self.bindings.append((event, command_func, separate_thread))
+        # wrap once so a separate_thread/separate_process/rate limited binding keeps its state across redraws
+        callback = self.root.make_callback(command_func, separate_thread, **options)
+        self.bindings.append((event, callback, False))
+        return callback if isinstance(callback, tasks.RateLimiter) else None
 
     def reset_bindings(self):
-        for event, command_func, separate_thread in self.bindings:
-            if separate_thread:
-                def threaded_command_func(*args):
-                    threading.Thread(target=command_func).start()
-                self.fig_canvas._tkcanvas.bind(event, threaded_command_func, add='+')
-            else:
-                self.fig_canvas._tkcanvas.bind(event, command_func, add='+')
+        for event, command_func, _ in self.bindings:  # separate_thread functions were already wrapped in bind_event
+            self.fig_canvas._tkcanvas.bind(event, command_func, add='+')
 
     def __repr__(self):
         return f'MatplotlibPlot Widget: {self.widget_name} which belongs to: {self.section}'
@@ -838,35 +1469,334 @@ class ProgressBar(Widget):
 
 
 class ScrolledText(Widget):
-    def __init__(self, master=None, **kwargs) -> None:
+    '''
+    Multi-line text box with a scrollbar.
+    Edits are tracked (whether typed or made through tkinter calls) by proxying the Text widget's
+    Tcl command, so callbacks can poll line_count/get_lines/changes_since without re-reading the whole text.
+    '''
+    def __init__(self, master=None, history: int=1000, **kwargs) -> None:
         super().__init__(master=master, **kwargs)
         kwargs = clean_kwargs(kwargs, ['grid_area'])
         self._widget = tk.scrolledtext.ScrolledText(master, wrap=tk.WORD, **kwargs)
+        self.revision = 0  # incremented on every insert/delete/replace
+        self._changes = deque(maxlen=history)  # (revision, first line, last line or None if lines after it shifted)
+        self._lines_cache = (None, None)  # (revision, result of get())
+        self._loading = None  # after id of an in-progress load_file
+
+        # Put a Python proxy in place of the Text widget's Tcl command (the same approach idlelib uses)
+        self._tcl_name = str(self._widget)
+        self._tcl_original = self._tcl_name + '_easy_gui_original'
+        self._widget.tk.call('rename', self._tcl_name, self._tcl_original)
+        self._widget.tk.createcommand(self._tcl_name, self._proxy)
+        self._widget.bind('<Destroy>', self._remove_proxy, add='+')
+
+    def _proxy(self, *args):
+        '''Run a Text widget subcommand, recording which lines insert/delete/replace calls change.'''
+        call = self._widget.tk.call
+        operation = args[0] if args else None
+        if operation not in ('insert', 'delete', 'replace'):
+            return call((self._tcl_original,) + args)
+        line_of = lambda index: int(str(call(self._tcl_original, 'index', index)).split('.')[0])
+        lines_before = line_of('end-1c')
+        first_line = line_of(args[1]) - 1  # indices resolved before the edit (ex: "sel.first" is gone after a delete)
+        last_line = line_of(args[2]) if operation != 'insert' and len(args) > 2 else first_line + 1
+        result = call((self._tcl_original,) + args)
+        if line_of('end-1c') != lines_before:
+            last_line = None  # every later line moved
+        self.revision += 1
+        self._changes.append((self.revision, first_line, last_line))
+        return result
+
+    def _remove_proxy(self, event=None) -> None:
+        if event is not None and event.widget is not self._widget:
+            return
+        try:
+            self._widget.tk.deletecommand(self._tcl_name)
+        except _tkinter.TclError:
+            pass
 
     def get(self) -> List[str]:
         '''Return the lines of text in this widget'''
-        return list(self._widget.get(1.0, tk.END).split('\n'))
+        revision, lines = self._lines_cache
+        if revision != self.revision:  # only re-read the text if it has been edited
+            lines = self._widget.get(1.0, tk.END).split('\n')
+            self._lines_cache = (self.revision, lines)
+        return list(lines)
+
+    def line_count(self) -> int:
+        '''Number of lines of text (from the Text widget's index of the last character).'''
+        return int(self._widget.index('end-1c').split('.')[0])
+
+    def get_lines(self, start: int=0, stop=None) -> List[str]:
+        '''Return lines[start:stop] (0-based, like slicing a list) reading only that range of the Text widget.'''
+        count = self.line_count()
+        stop = count if stop is None else min(stop, count)
+        if start >= stop:
+            return []
+        return self._widget.get(f'{start + 1}.0', f'{stop}.end').split('\n')
+
+    def changes_since(self, token: int):
+        '''
+        Return (new token, changed ranges) where each range is a (start, stop) pair of 0-based line numbers
+        (stop is None if all lines from start on may have changed, ex: after inserting a new line).
+        Pass 0 or the token from the previous call.  Example polling loop:
+
+        self.token, ranges = editor.changes_since(self.token)
+        for start, stop in ranges:
+            refresh_report(editor.get_lines(start, stop))
+        '''
+        if token >= self.revision:
+            return self.revision, []
+        if not self._changes or self._changes[0][0] > token + 1:  # history doesn't go back that far
+            return self.revision, [(0, None)]
+        ranges = []
+        for revision, first, last in self._changes:
+            if revision <= token:
+                continue
+            ranges.append((first, last))
+        ranges.sort(key=lambda r: r[0])
+        merged = [ranges[0]]
+        for start, stop in ranges[1:]:
+            last_start, last_stop = merged[-1]
+            if last_stop is None or start <= last_stop:
+                merged[-1] = (last_start, None if last_stop is None or stop is None else max(last_stop, stop))
+            else:
+                merged.append((start, stop))
+        return self.revision, merged
+
+    def load_file(self, path: str, chunk_size: int=1024 * 1024, encoding: str='utf-8', on_done=None) -> None:
+        '''
+        Replace the text with a file's contents, inserting "chunk_size" characters per idle callback
+        so the window stays responsive while a large file streams in.  on_done() is called once loaded.
+        '''
+        self.cancel_load()
+        self._widget.delete('1.0', tk.END)
+        self._load_file = open(path, 'r', encoding=encoding, errors='replace')
+        def load_chunk():
+            chunk = self._load_file.read(chunk_size)
+            if chunk:
+                self._widget.insert('end-1c', chunk)
+                self._loading = self._widget.after_idle(load_chunk)
+            else:
+                self.cancel_load()
+                if on_done is not None:
+                    on_done()
+        self._loading = self._widget.after_idle(load_chunk)
+
+    @property
+    def loading(self) -> bool:
+        return self._loading is not None
+
+    def cancel_load(self) -> None:
+        '''Stop an in-progress load_file (text loaded so far is kept).'''
+        if self._loading is not None:
+            self._widget.after_cancel(self._loading)
+            self._loading = None
+            self._load_file.close()
 
 
 class StdOutBox(Widget):
-    def __init__(self, master=None, height: int=10, width: int=30, **kwargs) -> None:
+    '''
+    Text box showing everything printed.
+    "capture" is which of 'stdout', 'stderr' or 'both' to show (None for only redirected output, see redirect
+    and capture_logger).  Several boxes can capture the same stream and the original sys.stdout/sys.stderr are
+    restored once no box is capturing.  "tee" is a file path (or open file) to also write captured output to.
+    Printed text is buffered and added to the box in one insert per frame (via the root window's
+    UI queue, so printing from separate_thread callbacks is fine).  Only the last "max_lines" lines
+    are kept (None to keep everything) and the box only scrolls to new output if already at the bottom.
+    '''
+    def __init__(self, master=None, height: int=10, width: int=30, max_lines=10000, capture='stdout', tee=None, **kwargs) -> None:
         super().__init__(master=master, **kwargs)
         kwargs = clean_kwargs(kwargs, ['grid_area'])
         self._widget = tk.Text(master, wrap='word', height=height, width=width, **kwargs)
-        sys.stdout = self
+        self.max_lines = max_lines
+        self._buffer = deque()  # text written since the last flush to the Text widget
+        self._flush_pending = False
+        self._log_handlers = []  # (logger, handler) added by capture_logger
+        self._tee_file, self._owns_tee = None, False
+        if capture:
+            capture_module.add_sink(self, capture)
+            if tee is not None:
+                self._owns_tee = isinstance(tee, str)
+                self._tee_file = open(tee, 'a', encoding='utf-8') if self._owns_tee else tee
+                capture_module.tee(self._tee_file, capture)
+        self._widget.bind('<Destroy>', lambda event: self.release(), add='+')
+
+    def redirect(self, thread=None, streams='both'):
+        '''
+        Context manager sending output printed by one thread (current thread by default) only to this box.
+        Example of a separate_thread job printing into its own box:
+
+        def run_job(self):
+            with self.job_box.redirect():
+                print('Only shows up in job_box')
+        '''
+        return capture_module.redirect(self, streams=streams, thread=thread)
+
+    def capture_logger(self, logger='', level=logging.INFO, fmt: str='%(asctime)s %(levelname)s %(name)s: %(message)s'):
+        '''Show records of a logger (name or logging.Logger; root logger by default) in this box.'''
+        if isinstance(logger, str):
+            logger = logging.getLogger(logger)
+        handler = capture_module.SinkHandler(self, level)
+        handler.setFormatter(logging.Formatter(fmt))
+        logger.addHandler(handler)
+        if logger.level == logging.NOTSET or logger.level > level:
+            logger.setLevel(level)
+        self._log_handlers.append((logger, handler))
+        return handler
+
+    def release(self) -> None:
+        '''Stop capturing output (called automatically when the box is destroyed).'''
+        capture_module.remove(self)
+        for logger, handler in self._log_handlers:
+            logger.removeHandler(handler)
+        self._log_handlers = []
+        if self._tee_file is not None:
+            capture_module.remove(self._tee_file)
+            if self._owns_tee:
+                self._tee_file.close()
+            self._tee_file = None
 
     def write(self, s):
         '''Write printed text to text box on a new line'''
-        self._widget.insert(tk.END, s)
-        self._widget.see(tk.END)
+        self._buffer.append(s)  # deque.append is thread-safe; no tkinter calls here
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.post(self._flush_buffer, coalesce=True)
+        return len(s)
 
     def flush(self):
         '''
         Method must be implemented for stdout replacement.
         Makes self a "file-like object."
+        (Buffered text is added to the box on the next frame.)
         '''
         pass
 
+    def _flush_buffer(self) -> None:
+        '''Move all buffered text into the Text widget with a single insert (runs on the Tk thread).'''
+        self._flush_pending = False
+        if not self._widget.winfo_exists():
+            self._buffer.clear()
+            return
+        chunks = []
+        while self._buffer:
+            chunks.append(self._buffer.popleft())
+        if not chunks:
+            return
+        text = ''.join(chunks)
+        if self.max_lines and text.count('\n') > self.max_lines:  # don't insert lines that would be trimmed right away
+            text = '\n'.join(text.split('\n')[-(self.max_lines + 1):])
+
+        at_bottom = self._widget.yview()[1] >= 0.999  # don't pull the view down if user scrolled up to read
+        self._widget.insert(tk.END, text)
+        if self.max_lines:
+            line_count = int(self._widget.index('end-1c').split('.')[0])
+            if line_count > self.max_lines:
+                self._widget.delete('1.0', f'{line_count - self.max_lines + 1}.0')
+        if at_bottom:
+            self._widget.see(tk.END)
+
+
+class LogViewer(Widget):
+    '''
+    Read-only viewer for (possibly huge and growing) text files such as job logs.
+    The file is memory-mapped and indexed a chunk at a time in idle callbacks (see data.LineIndex),
+    and only the visible "height" lines are ever put in the Text widget, so memory use stays
+    flat no matter the file size and scrolling to any line takes constant time.
+    With follow=True the file is checked for new lines every "poll_ms" and the view stays at the
+    end (like "tail -f") until the user scrolls up; scrolling back to the end resumes following.
+    '''
+    def __init__(self, master=None, path: str=None, height: int=30, width: int=100, follow: bool=False, poll_ms: int=500, **kwargs) -> None:
+        super().__init__(master=master, **kwargs)
+        kwargs = clean_kwargs(kwargs, ['grid_area'])
+        self._widget = tk.Text(self, wrap='none', height=height, width=width, **kwargs)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.rows = height
+        self.follow = follow
+        self._can_follow = follow  # scrolling only pauses/resumes following if it was asked for
+        self.poll_ms = poll_ms
+        self.top_line = 0  # (0-based) line number shown at the top of the view
+        self.index = None  # data.LineIndex of the open file
+        self._indexing = None  # after id of the incremental indexing callback
+        self._polling = None  # after id of the follow poll
+        self._widget.bind('<MouseWheel>', lambda event: self.scroll(-3 if event.delta > 0 else 3), add='+')
+        self._widget.bind('<Button-4>', lambda event: self.scroll(-3), add='+')  # mouse wheel on Linux
+        self._widget.bind('<Button-5>', lambda event: self.scroll(3), add='+')
+        self._widget.bind('<Destroy>', lambda event: self.close_file(), add='+')
+        if path is not None:
+            self.open(path)
+
+    def open(self, path: str) -> None:
+        '''Show a file (indexing continues in the background while it is being viewed).'''
+        self.close_file()
+        self.index = data.LineIndex(path)
+        self.top_line = 0
+        self._index_step()
+        if self.poll_ms:
+            self._polling = self.after(self.poll_ms, self._poll)
+
+    def close_file(self) -> None:
+        for after_id in (self._indexing, self._polling):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._indexing = self._polling = None
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+
+    @property
+    def line_count(self) -> int:
+        return self.index.line_count() if self.index is not None else 0
+
+    def scroll_to(self, line: int) -> None:
+        '''Show the view starting at (0-based) line number "line".'''
+        last_top = max(0, self.line_count - self.rows)
+        self.top_line = max(0, min(int(line), last_top))
+        if self._can_follow:
+            self.follow = self.top_line == last_top and self._polling is not None  # at the end of a polled file means following
+        self.render()
+
+    def scroll(self, lines: int) -> None:
+        self.scroll_to(self.top_line + lines)
+
+    def _on_scrollbar(self, action, amount, unit=None) -> None:
+        '''Translate ttk.Scrollbar commands ("moveto fraction" or "scroll n units/pages") into line numbers.'''
+        if action == 'moveto':
+            self.scroll_to(float(amount) * self.line_count)
+        elif action == 'scroll':
+            self.scroll(int(amount) * (self.rows if unit == 'pages' else 1))
+
+    def render(self) -> None:
+        '''Replace the Text contents with just the visible lines and update the scrollbar.'''
+        lines = self.index.get_lines(self.top_line, self.rows) if self.index is not None else []
+        self._widget.configure(state='normal')
+        self._widget.delete('1.0', tk.END)
+        self._widget.insert('1.0', '\n'.join(lines))
+        self._widget.configure(state='disabled')
+        total = max(self.line_count, 1)
+        self.scrollbar.set(self.top_line / total, min(1.0, (self.top_line + self.rows) / total))
+
+    def _index_step(self) -> None:
+        '''Index the next chunk of the file, then re-render and come back when idle if there is more.'''
+        self._indexing = None
+        if self.index is None:
+            return
+        more = self.index.index_more()
+        if self.follow:
+            self.top_line = max(0, self.line_count - self.rows)
+        self.render()
+        if more:
+            self._indexing = self.after(1, self._index_step)  # let pending events run between chunks
+
+    def _poll(self) -> None:
+        self._polling = None
+        if self.index is None:
+            return
+        if self.index.refresh() and self._indexing is None:
+            self._index_step()
+        self._polling = self.after(self.poll_ms, self._poll)
+
 
 class DatePicker(Widget):
     '''
@@ -973,3 +1903,4 @@ class DatePicker(Widget):
     def destroy(self):
         for lbl in self.day_labels:
             lbl.destroy()
+        tk.Frame.destroy(self)
@@ -0,0 +1,87 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import asyncio
+import socket
+import time
+import tkinter as tk
+from easy_gui import aio
+
+
+
+def run_tcl(interp, seconds):
+    '''Process Tcl events for "seconds" (stands in for EasyGUI's mainloop without needing a display).'''
+    done = []
+    interp.after(int(seconds * 1000), lambda: done.append(True))
+    while not done:
+        interp.tk.dooneevent()
+
+
+
+class TestAsyncioBridge(unittest.TestCase):
+    def setUp(self):
+        self.interp = tk.Tcl()
+        self.bridge = aio.AsyncioBridge(self.interp)
+        self.bridge.start()
+
+    def tearDown(self):
+        self.bridge.stop()
+
+    def test_ui_latency_with_pending_coroutines(self):
+        async def waiting():
+            await asyncio.sleep(60)
+        for _ in range(1000):
+            self.bridge.create_task(waiting())
+        latencies = []
+        def ui_event():  # like a click handler queued on the Tk thread
+            queued = time.perf_counter()
+            self.interp.after_idle(lambda: latencies.append(time.perf_counter() - queued))
+        for delay in range(50, 250, 20):
+            self.interp.after(delay, ui_event)
+        run_tcl(self.interp, 0.3)
+        print(f'\nUI event latency with 1,000 pending coroutines: max {max(latencies) * 1000:.2f} ms')
+        self.assertEqual(len(latencies), 10)
+        self.assertLess(max(latencies), 0.02)
+
+    def test_io_does_not_block_and_no_busy_polling(self):
+        results = {}
+        ours, theirs = socket.socketpair()
+        async def read_line():
+            reader, writer = await asyncio.open_connection(sock=ours)
+            results['line'] = await reader.readline()
+            writer.close()
+        self.bridge.create_task(read_line())
+        ticks = []
+        for delay in range(0, 200, 10):  # Tk keeps running while the coroutine awaits the socket
+            self.interp.after(delay, lambda: ticks.append(True))
+        self.interp.after(200, lambda: theirs.send(b'hello\n'))
+        run_tcl(self.interp, 0.3)
+        theirs.close()
+        self.assertEqual(results['line'], b'hello\n')
+        self.assertEqual(len(ticks), 20)
+
+        if not self.bridge.polling:  # asyncio loop is only stepped when it has something to do
+            steps = self.bridge.steps
+            run_tcl(self.interp, 0.3)
+            self.assertEqual(self.bridge.steps, steps)
+
+    def test_timers_and_stop(self):
+        fired = []
+        async def later():
+            await asyncio.sleep(0.05)
+            fired.append(time.perf_counter())
+        start = time.perf_counter()
+        self.bridge.create_task(later())
+        forever = self.bridge.create_task(asyncio.sleep(60))
+        run_tcl(self.interp, 0.15)
+        self.assertEqual(len(fired), 1)
+        self.assertGreaterEqual(fired[0] - start, 0.045)
+        self.bridge.stop()
+        self.assertTrue(forever.cancelled())
+        self.assertTrue(self.bridge.loop.is_closed())
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,35 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''1,000-field form where every widget is auto-placed in a new row.'''
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        form = self.add_section('form')
+        for i in range(1000):
+            form.add_widget('labelentry', text=f'Field {i}')
+        self.after(10, self.finish)
+
+    def finish(self):
+        self.startup_time = time.perf_counter() - self.start_time
+        self.close()
+
+
+
+class TestAutoLayoutStartup(unittest.TestCase):
+    def test_startup_time(self):
+        gui = GUI()
+        print(f'\n1,000-field auto-layout form started in {gui.startup_time:.2f} seconds')
+        self.assertEqual(len(gui.sections['form'].grid_configuration), 1000)
+        self.assertLess(gui.startup_time, 20)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,42 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+
+
+
+class GUI(easy_gui.EasyGUI):
+    def __init__(self):
+        self.panel = self.add_section('panel')
+        self.add_widget('btn', 'Rebuild Panel', command_func=self.rebuild)
+        self.unpositioned_during_batch = None
+        self.positioned_after_batch = None
+        self.after(10, self.run_checks)
+
+    def rebuild(self, *args):
+        with self.panel.batch():
+            self.panel.delete_all_widgets()
+            for i in range(200):
+                self.panel.add_widget('lbl', f'Label {i}')
+            nested = self.panel.add_section('nested')
+            nested.add_widget('lbl', 'Nested Label')
+            self.unpositioned_during_batch = all(w._widget.winfo_manager() == '' for w in self.panel.widgets.values())
+        self.positioned_after_batch = all(w._widget.winfo_manager() == 'grid' for w in self.panel.widgets.values())
+
+    def run_checks(self):
+        self.rebuild()
+        self.close()
+
+
+
+class TestBatch(unittest.TestCase):
+    def test_layout_deferred_until_exit(self):
+        gui = GUI()
+        self.assertTrue(gui.unpositioned_during_batch)
+        self.assertTrue(gui.positioned_after_batch)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
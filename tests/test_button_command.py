@@ -0,0 +1,42 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Buttons and CanvasButtons created with a command_func (plain, threaded and rate limited), then clicked.
+    '''
+    def __init__(self):
+        self.clicks = []
+        self.btn = self.add_widget('btn', 'Plain', command_func=lambda event: self.clicks.append('plain'))
+        self.add_widget('btn', 'Threaded', command_func=lambda *args: None, separate_thread=True, thread_policy='drop')
+        self.limited_btn = self.add_widget('btn', 'Limited', command_func=lambda event: self.clicks.append('limited'), debounce_ms=20)
+        self.canvas_btn = self.add_widget('canvasbutton', 'Canvas', command_func=lambda event: self.clicks.append('canvas'), throttle_ms=50)
+        self.add_widget('datepicker')  # builds its own Buttons
+        self.after(50, self.click)
+
+    def click(self):
+        self.update()
+        self.btn._widget.event_generate('<Button-1>', x=2, y=2)
+        self.limited_btn._widget.event_generate('<Button-1>', x=2, y=2)
+        self.limited_btn._widget.event_generate('<Button-1>', x=2, y=2)
+        self.after(100, self.close)
+
+
+
+class TestButtonCommand(unittest.TestCase):
+    def test_buttons_with_command_func(self):
+        gui = GUI()
+        self.assertIsNone(gui.btn.limiter)
+        self.assertIsNotNone(gui.limited_btn.limiter)
+        self.assertIsNotNone(gui.canvas_btn.limiter)
+        self.assertEqual(gui.clicks, ['plain', 'limited'])  # two quick clicks debounced into one call
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,98 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import io
+import logging
+import threading
+from easy_gui import capture
+
+
+
+class Sink():
+    '''Stands in for a StdOutBox (write just has to be thread-safe).'''
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, s):
+        self.chunks.append(s)
+
+    @property
+    def text(self):
+        return ''.join(self.chunks)
+
+
+
+class TestCapture(unittest.TestCase):
+    def setUp(self):
+        self.original_stdout, self.original_stderr = sys.stdout, sys.stderr
+
+    def tearDown(self):
+        for router in capture.routers.values():  # make sure nothing leaks into other tests
+            for target in router.sinks + router.tees:
+                capture.remove(target)
+        sys.stdout, sys.stderr = self.original_stdout, self.original_stderr
+
+    def test_fan_out_and_restore(self):
+        first, second = Sink(), Sink()
+        capture.add_sink(first)
+        capture.add_sink(second)  # second box no longer steals the output from the first
+        print('hello')
+        self.assertEqual(first.text, 'hello\n')
+        self.assertEqual(second.text, 'hello\n')
+        capture.remove(first)
+        self.assertIs(sys.stdout, capture.routers['stdout'])
+        capture.remove(second)
+        self.assertIs(sys.stdout, self.original_stdout)
+
+    def test_tee_and_stderr(self):
+        box, log_file = Sink(), io.StringIO()
+        capture.add_sink(box, 'both')
+        capture.tee(log_file, 'both')
+        print('out')
+        print('err', file=sys.stderr)
+        capture.remove(box)
+        capture.remove(log_file)
+        self.assertEqual(box.text, 'out\nerr\n')
+        self.assertEqual(log_file.getvalue(), 'out\nerr\n')
+        self.assertIs(sys.stderr, self.original_stderr)
+
+    def test_per_thread_routing(self):
+        main_box, job_boxes = Sink(), [Sink() for _ in range(4)]
+        capture.add_sink(main_box)
+        def job(number):
+            with capture.redirect(job_boxes[number]):
+                for i in range(200):
+                    print(f'job {number} line {i}')
+        threads = [threading.Thread(target=job, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        print('main thread')
+        for thread in threads:
+            thread.join()
+        self.assertEqual(main_box.text, 'main thread\n')
+        for number, box in enumerate(job_boxes):
+            lines = box.text.splitlines()
+            self.assertEqual(len(lines), 200)
+            self.assertTrue(all(line.startswith(f'job {number} ') for line in lines))
+        self.assertEqual(capture.routers['stdout'].thread_sinks, {})
+
+    def test_logger_routing(self):
+        box = Sink()
+        logger = logging.getLogger('easy_gui_test.job')
+        handler = capture.SinkHandler(box)
+        handler.setFormatter(logging.Formatter('%(name)s: %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        try:
+            logger.info('started')
+            logging.getLogger('easy_gui_test.other').warning('not for this box')
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual(box.text, 'easy_gui_test.job: started\n')
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
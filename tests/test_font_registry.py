@@ -0,0 +1,39 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import styles
+
+
+
+class GUI(easy_gui.EasyGUI):
+    def __init__(self):
+        self.add_widget('lbl', 'Opening and closing 10,000 tooltip popups...')
+        self.after(10, self.open_tooltips)
+
+    def open_tooltips(self):
+        self.fonts_before = styles.font_count()
+        for i in range(10000):
+            with self.popup(tooltip=True, width=100, height=30) as tooltip:
+                tooltip.add_widget('lbl', f'Tooltip {i}')
+            tooltip.destroy()
+        self.fonts_after = styles.font_count()
+        self.shared_font = styles.get_font(self, size=10, weight='normal') is self.style.font
+        self.close()
+
+
+
+class TestFontRegistry(unittest.TestCase):
+    def test_font_count_constant(self):
+        gui = GUI()
+        self.assertEqual(gui.fonts_before, gui.fonts_after)
+        self.assertTrue(gui.shared_font)
+        interp_id = id(gui.tk)
+        self.assertFalse([key for key in styles._font_registry if key[0] == interp_id])  # released by destroy
+        self.assertLessEqual(len(styles._linespace_cache), styles._LINESPACE_CACHE_SIZE)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
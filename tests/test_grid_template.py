@@ -0,0 +1,73 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import time
+from easy_gui import layout
+
+
+
+class TestGridTemplate(unittest.TestCase):
+    def test_areas(self):
+        template = layout.compile_grid(['title   title   output',
+                                        'label1  entry1  output',
+                                        '.       entry2  output'])
+        self.assertEqual(template.row_count, 3)
+        self.assertEqual(template.columns, 3)
+        self.assertEqual(template.areas['title'], {'first_row': 0, 'last_row': 0, 'first_column': 0, 'last_column': 1})
+        self.assertEqual(template.areas['output'], {'first_row': 0, 'last_row': 2, 'first_column': 2, 'last_column': 2})
+        self.assertEqual(template.areas['entry2'], {'first_row': 2, 'last_row': 2, 'first_column': 1, 'last_column': 1})
+        self.assertEqual(template.limits, {'min_row': 0, 'max_row': 2, 'min_col': 0, 'max_col': 2})
+        self.assertNotIn('.', template.areas)
+
+    def test_cached(self):
+        first = layout.compile_grid(['a b', 'c d'])
+        second = layout.compile_grid(['a b', 'c d'])
+        self.assertIs(first, second)
+
+    def test_tables_do_not_share_area_bounds(self):
+        '''Changing one GridTable's areas must not change the cached template or other tables using it.'''
+        first, second = layout.GridTable(), layout.GridTable()
+        first.set_grid_template(['a b', 'c d'])
+        second.set_grid_template(['a b', 'c d'])
+        first.grid_areas['a']['last_row'] = 5
+        first._grid_limits['max_row'] = 5
+        self.assertEqual(second.grid_areas['a']['last_row'], 0)
+        self.assertEqual(second._grid_limits['max_row'], 1)
+        self.assertEqual(layout.compile_grid(['a b', 'c d']).areas['a']['last_row'], 0)
+
+    def test_no_named_areas(self):
+        template = layout.compile_grid(['. ..', '... .'])
+        self.assertEqual(template.areas, {})
+        self.assertIsNone(template.limits)
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            layout.compile_grid(['a b c', 'd e'])
+        with self.assertRaises(ValueError):
+            layout.compile_grid(['a a', 'a b'])  # L-shaped area
+        with self.assertRaises(ValueError):
+            layout.compile_grid(['a b a'])  # split area
+        with self.assertRaises(ValueError):
+            layout.compile_grid([])
+
+    def test_many_areas_linear(self):
+        def build(n):
+            return [' '.join(f'r{row}c{col}' for col in range(n)) for row in range(n)]
+        def compile_time(rows):
+            uncached = layout._compile_grid.__wrapped__  # bypass the cache to time the compile itself
+            times = []
+            for _ in range(5):
+                start = time.perf_counter()
+                template = uncached(tuple(rows))
+                times.append(time.perf_counter() - start)
+            return min(times), template
+        small_time, _ = compile_time(build(20))  # 400 named areas
+        large_time, template = compile_time(build(40))  # 1600 named areas
+        self.assertEqual(len(template.areas), 1600)
+        self.assertLess(large_time, small_time * 12)  # 4x the cells (quadratic would be 16x)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
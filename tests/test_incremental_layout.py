@@ -0,0 +1,43 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Adds widgets from a callback after the GUI is created (like a dashboard adding rows)
+    and records the average cost of each add as the tree grows.
+    '''
+    def __init__(self):
+        self.configure_grid(['panel'])
+        self.panel = self.add_section('panel', grid_area='panel')
+        self.panel.configure_grid(['cell'])
+        self.add_times = []
+        self.after(10, self.grow)
+
+    def grow(self):
+        for _ in range(6):
+            start = time.perf_counter()
+            for _ in range(100):
+                self.panel.add_widget('lbl', 'Row', grid_area='cell')
+            self.add_times.append((time.perf_counter() - start) / 100)
+        self.close()
+
+
+
+class TestIncrementalLayout(unittest.TestCase):
+    def test_per_add_cost_stays_flat(self):
+        gui = GUI()
+        print('\nSeconds per add_widget after 100, 200, ... 600 widgets:')
+        print('  ' + ', '.join(f'{t:.6f}' for t in gui.add_times))
+        # re-creating the whole GUI on each add made this grow linearly with the number of widgets
+        self.assertLess(gui.add_times[-1], gui.add_times[0] * 3)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -2,10 +2,40 @@ import unittest
 import sys
 sys.path.insert(1, '..')
 import easy_gui
+from easy_gui import triggers
+import random
 import time
 
 
 
+def naive_matches(trigger_list, keys):
+    '''Previous approach: substring search of the last 100 keys for every trigger on each key.'''
+    log, matches = [], []
+    for char in keys:
+        log.append(char)
+        log = log[-100:]
+        key_str = ''.join(log)
+        for index, trigger in enumerate(trigger_list):
+            if trigger in key_str:
+                log = []
+                matches.append(index)
+                break
+    return matches
+
+
+def matcher_matches(trigger_list, keys):
+    matcher = triggers.KeyTriggerMatcher()
+    for index, trigger in enumerate(trigger_list):
+        matcher.add(trigger, index)  # action is just the index here
+    matches = []
+    for char in keys:
+        index = matcher.feed(char)
+        if index is not None:
+            matches.append(index)
+    return matches
+
+
+
 class GUI(easy_gui.EasyGUI):
     def __init__(self):
         self.add_widget(type='button', text='Button1', command_func=lambda e: print('Button1 working!'))
@@ -24,11 +54,71 @@ class GUI(easy_gui.EasyGUI):
 
 
 
+class BuiltInTriggerGUI(easy_gui.EasyGUI):
+    '''
+    No key triggers of its own, so only the built-in "closegui" trigger is active.
+    '''
+    def __init__(self):
+        self.add_widget('label', 'Type "closegui" to close')
+        self.after(10, self.type_closegui)
+        self.after(2000, self.close)  # only reached if the trigger failed
+
+    def type_closegui(self):
+        self.keys_bound = bool(self.bind_all('<Key>'))
+        self.started = time.perf_counter()
+        for char in 'closegui':
+            self.key_log.append(char)  # what log_keys does for each key press
+            self.check_key_triggers()  # original no-argument form reads the last logged key
+
+
+
 class TestEasyGUI(unittest.TestCase):
     def test_gui_creation(self):
         GUI()
         self.assertTrue(True)
 
+    def test_closegui_without_user_triggers(self):
+        gui = BuiltInTriggerGUI()
+        self.assertTrue(gui.keys_bound)
+        self.assertLess(time.perf_counter() - gui.started, 1)  # closed by the trigger, not the fallback
+
+
+
+class TestKeyTriggers(unittest.TestCase):
+    def test_overlapping_triggers(self):
+        trigger_list = ['he', 'she', 'hers', 'his', 'closegui']
+        keys = 'ushersxhisclosegclosegui'
+        self.assertEqual(matcher_matches(trigger_list, keys), naive_matches(trigger_list, keys))
+        self.assertEqual(matcher_matches(['she', 'he'], 'she'), [0])  # first added wins when both end on the same key
+        self.assertEqual(matcher_matches(['he', 'she'], 'she'), [0])
+
+    def test_random_against_naive(self):
+        rng = random.Random(7)
+        trigger_list = [''.join(rng.choice('abc') for _ in range(rng.randint(2, 6))) for _ in range(40)]
+        keys = ''.join(rng.choice('abcd') for _ in range(5000))
+        self.assertEqual(matcher_matches(trigger_list, keys), naive_matches(trigger_list, keys))
+
+    def test_empty_trigger(self):
+        with self.assertRaises(ValueError):
+            triggers.KeyTriggerMatcher().add('', lambda: None)
+
+    def test_benchmark_500_triggers(self):
+        rng = random.Random(11)
+        letters = 'abcdefghijklmnopqrstuvwxyz'
+        trigger_list = [''.join(rng.choice(letters) for _ in range(8)) for _ in range(500)]
+        keys = ''.join(rng.choice(letters) for _ in range(5000))
+
+        start = time.perf_counter()
+        expected = naive_matches(trigger_list, keys)
+        naive_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = matcher_matches(trigger_list, keys)
+        matcher_time = time.perf_counter() - start
+
+        print(f'\n5,000 keys with 500 triggers: substring search {naive_time:.4f} s, matcher {matcher_time:.4f} s')
+        self.assertEqual(result, expected)
+        self.assertLess(matcher_time, naive_time / 10)
+
 
 
 
@@ -0,0 +1,86 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import time
+from easy_gui import layout
+
+
+
+def build_form(num_fields):
+    root = layout.SectionNode('root')
+    root.configure_grid(['header  header',
+                         'form    output'])
+    root.add_section('header', grid_area='header').add_widget('Label')
+    form = root.add_section('form', grid_area='form')
+    for _ in range(num_fields):
+        form.add_widget('LabelEntry')
+    root.add_section('output', grid_area='output').add_widget('StdOutBox')
+    return root
+
+
+
+class TestLayoutPlanner(unittest.TestCase):
+    def test_grid_areas_and_spans(self):
+        root = build_form(3)
+        placements = {p.element: p for p in layout.plan_layout(root)}
+        header = placements[root.sections['header']]
+        self.assertEqual(header.kind, 'grid')
+        self.assertEqual(header.grid_kwargs, {'row': 0, 'column': 0, 'rowspan': 1, 'columnspan': 2})
+        self.assertIsNone(header.new_row)
+        self.assertEqual(placements[root.sections['output']].grid_kwargs, {'row': 1, 'column': 1, 'rowspan': 1, 'columnspan': 1})
+
+    def test_auto_rows(self):
+        root = build_form(3)
+        placements = layout.plan_layout(root)
+        form = root.sections['form']
+        fields = [p for p in placements if p.container is form]
+        self.assertEqual([p.grid_area for p in fields], ['LabelEntry', 'LabelEntry1', 'LabelEntry2'])
+        self.assertEqual([p.new_row for p in fields], [0, 1, 2])
+        self.assertEqual(form.grid_configuration, ['LabelEntry', 'LabelEntry1', 'LabelEntry2'])
+
+    def test_missing_area_falls_back_to_new_row(self):
+        root = layout.SectionNode('root')
+        root.configure_grid(['a b'])
+        widget = root.add_widget('Button', grid_area='missing')
+        placement = layout.plan_child(root, widget)
+        self.assertEqual(placement.grid_area, 'Button')
+        self.assertEqual(placement.grid_kwargs, {'row': 1, 'column': 0, 'rowspan': 1, 'columnspan': 2})
+        self.assertEqual((widget.grid_area, root.grid_configuration), ('missing', ['a b']))  # planning changes nothing
+        layout.commit_placement(placement)
+        layout.commit_placement(placement)  # only recorded once
+        self.assertEqual(widget.grid_area, 'Button')
+        self.assertEqual(root.grid_configuration, ['a b', 'Button Button'])
+        self.assertEqual(layout.plan_child(root, root.add_widget('Button')).grid_area, 'Button1')
+
+    def test_widget_names_not_reused_after_delete(self):
+        root = layout.SectionNode('root')
+        first = root.add_widget('Label')
+        root.add_widget('Label')
+        root.delete_widget('1_label')
+        root.add_widget('Label')
+        self.assertEqual(list(root.widgets), ['2_label', '3_label'])
+        self.assertNotIn(first, root.widgets.values())
+
+    def test_force_row(self):
+        root = layout.SectionNode('root')
+        root.configure_grid(['a'])
+        widget = root.add_widget('Label', grid_area='a')
+        self.assertEqual(layout.plan_child(root, widget, force_row=True).new_row, 1)
+
+    def test_plan_cost_is_linear(self):
+        def plan_time(num_fields):
+            root = build_form(num_fields)
+            start = time.perf_counter()
+            placements = layout.plan_layout(root)
+            elapsed = time.perf_counter() - start
+            self.assertEqual(len(placements), num_fields + 5)
+            return elapsed
+        small, large = plan_time(2000), plan_time(20000)
+        print(f'\nPlanned 2,000 fields in {small:.4f}s and 20,000 fields in {large:.4f}s')
+        self.assertLess(large, small * 30)  # 10x the fields (quadratic would be 100x)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,96 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import os
+import tempfile
+import time
+import tracemalloc
+from easy_gui import data
+
+
+
+class TestLineIndex(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'job.log')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, text, mode='a'):
+        with open(self.path, mode, encoding='utf-8') as f:
+            f.write(text)
+
+    def build(self, **kwargs):
+        index = data.LineIndex(self.path, **kwargs)
+        while index.index_more(max_bytes=1000):  # small chunks to exercise lines split across chunks
+            pass
+        return index
+
+    def test_lines_and_partial_last_line(self):
+        self.write(''.join(f'line {i}\n' for i in range(1000)) + 'no newline', 'w')
+        index = self.build(stride=16)
+        self.assertEqual(index.line_count(), 1001)
+        for start in (0, 15, 16, 17, 500, 999):
+            self.assertEqual(index.get_lines(start, 2), [f'line {start}', f'line {start + 1}' if start < 999 else 'no newline'])
+        self.assertEqual(index.get_lines(1000, 5), ['no newline'])
+        self.assertEqual(index.get_lines(2000, 5), [])
+        index.close()
+
+    def test_growing_and_truncated_file(self):
+        self.write('', 'w')
+        index = self.build()
+        self.assertEqual(index.line_count(), 0)
+        self.write('first\r\nsecond\n')
+        self.assertTrue(index.refresh())
+        index.index_more()
+        self.assertEqual(index.get_lines(0, 10), ['first', 'second'])
+        self.assertFalse(index.refresh())
+        self.write('rotated\n', 'w')  # log rotation truncates the file
+        index.refresh()
+        index.index_more()
+        self.assertEqual(index.get_lines(0, 10), ['rotated'])
+        index.close()
+
+    @unittest.skipIf(os.name == 'nt', 'files open in another process can not be renamed on Windows')
+    def test_rotated_by_rename(self):
+        self.write('old 1\nold 2\nold 3\n', 'w')
+        index = self.build()
+        os.replace(self.path, self.path + '.1')  # rotate: rename the log away and start a new (smaller or larger) one
+        self.assertFalse(index.refresh())  # nothing at the path yet so keep showing the old file
+        self.write('new 1\nnew 2\nnew 3\nnew 4\n', 'w')
+        self.assertTrue(index.refresh())
+        index.index_more()
+        self.assertEqual(index.get_lines(0, 10), ['new 1', 'new 2', 'new 3', 'new 4'])
+        index.close()
+
+    def test_constant_time_lookup_and_flat_memory(self):
+        with open(self.path, 'w') as f:
+            for i in range(500_000):
+                f.write(f'2024-01-01 12:00:00 INFO record {i} processed\n')
+        tracemalloc.start()
+        start = time.perf_counter()
+        index = data.LineIndex(self.path)
+        while index.index_more():
+            pass
+        index_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for line in range(0, 500_000, 997):
+            view = index.get_lines(line, 40)  # one screen of lines
+        lookup_time = (time.perf_counter() - start) / len(range(0, 500_000, 997))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = os.path.getsize(self.path)
+        print(f'\n{size / 1e6:.1f} MB indexed in {index_time:.2f} s, {lookup_time * 1e6:.0f} us per 40 line view, '
+              f'index {index.index_bytes / 1e3:.0f} kB, peak Python memory {peak / 1e6:.2f} MB')
+        self.assertEqual(view[0], f'2024-01-01 12:00:00 INFO record {line} processed')
+        self.assertEqual(index.get_lines(499_999, 1), ['2024-01-01 12:00:00 INFO record 499999 processed'])
+        self.assertLess(peak, size / 10)
+        self.assertLess(lookup_time, 0.002)
+        index.close()
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
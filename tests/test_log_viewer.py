@@ -0,0 +1,57 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+import os
+import tempfile
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Follows a 100,000 line log file which keeps growing after it is opened.
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.viewer = self.add_widget('log', path=path, height=20, follow=True, poll_ms=50)
+        self.still_viewer = self.add_widget('log', path=path, height=20, follow=False, poll_ms=50)
+        self.after(500, self.append_lines)
+
+    def append_lines(self):
+        with open(self.path, 'a') as f:
+            f.write('new line 1\nnew line 2\n')
+        self.after(300, self.check)
+
+    def check(self):
+        text = self.viewer._widget
+        self.followed_last_line = text.get('end-1c linestart', 'end-1c')
+        self.line_count = self.viewer.line_count
+        self.viewer.scroll_to(50_000)
+        self.jumped_first_line = text.get('1.0', '1.0 lineend')
+        self.text_lines = int(text.index('end-1c').split('.')[0])
+        self.following_after_jump = self.viewer.follow
+        self.still_viewer.scroll_to(10**9)  # to the end of a viewer opened with follow=False
+        self.still_following = self.still_viewer.follow
+        self.close()
+
+
+
+class TestLogViewer(unittest.TestCase):
+    def test_follow_and_jump(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'job.log')
+            with open(path, 'w') as f:
+                f.writelines(f'log line {i}\n' for i in range(100_000))
+            gui = GUI(path)
+        self.assertEqual(gui.followed_last_line, 'new line 2')
+        self.assertEqual(gui.line_count, 100_002)
+        self.assertEqual(gui.jumped_first_line, 'log line 50000')
+        self.assertEqual(gui.text_lines, 20)  # only the visible lines are ever in the Text widget
+        self.assertFalse(gui.following_after_jump)
+        self.assertFalse(gui.still_following)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
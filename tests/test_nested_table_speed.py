@@ -0,0 +1,64 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import layout
+from easy_gui import master_classes
+
+
+
+class CallCounter():
+    '''Counts Section.parent lookups (walks up the tree) and layout.plan_child calls while active.'''
+    def __init__(self):
+        self.parent_lookups = 0
+        self.layout_calls = 0
+
+    def __enter__(self):
+        self.parent_property = master_classes.Section.parent
+        self.plan_child = layout.plan_child
+        def counting_parent(section):
+            self.parent_lookups += 1
+            return self.parent_property.fget(section)
+        def counting_plan_child(*args, **kwargs):
+            self.layout_calls += 1
+            return self.plan_child(*args, **kwargs)
+        master_classes.Section.parent = property(counting_parent, self.parent_property.fset)
+        layout.plan_child = counting_plan_child
+        return self
+
+    def __exit__(self, *args):
+        master_classes.Section.parent = self.parent_property
+        layout.plan_child = self.plan_child
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''Builds the same Table directly in a top level Section and 10 Sections deep, counting the work each one does.'''
+    def __init__(self):
+        shallow = self.add_section('shallow')
+        deep = self
+        for depth in range(10):
+            deep = deep.add_section(f'depth{depth}')
+
+        self.counts = {}
+        self.tables = {}
+        for name, section in (('shallow', shallow), ('deep', deep)):
+            with CallCounter() as counter:
+                self.tables[name] = section.add_widget('table', rows=20, columns=10, border=True)
+            self.counts[name] = (counter.parent_lookups, counter.layout_calls)
+        self.after(10, self.close)
+
+
+
+class TestNestedTableSpeed(unittest.TestCase):
+    def test_depth_does_not_slow_construction(self):
+        gui = GUI()
+        self.assertEqual(gui.counts['deep'], gui.counts['shallow'])  # no walking up the 10 ancestors (root is cached)
+        self.assertIs(gui.tables['deep'].root, gui)
+        self.assertIs(gui.tables['deep'].cell_list[-1].root, gui)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
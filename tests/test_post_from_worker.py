@@ -0,0 +1,44 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import threading
+import time
+import easy_gui
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    A worker thread updates a Label through post() both before mainloop starts and while it runs.
+    '''
+    def __init__(self):
+        self.label = self.add_widget('label', 'Waiting')
+        self.tk_thread = threading.get_ident()
+        self.posted_threads = []
+        self.worker = threading.Thread(target=self.work)
+        self.worker.start()  # starts posting before new_init reaches mainloop
+        self.after(500, self.close)
+
+    def update_label(self, i):
+        self.posted_threads.append(threading.get_ident())
+        self.label.set(f'Update {i}')
+
+    def work(self):
+        for i in range(50):
+            self.post(self.update_label, i)
+            time.sleep(0.005)
+
+
+
+class TestPostFromWorker(unittest.TestCase):
+    def test_posts_before_and_during_mainloop(self):
+        gui = GUI()
+        gui.worker.join()
+        self.assertEqual(len(gui.posted_threads), 50)
+        self.assertEqual(set(gui.posted_threads), {gui.tk_thread})
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,96 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import threading
+import time
+from easy_gui import tasks
+
+
+
+def sum_of_squares(n):
+    return sum(i * i for i in range(n))
+
+
+def slow_square(x, seconds=0.2):
+    time.sleep(seconds)
+    return x * x
+
+
+def fail():
+    raise ValueError('bad input')
+
+
+
+class Delivery():
+    '''Stands in for EasyGUI.post by recording calls and running them on the test thread.'''
+    def __init__(self):
+        self.calls = []
+        self.arrived = threading.Event()
+
+    def __call__(self, func, *args):
+        self.calls.append((func, args))
+        self.arrived.set()
+
+    def run_all(self):
+        for func, args in self.calls:
+            func(*args)
+
+
+
+class TestProcessRunner(unittest.TestCase):
+    def test_result_routed_to_continuation(self):
+        delivery = Delivery()
+        runner = tasks.ProcessRunner(delivery, max_workers=2)
+        results = []
+        try:
+            runner.submit(sum_of_squares, 100_000, on_result=results.append).result(timeout=30)
+            self.assertTrue(delivery.arrived.wait(5))
+            self.assertEqual(results, [])  # nothing runs until the Tk thread drains the delivered calls
+            delivery.run_all()
+            self.assertEqual(results, [sum_of_squares(100_000)])
+        finally:
+            runner.shutdown()
+
+    def test_stale_jobs_cancelled_or_discarded(self):
+        delivery = Delivery()
+        runner = tasks.ProcessRunner(delivery, max_workers=1)
+        results = []
+        try:
+            futures = [runner.submit(slow_square, x, on_result=results.append, key='tree_select') for x in range(1, 5)]
+            futures[-1].result(timeout=30)
+            time.sleep(0.1)
+            delivery.run_all()
+            self.assertEqual(results, [16])  # only the latest selection's result reaches the GUI
+            stats = runner.stats()
+            self.assertEqual(stats['cancelled'] + stats['stale'], 3)
+            self.assertGreaterEqual(stats['cancelled'], 1)
+        finally:
+            runner.shutdown()
+
+    def test_errors_reported_on_gui_thread(self):
+        delivery = Delivery()
+        runner = tasks.ProcessRunner(delivery, max_workers=1)
+        try:
+            with self.assertRaises(ValueError):
+                runner.submit(fail).result(timeout=30)
+            self.assertTrue(delivery.arrived.wait(5))
+            self.assertEqual(delivery.calls[0][1][0], fail)
+            self.assertEqual(runner.stats()['failed'], 1)
+        finally:
+            runner.shutdown()
+
+    def test_no_new_pool_after_shutdown(self):
+        '''A debounced/rate limited binding firing after the window closed mustn't start a pool nothing will shut down.'''
+        runner = tasks.ProcessRunner(Delivery(), max_workers=1)
+        runner.submit(sum_of_squares, 10).result(timeout=30)
+        runner.shutdown()
+        self.assertIsNone(runner.submit(sum_of_squares, 10))
+        runner.wrap(time.time)()  # like a binding's callback
+        self.assertIsNone(runner._executor)
+        self.assertEqual(runner.stats()['dropped'], 2)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,84 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import time
+import tkinter as tk
+from easy_gui import tasks
+
+
+
+def run_tcl(interp, seconds):
+    '''Process Tcl events for "seconds" (stands in for EasyGUI's mainloop without needing a display).'''
+    done = []
+    interp.after(int(seconds * 1000), lambda: done.append(True))
+    while not done:
+        interp.tk.dooneevent()
+
+
+def fire_events(interp, limiter, count, every_ms):
+    '''Queue "count" events (like Slider moves) "every_ms" apart, passing the event number.'''
+    for i in range(count):
+        interp.after(i * every_ms, lambda i=i: limiter(i))
+
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.interp = tk.Tcl()
+        self.received = []
+
+    def test_debounce_delivers_last_event_once(self):
+        limiter = tasks.RateLimiter(self.received.append, self.interp, debounce_ms=50)
+        fire_events(self.interp, limiter, 20, 5)
+        run_tcl(self.interp, 0.3)
+        self.assertEqual(self.received, [19])
+        self.assertEqual(limiter.stats(), {'events': 20, 'calls': 1, 'dropped': 19, 'pending': False})
+
+    def test_throttle_leading_and_trailing(self):
+        limiter = tasks.RateLimiter(self.received.append, self.interp, throttle_ms=50)
+        fire_events(self.interp, limiter, 40, 5)  # 200 ms of events
+        run_tcl(self.interp, 0.4)
+        self.assertEqual(self.received[0], 0)  # leading edge runs right away
+        self.assertEqual(self.received[-1], 39)  # trailing edge delivers the latest value
+        self.assertLessEqual(len(self.received), 7)
+        self.assertEqual(limiter.dropped, 40 - len(self.received))
+
+    def test_latest_only_collapses_bursts(self):
+        limiter = tasks.RateLimiter(self.received.append, self.interp, latest_only=True)
+        def burst(start):  # several events handled in the same pass of the event loop
+            for i in range(start, start + 10):
+                limiter(i)
+        self.interp.after(10, lambda: burst(0))
+        self.interp.after(50, lambda: burst(100))
+        run_tcl(self.interp, 0.1)
+        self.assertEqual(self.received, [9, 109])
+        self.assertEqual(limiter.dropped, 18)
+
+    def test_flush_and_cancel(self):
+        limiter = tasks.RateLimiter(self.received.append, self.interp, debounce_ms=1000)
+        limiter('a')
+        limiter.flush()
+        limiter('b')
+        limiter.cancel()
+        run_tcl(self.interp, 0.05)
+        self.assertEqual(self.received, ['a'])
+        with self.assertRaises(ValueError):
+            tasks.RateLimiter(print, self.interp, debounce_ms=10, throttle_ms=10)
+
+    def test_redraw_backlog(self):
+        '''Slow callback (like MatplotlibPlot.draw_plot) fed by a fast slider: throttling bounds the redraws.'''
+        def redraw(value):
+            time.sleep(0.02)
+            self.received.append(value)
+        limiter = tasks.RateLimiter(redraw, self.interp, throttle_ms=100)
+        fire_events(self.interp, limiter, 100, 5)  # 500 ms of slider events
+        run_tcl(self.interp, 0.7)
+        print(f'\n100 slider events -> {limiter.calls} redraws ({limiter.dropped} dropped)')
+        self.assertEqual(self.received[-1], 99)
+        self.assertLess(limiter.calls, 15)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
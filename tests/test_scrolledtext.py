@@ -2,6 +2,9 @@ import unittest
 import sys
 sys.path.insert(1, '..')
 import easy_gui
+import os
+import tempfile
+import time
 
 
 
@@ -14,6 +17,47 @@ class TestGUI(easy_gui.EasyGUI):
 
 
 
+class RangeGUI(easy_gui.EasyGUI):
+    '''
+    Report editor polled through the range-based ScrolledText API, then a large file streamed in.
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.editor = self.add_widget('scrolledtext')
+        self.after(10, self.edit)
+
+    def edit(self):
+        text = self.editor._widget
+        text.insert('1.0', 'line 0\nline 1\nline 2\nline 3')
+        self.token, _ = self.editor.changes_since(0)
+        text.insert('3.0', 'EDITED ')  # same number of lines
+        self.same_line_change = self.editor.changes_since(self.token)
+        self.token = self.same_line_change[0]
+        text.insert('2.0', 'new line\n')  # later lines shift
+        self.shifting_change = self.editor.changes_since(self.token)
+        self.unchanged = self.editor.changes_since(self.shifting_change[0])
+        self.line_count = self.editor.line_count()
+        self.middle_lines = self.editor.get_lines(1, 3)
+        self.full_text = self.editor.get()
+
+        self.ticks = []
+        self.load_start = time.perf_counter()
+        self.editor.load_file(self.path, on_done=self.loaded)
+        self.after(10, self.tick)
+
+    def tick(self):
+        self.ticks.append(time.perf_counter())
+        if self.editor.loading:
+            self.after(10, self.tick)
+
+    def loaded(self):
+        self.load_time = time.perf_counter() - self.load_start
+        self.loaded_lines = self.editor.line_count()
+        self.last_loaded_line = self.editor.get_lines(199_999, 200_000)
+        self.close()
+
+
+
 class TestEasyGUI(unittest.TestCase):
     def test_gui_creation(self):
         gui = TestGUI()
@@ -21,5 +65,26 @@ class TestEasyGUI(unittest.TestCase):
 
 
 
+class TestScrolledText(unittest.TestCase):
+    def test_ranges_and_chunked_load(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'report.txt')
+            with open(path, 'w') as f:
+                f.writelines(f'report line {i}\n' for i in range(200_000))
+            gui = RangeGUI(path)
+        self.assertEqual(gui.same_line_change[1], [(2, 3)])
+        self.assertEqual(gui.shifting_change[1], [(1, None)])
+        self.assertEqual(gui.unchanged[1], [])
+        self.assertEqual(gui.line_count, 5)
+        self.assertEqual(gui.middle_lines, ['new line', 'line 1'])
+        self.assertEqual(gui.full_text[:3], ['line 0', 'new line', 'line 1'])
+        self.assertEqual(gui.loaded_lines, 200_001)  # file ends with a newline so the last line is empty
+        self.assertEqual(gui.last_loaded_line, ['report line 199999'])
+        print(f'\n200,000 line file loaded in {gui.load_time:.2f} s with {len(gui.ticks)} timer ticks during the load')
+        self.assertGreater(len(gui.ticks), 1)  # timer kept firing while the file streamed in
+
+
+
+
 if __name__ == '__main__':
     unittest.main() #buffer=True)
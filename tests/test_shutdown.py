@@ -0,0 +1,32 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import time
+import easy_gui
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Window closed with destroy (what the window manager's close button does) instead of close().
+    '''
+    def __init__(self):
+        self.add_widget('label', 'Workers')
+        self.after(50, lambda: self.workers.submit(time.sleep, 0.01))
+        self.after(50, lambda: self.aio)  # start the asyncio bridge
+        self.after(200, lambda: self.tk.call(self.protocol('WM_DELETE_WINDOW')))  # same callback as clicking the close button
+
+
+
+class TestShutdown(unittest.TestCase):
+    def test_window_close_stops_workers(self):
+        gui = GUI()
+        self.assertTrue(gui.workers._shutdown)
+        self.assertIsNone(gui.processes._executor)
+        self.assertTrue(gui._aio.loop.is_closed())
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,125 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import data
+import random
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    200,000 row Tree sorted (by heading click and by code) and filtered, plus a small sorted/filtered Table.
+    '''
+    def __init__(self):
+        self.tree = self.add_widget('tree', tree_col_header='Part')
+        self.tree.insert_column('Price')
+        self.tree.insert_column('Supplier')
+        random.seed(1)
+        for i in range(200_000):
+            self.tree.insert_row(f'part {i}', (f'{random.random() * 1000:.2f}', random.choice(['Acme', 'Bolt Co', 'Cogs'])))
+        self.table = self.add_widget('table', rows=1, columns=1)
+        self.table.set_data([[3, 'c'], [1, 'a'], [2, 'b']], header=['Number', 'Letter'])
+        self.plain_table = self.add_widget('table', rows=2, columns=2)
+        self.after(10, self.sort_and_filter)
+
+    def sort_and_filter(self):
+        widget = self.tree._widget
+        start = time.perf_counter()
+        self.tree.sort_by('Price')  # same as clicking the heading
+        self.first_sort_time = time.perf_counter() - start
+        self.ascending = [float(widget.set(row_id, 'Price')) for row_id in widget.get_children()[:1000]]
+
+        start = time.perf_counter()
+        self.tree.sort_by('Price')  # click again to reverse
+        self.resort_time = time.perf_counter() - start
+        self.descending = [float(widget.set(row_id, 'Price')) for row_id in widget.get_children()[:1000]]
+        self.heading = widget.heading('Price')['text']
+        self.has_heading_command = bool(widget.heading('Price', 'command'))
+
+        start = time.perf_counter()
+        self.tree.filter(text='acme', columns=['Supplier'])
+        self.filter_time = time.perf_counter() - start
+        self.filtered_suppliers = {widget.set(row_id, 'Supplier') for row_id in widget.get_children()}
+        self.tree.clear_filter()
+        self.unfiltered_count = len(widget.get_children())
+        self.tree.filter(text='acme', columns=['Supplier'])
+        hidden_id = next(row_id for row_id in self.tree._row_ids if widget.set(row_id, 'Supplier') != 'Acme')
+        new_acme = self.tree.insert_row('new part', ('-1', 'Acme'))  # rows added while sorted and filtered
+        new_cogs = self.tree.insert_row('new part 2', ('-2', 'Cogs'))
+        self.update_idletasks()
+        self.new_rows_shown = (new_acme in widget.get_children(), new_cogs in widget.get_children())
+        self.new_acme_last = widget.get_children()[-1] == new_acme  # cheapest part while sorted by Price descending
+        self.still_filtered = self.tree._filter is not None and self.tree.sort_index.sort_column == 1
+        self.tree.clear()
+        self.cleared_hidden_row_exists = widget.exists(hidden_id) or widget.exists(new_cogs)
+
+        self.table.sort_by('Number')
+        self.update_idletasks()
+        self.table_grid_rows = [int(self.table.cells[row][1]._widget.grid_info()['row']) for row in range(1, 5)]
+        self.table.filter(lambda row: row[0] > 1)
+        self.update_idletasks()
+        self.hidden = self.table.cells[3][1]._widget.grid_info() == {}
+        self.table_value = self.table[2, 1]
+        self.plain_table[1, 1] = 'Number'
+        try:
+            self.plain_table.sort_by('Number')  # header text without a header row
+            self.headerless_error = None
+        except ValueError as error:
+            self.headerless_error = str(error)
+        self.close()
+
+
+
+class TestSortFilterIndex(unittest.TestCase):
+    def test_sort_and_filter(self):
+        index = data.SortFilterIndex([['b', 'A', '', 'c'], ['10', '9', '1,000', 'x']])
+        self.assertEqual(index.sort(0), [1, 0, 3, 2])  # case-insensitive with empty cells last
+        self.assertEqual(index.sort(1), [1, 0, 2, 3])  # numbers in numeric order before text
+        self.assertEqual(index.sort(1, descending=True), [3, 2, 0, 1])
+        self.assertEqual(index.set_filter(text='A'), [1])
+        self.assertEqual(index.set_filter(text='0'), [2, 0])  # sorted by column 1 descending then filtered
+        self.assertEqual(index.set_filter(predicate=lambda row: row[1] != 'x', text='c'), [])
+        self.assertEqual(index.set_filter(), [3, 2, 0, 1])
+        self.assertEqual(index.sort(None), [0, 1, 2, 3])
+
+    def test_descending_keeps_empties_last_and_ties_in_order(self):
+        index = data.SortFilterIndex([['b', '', 'a', 'b', None, 'a']])
+        self.assertEqual(index.sort(0), [2, 5, 0, 3, 1, 4])
+        self.assertEqual(index.sort(0, descending=True), [0, 3, 2, 5, 1, 4])
+
+    def test_nan_text_not_sorted_as_number(self):
+        '''float() parses 'nan' so the all-numbers fast path must fall back to sort_key (NaN keys break sorting).'''
+        self.assertEqual(data.sort_keys(['2', '1', 'inf']), [2.0, 1.0, float('inf')])
+        index = data.SortFilterIndex([['2', 'nan', '1', '3', 'NaN', '-nan']])
+        self.assertEqual(index.sort(0), [2, 0, 3, 1, 4, 5])  # 'nan' is text, '-nan' an empty cell
+        self.assertEqual(index.sort(0, descending=True), [1, 4, 3, 0, 2, 5])
+
+
+
+class TestSortFilter(unittest.TestCase):
+    def test_tree_and_table(self):
+        gui = GUI()
+        print(f'\n200,000 row Tree: first sort {gui.first_sort_time:.3f} s, re-sort {gui.resort_time:.3f} s, filter {gui.filter_time:.3f} s')
+        self.assertEqual(gui.ascending, sorted(gui.ascending))
+        self.assertEqual(gui.descending, sorted(gui.descending, reverse=True))
+        self.assertTrue(gui.heading.startswith('Price '))
+        self.assertTrue(gui.has_heading_command)
+        self.assertEqual(gui.filtered_suppliers, {'Acme'})
+        self.assertEqual(gui.unfiltered_count, 200_000)
+        self.assertFalse(gui.cleared_hidden_row_exists)  # filtered out (detached) rows are deleted by clear too
+        self.assertEqual(gui.new_rows_shown, (True, False))  # inserted rows get the active filter...
+        self.assertTrue(gui.new_acme_last)  # ...and the active sort
+        self.assertTrue(gui.still_filtered)  # ...and the sort/filter settings survive the insert
+        self.assertLess(gui.resort_time, 1.0)
+        self.assertEqual(gui.table_grid_rows, [0, 3, 1, 2])  # header stays on top; 3, 1, 2 sorted to 1, 2, 3
+        self.assertTrue(gui.hidden)
+        self.assertEqual(gui.table_value, 3)  # table[row, col] still refers to the same (unsorted) cell
+        self.assertIn('no header row', gui.headerless_error)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,58 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+import threading
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    A chatty background job prints 50,000 lines into a capped StdOutBox
+    while a timer on the Tk thread records how responsive the GUI stays.
+    '''
+    def __init__(self):
+        self.output = self.add_widget('stdout', max_lines=1000)
+        self.tick_gaps = []
+        self.after(10, self.start_job)
+
+    def start_job(self):
+        self.job_done = threading.Event()
+        self.start = time.perf_counter()
+        threading.Thread(target=self.chatty_job).start()
+        self.last_tick = time.perf_counter()
+        self.after(10, self.tick)
+
+    def chatty_job(self):
+        for i in range(50_000):
+            print(f'Processing record {i}')
+        self.job_done.set()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.tick_gaps.append(now - self.last_tick)
+        self.last_tick = now
+        if self.job_done.is_set() and not self.output._buffer and not self.output._flush_pending:
+            self.elapsed = now - self.start
+            self.line_count = int(self.output._widget.index('end-1c').split('.')[0])
+            self.last_line = self.output._widget.get('end-2l linestart', 'end-2l lineend')
+            self.close()
+        else:
+            self.after(10, self.tick)
+
+
+
+class TestStdOutBox(unittest.TestCase):
+    def test_throughput_and_cap(self):
+        gui = GUI()
+        print(f'\n50,000 lines in {gui.elapsed:.2f} s ({50_000 / gui.elapsed:,.0f} lines/sec), longest UI stall {max(gui.tick_gaps) * 1000:.0f} ms')
+        self.assertLessEqual(gui.line_count, 1001)
+        self.assertEqual(gui.last_line, 'Processing record 49999')
+        self.assertLess(max(gui.tick_gaps), 0.25)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
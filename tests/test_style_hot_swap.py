@@ -0,0 +1,87 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import styles
+import gc
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    def __init__(self):
+        self.configure_grid(['controls', 'grid'])
+        self.add_widget('btn', 'Switch Theme', grid_area='controls', command_func=self.switch_theme)
+        grid = self.add_section('grid', grid_area='grid')
+        grid.configure_grid([' '.join(f'c{row}_{col}' for col in range(40)) for row in range(50)])
+        self.labels = [grid.add_widget('lbl', str(row * 40 + col), grid_area=f'c{row}_{col}') for row in range(50) for col in range(40)]
+        self.after(10, self.run_checks)
+
+    def switch_theme(self, *args):
+        start = time.perf_counter()
+        self.changed = self.apply_style(styles.DarkStyle())
+        self.switch_time = time.perf_counter() - start
+
+    def run_checks(self):
+        popup = self.popup()
+        popup_label = popup.add_widget('lbl', 'In a popup')
+        self.switch_theme()
+        self.label_bg = self.labels[-1]._widget['bg']
+        self.label_fg = self.labels[-1]._widget['fg']
+        self.popup_label_bg = popup_label._widget['bg']
+
+        registered = len(self.style_registry)
+        grid = self.sections['grid']
+        for name in list(grid.widgets)[:1000]:
+            grid.delete_widget(name)
+        self.labels = self.labels[1000:]
+        gc.collect()
+        self.released = registered - len(self.style_registry)
+        self.close()
+
+
+
+class TestStyleHotSwap(unittest.TestCase):
+    def test_switch_2000_widgets(self):
+        gui = GUI()
+        print(f'\nSwitched 2,000 labels to DarkStyle in {gui.switch_time:.4f} seconds')
+        self.assertEqual(gui.label_bg, '#555')
+        self.assertEqual(gui.label_fg, '#FFF')
+        self.assertIn('text_color', gui.changed)
+        self.assertNotIn('button_color', gui.changed)  # unchanged attributes aren't pushed to widgets
+        self.assertEqual(gui.popup_label_bg, '#555')  # popups follow the window's style
+        self.assertGreaterEqual(gui.released, 1000)  # deleted labels aren't kept alive by the registry
+
+
+
+class Configurable():
+    '''Stands in for a tkinter widget (anything with a configure method) so the registry can be checked headless.'''
+    def __init__(self):
+        self.options = {}
+
+    def configure(self, options):
+        self.options.update(options)
+
+
+
+class TestStyleRegistry(unittest.TestCase):
+    def test_weak_references(self):
+        registry = styles.StyleRegistry()
+        kept, dropped = Configurable(), Configurable()
+        registry.register(kept, bg='widget_bg_color', highlightbackground='widget_bg_color')
+        registry.register(dropped, bg='widget_bg_color')
+        registry.register_callback(dropped.configure, 'widget_bg_color')
+        del dropped
+        gc.collect()
+        self.assertEqual(len(registry), 1)
+        registry.apply(styles.BaseStyle(), styles.DarkStyle())
+        self.assertEqual(kept.options, {'bg': '#555', 'highlightbackground': '#555'})
+        self.assertEqual(registry.callbacks['widget_bg_color'], [])
+        registry.unregister(kept)
+        self.assertEqual(len(registry), 0)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
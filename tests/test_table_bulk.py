@@ -0,0 +1,82 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import data
+import time
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = pd = None
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Fills 10,000 Table cells cell by cell and then with one set_data call.
+    '''
+    def __init__(self):
+        self.values = [[row * col for col in range(100)] for row in range(100)]
+        self.slow_table = self.add_widget('table', rows=100, columns=100)
+        self.fast_table = self.add_widget('table', rows=100, columns=100)
+        self.after(10, self.benchmark)
+
+    def benchmark(self):
+        start = time.perf_counter()
+        for row in range(100):
+            for col in range(100):
+                self.slow_table[row + 1, col + 1] = f'{self.values[row][col]:,.1f}'
+        self.cell_by_cell_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.fast_table.set_data(self.values, formats=[',.1f'] * 100)
+        self.set_data_time = time.perf_counter() - start
+        self.size = (self.fast_table.rows, self.fast_table.column, len(self.fast_table.cell_list))
+        self.last_cell = self.fast_table[100, 100]
+
+        self.fast_table.update_range(100, 101, [['a', 'b'], ['c']])
+        self.grown_size = (self.fast_table.rows, self.fast_table.column)
+        self.block_cells = [self.fast_table[101, 101], self.fast_table[101, 102], self.fast_table[100, 1]]
+        self.close()
+
+
+
+class TestFormatting(unittest.TestCase):
+    def test_to_columns(self):
+        self.assertEqual(data.to_columns([[1, 2], [3, 4]]), ([[1, 3], [2, 4]], None))
+        self.assertEqual(data.to_columns([[1, 2], [3]]), ([[1, 3], [2, '']], None))
+        self.assertEqual(data.to_columns([]), ([], None))
+
+    def test_format_columns(self):
+        columns = [[1234.5, None], [0.25, 0.5], ['x', 'y']]
+        formatted = data.format_columns(columns, {0: ',.2f', 1: '{:.0%}', 2: str.upper})
+        self.assertEqual(formatted, [['1,234.50', 'None'], ['25%', '50%'], ['X', 'Y']])
+        self.assertEqual(data.format_columns(columns, ['.1f']), [['1234.5', 'None'], ['0.25', '0.5'], ['x', 'y']])
+
+    @unittest.skipIf(np is None, 'NumPy and pandas not installed')
+    def test_numpy_and_pandas(self):
+        array = np.arange(6).reshape(2, 3)
+        self.assertEqual(data.to_columns(array), ([[0, 3], [1, 4], [2, 5]], None))
+        frame = pd.DataFrame({'Price': [1.5, 2.0], 'Name': ['a', 'b']})
+        columns, names = data.to_columns(frame)
+        self.assertEqual(names, ['Price', 'Name'])
+        self.assertEqual(data.format_columns(columns, {'Price': '.2f'}, names), [['1.50', '2.00'], ['a', 'b']])
+
+
+
+class TestTableBulkLoad(unittest.TestCase):
+    def test_set_data(self):
+        gui = GUI()
+        print(f'\n10,000 Table cells: {gui.cell_by_cell_time:.3f} s cell by cell vs {gui.set_data_time:.3f} s with set_data')
+        self.assertEqual(gui.size, (100, 100, 10_000))
+        self.assertEqual(gui.last_cell, '9,801.0')
+        self.assertEqual(gui.grown_size, (101, 102))
+        self.assertEqual(gui.block_cells, ['a', 'b', '0.0'])
+        self.assertLess(gui.set_data_time, gui.cell_by_cell_time)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,76 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import data
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Entry Table loaded with 50,000 cells, edited like a user typing, then exported.
+    '''
+    def __init__(self):
+        self.table = self.add_widget('table', type='entry', rows=2, columns=2)
+        self.label_table = self.add_widget('table', rows=2, columns=2)
+        self.after(10, self.edit_and_export)
+
+    def edit_and_export(self):
+        self.table.set_data([[row * 50 + col for col in range(50)] for row in range(1000)])
+        self.table.cells[3][4]._widget.insert(0, '7')  # typed into the entry
+        self.table[10, 10] = 'set in code'
+        self.table[20, 20] = 42
+        self.typed_value = self.table[3, 4]
+        self.set_number = self.table[20, 20]
+        self.label_table[1, 2] = 1.5
+        self.label_table.set_data([['a', 'bb']])
+        self.label_texts = [cell.text for cell in self.label_table.cell_list]
+        self.dirty = self.table.dirty_cells()
+
+        start = time.perf_counter()
+        self.exported = self.table.to_list()
+        self.export_time = time.perf_counter() - start
+        start = time.perf_counter()
+        self.tk_values = [[cell.get() for cell in self.table.cells[row].values()] for row in self.table.cells]
+        self.tk_read_time = time.perf_counter() - start
+        self.table.clear_dirty()
+        self.dirty_after_clear = self.table.dirty_cells()
+        self.close()
+
+
+
+class TestColumnStore(unittest.TestCase):
+    def test_store(self):
+        store = data.ColumnStore(2, 2)
+        store.set_block(0, 1, [['a', 'b']])
+        store.set(1, 0, 5)
+        self.assertEqual(store.to_list(), [['', 'a'], [5, 'b']])
+        self.assertEqual(store.dirty_cells(), [(0, 1), (1, 0), (1, 1)])
+        store.resize(1, 3)
+        self.assertEqual(store.to_list(), [['', 'a', '']])
+        self.assertEqual(store.dirty_cells(), [(0, 1)])
+        store.load([[1, 2], [3, 4]])
+        self.assertEqual((store.shape, store.dirty_cells(), store.get(1, 0)), ((2, 2), [], 2))
+
+
+
+class TestTableStore(unittest.TestCase):
+    def test_edits_and_export(self):
+        gui = GUI()
+        print(f'\n50,000 cell export: {gui.export_time:.4f} s from the store vs {gui.tk_read_time:.4f} s reading each cell from Tk')
+        self.assertEqual(gui.typed_value, '7' + str(2 * 50 + 3))
+        self.assertEqual(gui.dirty, [(3, 4), (10, 10), (20, 20)])
+        self.assertEqual(gui.set_number, '42')  # table[row, col] = value stores text like a cell's StringVar
+        self.assertEqual(gui.label_texts, ['a', 'bb'])  # cell.text (used to measure cells) follows the writes
+        self.assertEqual(gui.exported[9][9], 'set in code')
+        self.assertEqual(gui.exported[999][49], 999 * 50 + 49)
+        self.assertEqual([[str(value) for value in row] for row in gui.exported], gui.tk_values)
+        self.assertEqual(gui.dirty_after_clear, [])
+        self.assertLess(gui.export_time, gui.tk_read_time)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
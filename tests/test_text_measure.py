@@ -0,0 +1,56 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui import styles
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Section of Buttons with equal_button_width along with Labels of differing text lengths.
+    '''
+    def __init__(self):
+        self.configure_grid(['buttons', 'labels'])
+        self.buttons = self.add_section('buttons', equal_button_width=True)
+        self.ok_button = self.buttons.add_widget('btn', 'OK')
+        self.long_button = self.buttons.add_widget('btn', 'A Much Longer Button')
+        self.labels = self.add_section('labels')
+        self.narrow_label = self.labels.add_widget('lbl', 'iiii')
+        self.labels.add_widget('lbl', 'WWWW', bold=True)
+        self.after(10, self.measure)
+
+    def measure(self):
+        self.button_widths = [int(button._widget['width']) for button in self.buttons.widgets.values()]
+        self.label_widths = [label.width for label in self.labels.widgets.values()]
+        self.first_size = self.labels.width, self.labels.height
+        self.cache_reused = self.labels._size_cache is not None
+        self.labels.add_widget('lbl', 'Line 1\nLine 2\nLine 3')
+        self.second_size = self.labels.width, self.labels.height
+        self.narrow_label.set('A much longer label text than before')
+        self.third_size = self.labels.width, self.labels.height
+        self.ok_button.set('A Button Renamed To Something Longer')
+        self.renamed_button = self.ok_button._widget['text'], self.buttons.width, self.long_button.width
+        self.measured_texts = len(styles._measure_cache)
+        self.close()
+
+
+
+class TestTextMeasure(unittest.TestCase):
+    def test_measurement(self):
+        gui = GUI()
+        self.assertEqual(gui.button_widths[0], gui.button_widths[1])
+        self.assertGreaterEqual(gui.button_widths[0], len('A Much Longer Button') // 2)
+        self.assertLess(gui.label_widths[0], gui.label_widths[1])  # same length but "i" is narrower than "W"
+        self.assertTrue(gui.cache_reused)
+        self.assertGreater(gui.second_size[1], gui.first_size[1])  # cache reset after adding a 3 line Label
+        self.assertGreater(gui.measured_texts, 0)
+        self.assertGreater(gui.third_size[0], gui.second_size[0])  # cache reset by Label.set
+        self.assertEqual(gui.renamed_button[0], 'A Button Renamed To Something Longer')
+        self.assertGreater(gui.renamed_button[1], gui.renamed_button[2])  # cache reset by Button.set
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,49 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+from easy_gui.widgets import Tooltip
+
+
+
+class GUI(easy_gui.EasyGUI):
+    def __init__(self):
+        sec = self.add_section('dense_form')
+        self.labels = []
+        for i in range(50):
+            label = sec.add_widget('lbl', f'Label {i}')
+            label.add_tooltip(f'Tooltip for label {i}\nwith a second line')
+            self.labels.append(label)
+        self.after(10, self.hover_everything)
+
+    def hover_everything(self):
+        tooltip = Tooltip.of(self)
+        self.toplevels_before = len(self.winfo_children())
+        for _ in range(20):  # mouse sweeping across the whole form repeatedly
+            for label in self.labels:
+                tooltip.schedule(label, label.tooltip_text, 1000)
+                tooltip.show(label, label.tooltip_text)
+                tooltip.hide(label)
+        self.toplevels_after = len(self.winfo_children())
+        self.same_tooltip = Tooltip.of(self) is tooltip
+        self.pending_after_hide = tooltip._pending
+        tooltip.schedule(self.labels[0], 'Never shown', 1000)
+        tooltip.hide(self.labels[0])
+        self.pending_after_cancel = tooltip._pending
+        self.close()
+
+
+
+class TestTooltipPool(unittest.TestCase):
+    def test_single_reused_window(self):
+        gui = GUI()
+        self.assertEqual(gui.toplevels_before, gui.toplevels_after)
+        self.assertTrue(gui.same_tooltip)
+        self.assertIsNone(gui.pending_after_hide)
+        self.assertIsNone(gui.pending_after_cancel)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,165 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import threading
+import time
+import tkinter as tk
+from easy_gui import tasks
+
+
+
+def run_tcl(interp, seconds):
+    '''Process Tcl events for "seconds" (stands in for EasyGUI's mainloop without needing a display).'''
+    done = []
+    interp.after(int(seconds * 1000), lambda: done.append(True))
+    while not done:
+        interp.tk.dooneevent()
+
+
+
+class FakeLabel():
+    '''Stands in for a Label so the queue can be exercised without a display.'''
+    def __init__(self):
+        self.value = None
+        self.sets = 0
+
+    def set(self, value):
+        self.value = value
+        self.sets += 1
+
+
+
+class TestUIQueue(unittest.TestCase):
+    def test_order_and_coalescing(self):
+        queue = tasks.UIQueue()
+        calls = []
+        label = FakeLabel()
+        queue.post(calls.append, 1)
+        for i in range(1000):
+            queue.post(label.set, i, coalesce=True)
+        queue.post(calls.append, 2)
+        self.assertEqual(len(queue), 3)
+        queue.drain(budget=1.0)
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual((label.value, label.sets), (999, 1))
+        self.assertEqual(queue.coalesced, 999)
+
+    def test_errors_do_not_stop_drain(self):
+        queue = tasks.UIQueue()
+        calls = []
+        queue.post(lambda: 1 / 0)
+        queue.post(calls.append, 'after error')
+        queue.drain()
+        self.assertEqual(calls, ['after error'])
+        self.assertEqual(queue.failed, 1)
+
+    def test_worker_flood_respects_budget(self):
+        '''A worker posting as fast as it can should not hold the Tk thread longer than the budget per drain.'''
+        queue = tasks.UIQueue()
+        labels = [FakeLabel() for _ in range(10)]
+        progress = FakeLabel()
+        def worker():
+            for i in range(100_000):
+                queue.post(labels[i % 10].set, i)
+                queue.post(progress.set, i, coalesce=True)
+        thread = threading.Thread(target=worker)
+        start = time.perf_counter()
+        thread.start()
+        drains = []
+        while thread.is_alive() or len(queue):
+            drain_start = time.perf_counter()
+            queue.drain(budget=0.008)
+            drains.append(time.perf_counter() - drain_start)
+            time.sleep(0.001)  # stands in for the Tk thread handling events between drains
+        elapsed = time.perf_counter() - start
+
+        print(f'\n100,000 posts (+100,000 coalesced) in {elapsed:.3f} s over {len(drains)} drains, longest drain {max(drains) * 1000:.1f} ms')
+        self.assertEqual(sum(label.sets for label in labels), 100_000)
+        self.assertEqual(progress.value, 99_999)
+        self.assertLess(progress.sets, 100_000)
+        self.assertLess(max(drains), 0.05)  # budget plus scheduling slack
+
+    def test_wakeup_only_when_idle(self):
+        '''wakeup fires once per burst of posts and not again until a drain empties the queue.'''
+        wakeups = []
+        queue = tasks.UIQueue(wakeup=lambda: wakeups.append(1))
+        label = FakeLabel()
+        for i in range(100):
+            queue.post(label.set, i, coalesce=i % 2 == 0)
+        self.assertEqual(len(wakeups), 1)
+        queue.drain(budget=1.0)
+        self.assertFalse(queue.armed)
+        queue.drain(budget=1.0)  # draining an empty queue doesn't wake anything
+        self.assertEqual(len(wakeups), 1)
+        queue.post(label.set, 'again')
+        self.assertEqual(len(wakeups), 2)
+
+    def test_no_lost_wakeup(self):
+        '''Posts racing a drain are either drained by it or trigger a new wakeup.'''
+        pending = threading.Event()
+        queue = tasks.UIQueue(wakeup=pending.set)
+        label = FakeLabel()
+        def worker():
+            for i in range(20_000):
+                queue.post(label.set, i)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while thread.is_alive() or len(queue):
+            if pending.wait(0.5):
+                pending.clear()
+                while queue.armed:  # what EasyGUI does with after(1, ...)
+                    queue.drain(budget=0.002)
+        self.assertEqual(label.sets, 20_000)
+
+
+
+
+class TestUIDrainer(unittest.TestCase):
+    def setUp(self):
+        self.interp = tk.Tcl()
+        self.queue = tasks.UIQueue()
+        self.drainer = tasks.UIDrainer(self.interp, self.queue, interval=5)
+        self.threads = []  # threads the posted calls ran on
+
+    def tearDown(self):
+        self.drainer.close()
+
+    def record(self, value):
+        self.threads.append(threading.get_ident())
+
+    def test_worker_posts_before_and_during_event_loop(self):
+        '''Posts from a worker only wake the Tk thread, which runs them, whether or not its event loop is running yet.'''
+        before = threading.Thread(target=lambda: [self.queue.post(self.record, i) for i in range(100)])
+        before.start()
+        before.join()  # all posted before any Tcl events are processed
+        def during():
+            for i in range(100):
+                self.queue.post(self.record, i)
+                time.sleep(0.001)
+        thread = threading.Thread(target=during)
+        thread.start()
+        run_tcl(self.interp, 0.4)
+        thread.join()
+        run_tcl(self.interp, 0.05)
+        self.assertEqual(len(self.threads), 200)
+        self.assertEqual(set(self.threads), {threading.get_ident()})
+
+    def test_no_drains_while_idle(self):
+        self.queue.post(self.record, 1)  # from the Tk thread
+        run_tcl(self.interp, 0.05)
+        self.assertEqual(len(self.threads), 1)
+        drains = self.drainer.drains
+        run_tcl(self.interp, 0.1)
+        self.assertEqual(self.drainer.drains, drains)  # nothing queued so nothing scheduled (pipe or polling mode)
+        self.assertFalse(self.queue.armed)
+
+    def test_close_stops_draining(self):
+        self.drainer.close()
+        threading.Thread(target=self.queue.post, args=(self.record, 1)).start()  # worker posting after the window closed
+        run_tcl(self.interp, 0.05)
+        self.assertEqual(self.threads, [])
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,54 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+import random
+import time
+
+
+
+class GUI(easy_gui.EasyGUI):
+    '''
+    Million row VirtualTable scrolled to random positions, timing each frame (render plus Tk redraw).
+    '''
+    def __init__(self):
+        self.data = [(i, f'item {i}', i * 0.5, 'x' * (i % 7)) for i in range(1_000_000)]
+        start = time.perf_counter()
+        self.table = self.add_widget('virtualtable', data=self.data, headers=['ID', 'Name', 'Value', 'Tag'], height=25)
+        self.build_time = time.perf_counter() - start
+        self.after(10, self.benchmark)
+
+    def benchmark(self):
+        self.update()
+        self.tk_objects_before = len(self.table._widget.winfo_children())
+        self.frame_times = []
+        for _ in range(300):
+            start = time.perf_counter()
+            self.table.scroll_to(random.randrange(len(self.data)))
+            self.update_idletasks()
+            self.frame_times.append(time.perf_counter() - start)
+        self.table.scroll_to(len(self.data))
+        self.last_row_text = [cell['text'] for cell in self.table.cells[-1]]
+        self.tk_objects_after = len(self.table._widget.winfo_children())
+        self.last_position = self.table.cell_position(self.table.cells[-1][1])
+        self.close()
+
+
+
+class TestVirtualTable(unittest.TestCase):
+    def test_million_rows(self):
+        gui = GUI()
+        frame_times = sorted(gui.frame_times)
+        print(f'\n1,000,000 row VirtualTable built in {gui.build_time:.3f} s; scroll frame times: '
+              f'median {frame_times[len(frame_times) // 2] * 1000:.2f} ms, worst {frame_times[-1] * 1000:.2f} ms')
+        self.assertEqual(gui.tk_objects_before, 4 + 25 * 4)  # header row plus 25 rows of cells
+        self.assertEqual(gui.tk_objects_after, gui.tk_objects_before)
+        self.assertEqual(gui.last_row_text, ['999999', 'item 999999', '499999.5', 'x' * (999999 % 7)])
+        self.assertEqual(gui.last_position, (999999, 1))
+        self.assertLess(frame_times[len(frame_times) // 2], 1 / 60)
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
@@ -0,0 +1,43 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import easy_gui
+
+
+
+class GUI(easy_gui.EasyGUI):
+    def __init__(self):
+        self.stress = self.add_section('stress')
+        for i in range(10000):
+            self.stress.add_widget('lbl', f'Label {i}')
+
+        self.small = self.add_section('small')
+        for i in range(3):
+            self.small.add_widget('btn', f'Button {i}')
+        self.after(10, self.replace_button)
+
+    def replace_button(self):
+        self.small.delete_widget('1_button')
+        self.replacement = self.small.add_widget('btn', 'Replacement')
+        self.close()
+
+
+
+class TestWidgetNames(unittest.TestCase):
+    def test_many_same_type_widgets(self):
+        gui = GUI()
+        self.assertEqual(len(gui.stress.widgets), 10000)
+        areas = [w.grid_area for w in gui.stress.widgets.values()]
+        self.assertEqual(len(set(areas)), 10000)
+        self.assertEqual(areas[:3], ['Label', 'Label1', 'Label2'])
+
+    def test_no_name_collision_after_delete(self):
+        gui = GUI()
+        self.assertEqual(len(gui.small.widgets), 3)
+        self.assertIn(gui.replacement, gui.small.widgets.values())
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)
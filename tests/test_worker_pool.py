@@ -0,0 +1,74 @@
+import unittest
+import sys
+sys.path.insert(1, '..')
+import threading
+import time
+from easy_gui import tasks
+
+
+
+class TestWorkerPool(unittest.TestCase):
+    def test_bounded_threads(self):
+        pool = tasks.WorkerPool(max_workers=3, max_queue=1000)
+        done = []
+        for i in range(500):  # like rapid clicking on a separate_thread button
+            pool.submit(done.append, i)
+        self.assertTrue(pool.join(timeout=5))
+        self.assertEqual(sorted(done), list(range(500)))
+        self.assertLessEqual(pool.stats()['workers'], 3)
+        self.assertEqual(pool.stats()['completed'], 500)
+
+    def test_full_queue_drops(self):
+        pool = tasks.WorkerPool(max_workers=1, max_queue=5)
+        gate = threading.Event()
+        pool.submit(gate.wait)
+        time.sleep(0.05)  # let the worker pick up the blocking task
+        accepted = [pool.submit(lambda: None, policy='queue', key=i) for i in range(10)]
+        self.assertEqual(accepted.count(True), 5)
+        self.assertEqual(pool.stats()['dropped'], 5)
+        self.assertEqual(pool.stats()['max_queue_depth'], 5)
+        gate.set()
+        self.assertTrue(pool.join(timeout=5))
+
+    def test_drop_and_coalesce(self):
+        pool = tasks.WorkerPool(max_workers=1)
+        gate = threading.Event()
+        pool.submit(gate.wait, key='busy')
+        time.sleep(0.05)
+        self.assertFalse(pool.submit(lambda: None, policy='drop', key='busy'))  # already running
+
+        results = []
+        for i in range(20):  # e.g. slider moves while the worker is busy
+            pool.submit(results.append, i, policy='coalesce', key='slider')
+        self.assertEqual(pool.queue_depth, 1)
+        gate.set()
+        self.assertTrue(pool.join(timeout=5))
+        self.assertEqual(results, [19])  # only the latest arguments ran
+        self.assertEqual(pool.stats()['coalesced'], 19)
+
+    def test_exceptions_are_captured(self):
+        pool = tasks.WorkerPool(max_workers=1)
+        def fail():
+            raise RuntimeError('boom')
+        pool.submit(fail)
+        pool.submit(lambda: None)
+        self.assertTrue(pool.join(timeout=5))
+        stats = pool.stats()
+        self.assertEqual((stats['failed'], stats['completed']), (1, 1))  # worker survived the exception
+        self.assertIsInstance(pool.errors[0][1], RuntimeError)
+
+    def test_wrap_ignores_event_arg(self):
+        pool = tasks.WorkerPool(max_workers=1)
+        calls = []
+        callback = pool.wrap(lambda: calls.append(True), policy='coalesce')
+        callback('event')
+        self.assertTrue(pool.join(timeout=5))
+        self.assertEqual(calls, [True])
+        with self.assertRaises(ValueError):
+            pool.submit(lambda: None, policy='latest')
+
+
+
+
+if __name__ == '__main__':
+    unittest.main() #buffer=True)